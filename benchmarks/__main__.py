@@ -0,0 +1,93 @@
+"""Runs the notification benchmarks and prints the results as JSON.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json slack_end_to_end
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks.suite import CASES, servers
+
+
+def measure(run, operations, repeat):
+    # One untimed round warms caches, pools and connections
+    run()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+    return {
+        'operations': operations,
+        'repeat': repeat,
+        'best': min(timings),
+        'median': median,
+        'per_operation_us': median / operations * 1000000,
+    }
+
+
+def compare(results, previous):
+    for name, result in sorted(results.items()):
+        if name not in previous:
+            continue
+        before = previous[name]['per_operation_us']
+        after = result['per_operation_us']
+        sys.stderr.write('{:<28} {:>12.2f}us -> {:>12.2f}us  {:+.1f}%\n'.format(
+            name, before, after, (after - before) / before * 100))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark notification building and dispatch.')
+    parser.add_argument('cases', nargs='*', help='Cases to run. Runs every case by default.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed rounds per case.')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiplies the amount of work per round.')
+    parser.add_argument('--output', help='Write the JSON results to this file instead of stdout.')
+    parser.add_argument('--compare', help='A previous JSON result to compare against.')
+    arguments = parser.parse_args(argv)
+
+    unknown = set(arguments.cases) - set(CASES)
+    if unknown:
+        parser.error('Unknown cases: {}'.format(', '.join(sorted(unknown))))
+
+    results = {}
+    stubs = servers()
+    for stub in stubs.values():
+        stub.start()
+
+    try:
+        for name in arguments.cases or sorted(CASES):
+            run, operations = CASES[name](arguments.scale, stubs)
+            results[name] = measure(run, operations, arguments.repeat)
+    finally:
+        for stub in stubs.values():
+            stub.stop()
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': arguments.scale,
+        'results': results,
+    }
+
+    if arguments.compare:
+        with open(arguments.compare) as previous:
+            compare(results, json.load(previous)['results'])
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output:
+            json.dump(report, output, indent=4, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=4, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
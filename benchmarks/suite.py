@@ -0,0 +1,166 @@
+"""Benchmark cases for building and dispatching notifications.
+
+Every case returns a callable that runs one round of the benchmark and the amount of
+operations that round performs. Network cases run against the in process stub servers
+from notifications.testing so results do not depend on Slack or a real SMTP relay.
+"""
+
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.testing import SlackStubServer, SmtpSinkServer
+from notifications.transports import MailSession, SlackScheduler, SlackTransport
+
+
+class NoopNotification(Notifiable):
+
+    def ping(self):
+        pass
+
+    def fire_ping(self):
+        pass
+
+    def pong(self):
+        pass
+
+    def fire_pong(self):
+        pass
+
+    def noop(self):
+        pass
+
+    def fire_noop(self):
+        pass
+
+
+class ReportNotification(Notifiable):
+
+    lines = 200
+
+    def mail(self):
+        self.subject('Daily report') \
+            .heading('Daily report') \
+            .panel('Everything is green')
+        for number in range(self.lines):
+            self.line('Row {}'.format(number))
+        self.action('Open dashboard', href='https://example.com')
+
+
+class SlackNotification(Notifiable):
+
+    def slack(self):
+        return self.token('benchmark') \
+            .text('Build 1234 failed') \
+            .channel('C1') \
+            .as_user('Build Bot') \
+            .icon(':fire:')
+
+
+class SmtpNotification(Notifiable):
+
+    def mail(self):
+        self.subject('Benchmark') \
+            .driver('smtp') \
+            .line('Sent to the local SMTP sink')
+
+
+def create_app():
+    app = App()
+    app.bind('View', View(app).render)
+    return app
+
+
+def unlimited_scheduler(transport):
+    """Creates a scheduler that never waits so only transport cost is measured."""
+    scheduler = SlackScheduler(transport, channel_rate=10 ** 9, channel_burst=10 ** 9)
+    scheduler.TIERS = dict.fromkeys(SlackScheduler.TIERS, 10 ** 9)
+    return scheduler
+
+
+def dispatch_overhead(scale):
+    """Notify overhead for N notification classes times M no-op channels."""
+    app = create_app()
+    notify = Notify(app).via('ping', 'pong', 'noop')
+    notifications = [type('Noop{}'.format(number), (NoopNotification,), {}) for number in range(int(20 * scale) or 1)]
+
+    return lambda: notify.send(*notifications), len(notifications) * 3
+
+
+def mail_body_building(scale):
+    """Building a mail body out of many snippets."""
+    app = create_app()
+    ReportNotification.lines = int(200 * scale) or 1
+
+    def run():
+        notification = ReportNotification(app)
+        notification.mail()
+        # Bodies render when first read
+        return notification.template
+
+    return run, ReportNotification.lines + 3
+
+
+def slack_payload(scale):
+    """Building the Slack payload of a message."""
+    app = create_app()
+    operations = int(1000 * scale) or 1
+
+    def run():
+        for _ in range(operations):
+            SlackNotification(app).slack()._slack_request()
+
+    return run, operations
+
+
+def slack_end_to_end(scale, server):
+    """Sending Slack messages to a stub Slack server through the pooled transport."""
+    app = create_app()
+    transport = SlackTransport(base_url=server.url)
+    app.bind('SlackTransport', transport)
+    app.bind('SlackScheduler', unlimited_scheduler(transport))
+    notify = Notify(app).via('slack')
+    notifications = [SlackNotification] * (int(50 * scale) or 1)
+
+    return lambda: notify.send(*notifications), len(notifications)
+
+
+def mail_end_to_end(scale, server, batch):
+    """Sending emails to a local SMTP sink, either over one connection or one per email."""
+    app = create_app()
+
+    class MailConfig:
+        DRIVER = 'smtp'
+        FROM = {'address': 'bench@example.com', 'name': 'Benchmark'}
+        DRIVERS = {'smtp': {'host': '127.0.0.1', 'port': server.port, 'username': '', 'password': ''}}
+
+    app.bind('MailConfig', MailConfig)
+    notify = Notify(app)
+    operations = int(50 * scale) or 1
+
+    def run():
+        if batch:
+            with notify.batch():
+                for _ in range(operations):
+                    notify.mail(SmtpNotification, to='user@example.com')
+        else:
+            for _ in range(operations):
+                with MailSession(app) as session:
+                    notification = SmtpNotification(app)
+                    notification.mail()
+                    session.send('smtp', 'user@example.com', notification._subject, notification.template)
+
+    return run, operations
+
+
+CASES = {
+    'dispatch_overhead': lambda scale, servers: dispatch_overhead(scale),
+    'mail_body_building': lambda scale, servers: mail_body_building(scale),
+    'slack_payload': lambda scale, servers: slack_payload(scale),
+    'slack_end_to_end': lambda scale, servers: slack_end_to_end(scale, servers['slack']),
+    'mail_end_to_end_batched': lambda scale, servers: mail_end_to_end(scale, servers['smtp'], batch=True),
+    'mail_end_to_end_unbatched': lambda scale, servers: mail_end_to_end(scale, servers['smtp'], batch=False),
+}
+
+
+def servers():
+    return {'slack': SlackStubServer(), 'smtp': SmtpSinkServer()}
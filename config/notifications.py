@@ -0,0 +1,106 @@
+SLACK = {
+    'base_url': 'https://slack.com/api',
+    'pool_size': 10,
+    'timeout': 10,
+    'retries': 3,
+    'max_retries': 3,
+    'channel_rate': 1,
+    'channel_burst': 3,
+    # Rate limit buckets kept per method and per channel or webhook
+    'bucket_cache_size': 1024,
+    'channel_cache_ttl': 300,
+    'channel_cache_size': 128,
+    'warm_tokens': [],
+    # Incoming webhooks per channel such as {'#alerts': 'https://hooks.slack.com/services/...'}.
+    # Messages to these channels skip the token and channel lookup.
+    'webhooks': {},
+    # Seconds messages to the same webhook are collected into one message, 0 to post each on its own
+    'webhook_window': 0.5,
+}
+
+DISPATCH = {
+    'concurrency': 10,
+    # Extra channels as {'sms': 'app.channels.SmsComponent'}. Installed packages can
+    # also add channels through the masonite_notifications.channels entry point group.
+    'channels': {},
+}
+
+BREAKER = {
+    # Shed notifications to an endpoint while too many of its recent sends failed
+    'enabled': False,
+    'threshold': 0.5,
+    'minimum': 10,
+    'window': 30,
+    'cooldown': 30,
+    'probes': 1,
+    # Either drop, queue or spool, or a dictionary of them per channel such as
+    # {'mail': 'queue', 'slack': 'spool'}. Spooled notifications are written to the
+    # outbox and delivered by craft notification:outbox.
+    'fallback': 'drop',
+}
+
+DATABASE = {
+    # Where the database channel stores notifications for in-app display. Set connection to
+    # an Orator connection such as 'default' to use the application database, otherwise
+    # they are stored in the SQLite file at path.
+    'connection': None,
+    'path': 'storage/notifications.sqlite3',
+    'table': 'notifications',
+}
+
+DEDUPE = {
+    # Either memory or sqlite. Use sqlite to share keys between processes.
+    'store': 'memory',
+    'path': 'storage/notifications.sqlite3',
+    'ttl': 86400,
+    'size': 10000,
+}
+
+DIGEST = {
+    'window': 60,
+    'size': 50,
+}
+
+MAIL = {
+    'snippet_cache_size': 32,
+}
+
+OUTBOX = {
+    # Write notifications to the outbox and deliver them with craft notification:outbox
+    'enabled': False,
+    'path': 'storage/notifications.sqlite3',
+    'lease': 60,
+    'batch_size': 100,
+    'max_attempts': 5,
+    'backoff': 2,
+}
+
+PRIORITY = {
+    # Parallel sends run on a shared pool split into lanes. A notification picks its
+    # lane with the _priority class attribute or the priority option of send.
+    'lanes': {
+        'urgent': {'weight': 8, 'concurrency': 8, 'size': 1000},
+        'default': {'weight': 4, 'concurrency': 4, 'size': 5000},
+        'bulk': {'weight': 1, 'concurrency': 2, 'size': 10000},
+    },
+    # The size of the shared pool, None for the sum of the lane concurrencies
+    'workers': None,
+    # Queue channels for emails that should be queued such as {'urgent': 'notifications-urgent'}
+    'queues': {},
+}
+
+SCHEDULE = {
+    # Notifications sent with delay or at are stored here until craft notification:schedule sends them
+    'path': 'storage/notifications.sqlite3',
+    'lease': 60,
+    'batch_size': 100,
+    'max_attempts': 5,
+    'backoff': 2,
+}
+
+QUEUE = {
+    'chunk_size': 500,
+    'compress_over': 4096,
+    # Emails of a batch job that fail are pushed back to the queue until tried this many times
+    'max_attempts': 3,
+}
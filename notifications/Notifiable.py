@@ -1,13 +1,19 @@
 """Notifiable Class."""
 
-from notifications.components import MailComponent, SlackComponent
+from notifications.components import DatabaseComponent, DigestComponent, MailComponent, SlackComponent
 
 
-class Notifiable(MailComponent, SlackComponent):
+class Notifiable(MailComponent, SlackComponent, DatabaseComponent, DigestComponent):
     """Notifiable class used as a base class to make a class a notifiable object.
 
     Arguments:
         MailComponent {notifications.comonents.MailComponent}
         SlackComponent {notifications.comonents.SlackComponent}
+        DatabaseComponent {notifications.comonents.DatabaseComponent}
+        DigestComponent {notifications.comonents.DigestComponent}
     """
-    pass
+
+    # The dispatch lane such as urgent, default or bulk. Emails that should be queued
+    # are pushed to the queue channel configured for the lane.
+    _priority = 'default'
+
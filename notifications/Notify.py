@@ -1,16 +1,36 @@
 """Notify Class."""
 
-import json
-import os
+import copy
+import datetime
+import hashlib
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 
-import requests
 from masonite.app import App
+from notifications.components import DatabaseComponent
+from notifications.dispatch import Coalescer, DispatchPlan, DispatchReport, DispatchResult
 from notifications.exceptions import InvalidNotificationType
+from notifications.settings import setting
 
 
 class Notify:
 
     called_notifications = []
+    report = None
+    _via = ()
+    _outbox = None
+
+    _default_outbox = None
+    _default_schedule = None
+    _default_coalescer = Coalescer()
+    _default_dedupe_store = None
+
+    # The sends of each thread whose rows wait in the buffer of an open transaction
+    _pending = threading.local()
+
+    # Channels whose shed notifications can be written to the outbox spool
+    _spool_channels = ('mail', 'slack')
 
     def __init__(self, container: App):
         """Notify constructor.
@@ -19,6 +39,11 @@ class Notify:
             container {masonite.app.App} -- Masonite app container.
         """
         self.app = container
+        # The batch each thread is in, so one bound Notify can be shared by threads
+        self._batches = threading.local()
+        self._concurrency = setting('dispatch', 'concurrency', 10)
+        if setting('outbox', 'enabled', False):
+            self.outbox()
 
     def __getattr__(self, name):
         """Special method that will be used to call the same method on the notifiable class.
@@ -34,50 +59,859 @@ class Notify:
         """
         self.called_notifications = []
 
-        def method(*notifications, **options):
+        def method(*notifications, idempotency_key=None, delay=None, at=None, tz=None, schedule_key=None, **options):
+            members = self._members(options)
+            due_at = self._due_at(delay, at, tz)
             for obj in notifications:
-                notification = obj(self.app)
-                self.called_notifications.append(notification)
+                if due_at is not None:
+                    self._schedule(name, obj, members, due_at, schedule_key, idempotency_key)
+                else:
+                    self._dispatch(name, obj, members, idempotency_key=idempotency_key)
+
+        return method
 
-                # Set all keyword arguments as protected members
-                for key, value in options.items():
-                    setattr(notification, '_{}'.format(key), value)
+    @property
+    def _mail_session(self):
+        return getattr(self._batches, 'mail_session', None)
 
-                # Call the method on the notifcation class
-                self.app.resolve(
-                    getattr(notification, name)
-                )
+    @property
+    def _job_buffer(self):
+        return getattr(self._batches, 'job_buffer', None)
 
-                # Resolve the fire method inherited from the component
-                notification = self.app.resolve(
-                    getattr(notification, 'fire_{}'.format(name))
-                )
+    def _members(self, options):
+        """Turns keyword arguments into the protected members to set on each notification.
 
-        return method
+        Arguments:
+            options {dict} -- The keyword arguments.
+
+        Returns:
+            list -- Pairs of member names and values.
+        """
+        return [('_{}'.format(key), value) for key, value in options.items()]
+
+    def _build(self, via, obj, members, record=True):
+        """Creates a notification, sets the options on it and calls its channel method.
+
+        Arguments:
+            via {string} -- The channel such as mail or slack.
+            obj {class} -- The notification class.
+            members {list} -- Protected members to set from the _members method.
+
+        Keyword Arguments:
+            record {bool} -- Whether to append it to the called notifications. (default: {True})
+
+        Returns:
+            object -- The notification.
+        """
+        plan = DispatchPlan.get(obj, via)
+        notification = plan.composed(self.app)
+        if record:
+            self.called_notifications.append(notification)
+
+        if self._mail_session is not None:
+            notification._mail_session = self._mail_session
+            notification._job_buffer = self._job_buffer
+
+        if self._outbox is not None:
+            notification._outbox = self._outbox
+
+        # Set all keyword arguments as protected members
+        for name, value in members:
+            setattr(notification, name, value)
+
+        # Call the method on the notifcation class
+        plan.call(self.app, notification, plan.build)
+
+        return notification
+
+    def _dispatch(self, via, obj, members, record=True, idempotency_key=None):
+        """Builds a notification and fires it through the channel.
+
+        A notification whose idempotency key was already claimed is skipped before it is built.
+
+        Returns:
+            notifications.dispatch.DispatchResult
+        """
+        metrics = self._metrics()
+        if metrics:
+            metrics.start(via, obj)
+
+        dispatch = DispatchResult(via, obj)
+        key = self._idempotency_key(idempotency_key, via, obj, members)
+        if key is not None and not self._dedupe_store().claim(key):
+            dispatch.duplicate = True
+            if metrics:
+                metrics.record(dispatch)
+            return dispatch
+
+        marks = self._marks()
+        started = time.perf_counter()
+        try:
+            dispatch.notification = self._build(via, obj, members, record)
+            built = time.perf_counter()
+            dispatch.build_time = built - started
+
+            # Call the fire method inherited from the component
+            try:
+                self._send(via, obj, dispatch.notification, dispatch)
+            finally:
+                dispatch.transport_time = time.perf_counter() - built
+        except Exception as e:
+            dispatch.exception = e
+            self._discard(marks)
+            # Let a retry send it again
+            if key is not None:
+                self._dedupe_store().forget(key)
+            raise
+        finally:
+            if metrics:
+                dispatch.when_settled(metrics.record)
+
+        self._forget_undelivered(dispatch, key)
+        self._buffered(dispatch, key, marks)
+        return dispatch
+
+    def _fire(self, via, obj, notification):
+        """Fires an already built notification through the channel.
+
+        Returns:
+            notifications.dispatch.DispatchResult
+        """
+        metrics = self._metrics()
+        if metrics:
+            metrics.start(via, obj)
+
+        dispatch = DispatchResult(via, obj, notification)
+        started = time.perf_counter()
+        try:
+            self._send(via, obj, notification, dispatch)
+        except Exception as e:
+            dispatch.exception = e
+            raise
+        finally:
+            dispatch.transport_time = time.perf_counter() - started
+            if metrics:
+                dispatch.when_settled(metrics.record)
+
+        return dispatch
+
+    def _send(self, via, obj, notification, dispatch):
+        """Fires a built notification or buffers it when it asked for a digest.
+
+        Digests are fired later through the _fire method once their buffer is full or
+        their window closes. When circuit breakers are bound, the outcome of every fire is
+        recorded on the breaker of its endpoint and notifications to an open endpoint are shed.
+
+        The result is set on the dispatch as well as returned.
+
+        Returns:
+            any -- Whatever the channel's fire method or the coalescer returned.
+        """
+        if getattr(notification, '_digest', False):
+            dispatch.coalesced = True
+            dispatch.result = self._coalescer().add(via, notification, self._fire)
+            return dispatch.result
+
+        breaker = self._breaker(via, notification)
+        if breaker is not None and not breaker.allow():
+            dispatch.result = self._shed(via, obj, notification, dispatch)
+            return dispatch.result
+
+        plan = DispatchPlan.get(obj, via)
+        try:
+            result = plan.call(self.app, notification, plan.fire)
+        except Exception:
+            if breaker is not None:
+                breaker.record(False)
+            raise
+
+        dispatch.result = result
+        self._settle(dispatch, breaker)
+
+        return result
+
+    def _settle(self, dispatch, breaker):
+        """Records the outcome of a fire on its circuit breaker once the outcome is known.
+
+        Webhook posts return a future that resolves when their window is posted. The
+        dispatch result is replaced with the outcome of the future before it is recorded.
+
+        Arguments:
+            dispatch {notifications.dispatch.DispatchResult} -- The result of the fire.
+            breaker {notifications.dispatch.CircuitBreaker|None} -- The breaker of the endpoint.
+        """
+        def settled(dispatch):
+            if breaker is not None:
+                breaker.record(dispatch.exception is None and not getattr(dispatch.result, 'unavailable', False))
+
+        dispatch.when_settled(settled)
+
+    def _forget_undelivered(self, dispatch, key):
+        """Forgets the idempotency key of a send that turns out not to be delivered so a retry sends it.
+
+        Sends that fail without raising, such as a Slack response that is not ok, a dropped
+        send or a webhook batch that fails later, release their key once their outcome is known.
+
+        Arguments:
+            dispatch {notifications.dispatch.DispatchResult} -- The result of the send.
+            key {string|None} -- The claimed idempotency key.
+        """
+        if key is None:
+            return
+
+        def settled(dispatch):
+            if not dispatch.delivered:
+                self._dedupe_store().forget(key)
+
+        dispatch.when_settled(settled)
+
+    def _breaker(self, via, notification):
+        """Gets the circuit breaker of the endpoint a notification is fired to.
+
+        Returns:
+            notifications.dispatch.CircuitBreaker|None -- None when no breakers are bound
+                                                          or firing does not leave the process.
+        """
+        breakers = self._breakers()
+        if breakers is None:
+            return None
+
+        endpoint = notification._endpoint(via)
+        if endpoint is None:
+            return None
+
+        return breakers.get(via, endpoint)
+
+    def _shed(self, via, obj, notification, dispatch):
+        """Handles a notification refused by an open circuit breaker without touching the network.
+
+        The queue fallback pushes emails to the queue. Channels that can not be queued are
+        written to the outbox spool instead, and channels the outbox can not deliver are dropped.
+        A dropped notification is not delivered, so its idempotency key is released once the
+        send settles and a retry sends it.
+
+        Returns:
+            any -- Whatever the channel's fire method returned, None when dropped.
+        """
+        fallback = self._breakers().fallback(via)
+
+        if fallback == 'queue' and via == 'mail':
+            notification._queued = True
+        elif fallback in ('queue', 'spool') and via in self._spool_channels:
+            fallback = 'spool'
+            notification._outbox = self._outbox_store()
+        else:
+            dispatch.shed = 'drop'
+            return None
+
+        dispatch.shed = fallback
+        plan = DispatchPlan.get(obj, via)
+        return plan.call(self.app, notification, plan.fire)
+
+    def _breakers(self):
+        """Gets the circuit breakers if the container has them.
+
+        Returns:
+            notifications.dispatch.CircuitBreakers|None
+        """
+        if self.app.has('NotificationBreakers'):
+            return self.app.make('NotificationBreakers')
+
+    def _coalescer(self):
+        """Gets the coalescer from the container or the default coalescer.
+
+        Returns:
+            notifications.dispatch.Coalescer
+        """
+        if self.app.has('NotificationCoalescer'):
+            return self.app.make('NotificationCoalescer')
+
+        return Notify._default_coalescer
+
+    def flush_digests(self):
+        """Fires every digest that is still waiting for its window to close.
+
+        Returns:
+            list -- The DispatchResult of each digest.
+        """
+        return self._coalescer().flush()
+
+    def _idempotency_key(self, idempotency_key, via, obj, members, recipient=None):
+        """Gets the key a notification and channel pair is deduplicated by.
+
+        Arguments:
+            idempotency_key {string|bool|None} -- The key given to the send. True derives the key
+                                                  from the options such as the recipient and payload.
+            via {string} -- The channel such as mail or slack.
+            obj {class} -- The notification class.
+            members {list} -- Protected members from the _members method.
+
+        Keyword Arguments:
+            recipient {list} -- Protected members of one recipient of send_many. (default: {None})
+
+        Returns:
+            string|None -- None when the send is not deduplicated.
+        """
+        if not idempotency_key:
+            return None
+
+        if idempotency_key is True:
+            idempotency_key = self._hash(members + (recipient or []))
+        elif recipient:
+            # Every recipient of a shared key needs a key of its own
+            idempotency_key = '{}:{}'.format(idempotency_key, self._hash(recipient))
+
+        return '{}:{}.{}:{}'.format(via, obj.__module__, obj.__name__, idempotency_key)
+
+    def _hash(self, members):
+        return hashlib.sha256(repr(sorted(members)).encode('utf-8')).hexdigest()
+
+    def _dedupe_store(self):
+        """Gets the dedupe store from the container or the default in memory store.
+
+        Returns:
+            notifications.cache.DedupeStore
+        """
+        if self.app.has('NotificationDedupeStore'):
+            return self.app.make('NotificationDedupeStore')
+
+        if Notify._default_dedupe_store is None:
+            from notifications.cache.DedupeStore import DedupeStore
+            Notify._default_dedupe_store = DedupeStore()
+
+        return Notify._default_dedupe_store
+
+    def _metrics(self):
+        """Gets the dispatch metrics if the container has them.
+
+        Returns:
+            notifications.dispatch.DispatchMetrics|None
+        """
+        if self.app.has('NotificationMetrics'):
+            return self.app.make('NotificationMetrics')
 
     def via(self, *methods):
         self._via = methods
         return self
 
-    def send(self, *notifications, **options):
+    @contextmanager
+    def batch(self, retries=1, chunk_size=None):
+        """Reuses one mail connection for every email sent inside the with block.
+
+        The connection is opened on the first email, reopened if it drops and closed
+        when the block ends. Queued emails are buffered and pushed to the queue in chunks,
+        the last chunk when the block ends. Rows for the outbox and the database channel
+        are inserted in one transaction when the block ends.
+
+        The batch belongs to the thread that opened it. Other threads sending through the
+        same Notify meanwhile are not part of it.
+
+        Keyword Arguments:
+            retries {int} -- How many times to reconnect when the connection drops. (default: {1})
+            chunk_size {int} -- The amount of queued emails per queue job. (default: {None})
+
+        Returns:
+            notifications.transports.MailSession
+        """
+        from notifications.jobs import JobBuffer
+        from notifications.transports import MailSession
+
+        session = MailSession(self.app, retries=retries)
+        self._batches.mail_session = session
+        self._batches.job_buffer = JobBuffer(
+            self.app, chunk_size or setting('queue', 'chunk_size', 500))
+        try:
+            with session, self._transaction():
+                yield session
+            self._job_buffer.flush()
+        finally:
+            self._batches.mail_session = None
+            self._batches.job_buffer = None
+
+    def outbox(self, outbox=None):
+        """Writes notifications to the outbox instead of sending them.
+
+        Notifications are rendered as usual and their payload is stored until the
+        notification:outbox command delivers it, so sending returns without network I/O.
+
+        Keyword Arguments:
+            outbox {notifications.outbox.Outbox} -- The outbox to write to. Defaults to the
+                                                    NotificationOutbox binding. (default: {None})
+
+        Returns:
+            self
+        """
+        self._outbox = self._outbox_store() if outbox is None else outbox
+        return self
+
+    def _outbox_store(self):
+        """Gets the outbox from the container or opens the one configured in the settings.
+
+        Returns:
+            notifications.outbox.Outbox
+        """
+        if self.app.has('NotificationOutbox'):
+            return self.app.make('NotificationOutbox')
+
+        if Notify._default_outbox is None:
+            from notifications.outbox import Outbox
+
+            Notify._default_outbox = Outbox(
+                setting('outbox', 'path', 'storage/notifications.sqlite3'),
+                lease=setting('outbox', 'lease', 60))
+
+        return Notify._default_outbox
+
+    @contextmanager
+    def _transaction(self):
+        """Writes every row added to the outbox or the database channel inside the with block at once.
+
+        Rows of sends that finished are written even when a later send raises, since those
+        sends are reported as sent. When writing rows fails, the sends that added them are
+        marked failed and their idempotency keys are released.
+        """
+        with ExitStack() as stack:
+            if self._outbox is not None:
+                stack.enter_context(self._outbox.transaction())
+            stack.enter_context(DatabaseComponent.batch())
+
+            if getattr(Notify._pending, 'sends', None) is not None:
+                yield
+                return
+
+            Notify._pending.sends = []
+            try:
+                yield
+            finally:
+                try:
+                    self._flush()
+                finally:
+                    Notify._pending.sends = None
+
+    def _buffers(self):
+        """Gets the stores that buffer rows of this thread in an open transaction.
+
+        Returns:
+            list
+        """
+        stores = DatabaseComponent.joined()
+        if self._outbox is not None:
+            stores.append(self._outbox)
+
+        return stores
+
+    def _marks(self):
+        return {store: store.buffered() for store in self._buffers()}
+
+    def _discard(self, marks):
+        """Drops the rows a failed send added to the buffers since the marks were taken."""
+        for store in self._buffers():
+            store.discard(marks.get(store, 0))
+
+    def _buffered(self, dispatch, key, marks):
+        """Remembers a send whose rows wait in a buffer and flushes full buffers.
+
+        Arguments:
+            dispatch {notifications.dispatch.DispatchResult} -- The result of the send.
+            key {string|None} -- The claimed idempotency key.
+            marks {dict} -- The buffer sizes taken before the send.
+        """
+        sends = getattr(Notify._pending, 'sends', None)
+        if sends is None:
+            return
+
+        buffers = self._buffers()
+        if not any(store.buffered() > marks.get(store, 0) for store in buffers):
+            return
+
+        sends.append((dispatch, key))
+        if any(store.buffered() >= store.CHUNK_SIZE for store in buffers):
+            self._flush()
+
+    def _flush(self):
+        """Writes the buffered rows, failing the sends that added them when that raises."""
+        sends, Notify._pending.sends = Notify._pending.sends, []
+        try:
+            for store in self._buffers():
+                store.flush()
+        except Exception as e:
+            for dispatch, key in sends:
+                dispatch.exception = e
+                if key is not None:
+                    self._dedupe_store().forget(key)
+            raise
+
+    def _schedule(self, via, obj, members, due_at, schedule_key=None, idempotency_key=None):
+        """Stores a notification to send through a channel later.
+
+        Returns:
+            notifications.dispatch.DispatchResult
+        """
+        self._schedule_store().add(
+            due_at, via, '{}.{}'.format(obj.__module__, obj.__qualname__),
+            {'members': members, 'idempotency_key': idempotency_key}, key=schedule_key)
+
+        dispatch = DispatchResult(via, obj)
+        dispatch.scheduled = due_at
+        metrics = self._metrics()
+        if metrics:
+            metrics.record(dispatch)
+
+        return dispatch
+
+    def _due_at(self, delay=None, at=None, tz=None):
+        """Turns the delay or moment of a send into a UNIX timestamp.
+
+        Keyword Arguments:
+            delay {int|float|timedelta} -- Seconds from now. (default: {None})
+            at {datetime|time|float} -- A datetime, the next occurrence of a time of day
+                                        or a UNIX timestamp. (default: {None})
+            tz {tzinfo} -- The timezone of an at without one. (default: {None})
+
+        Returns:
+            float|None -- None when the send is not scheduled.
+        """
+        if at is None:
+            if delay is None:
+                return None
+            if isinstance(delay, datetime.timedelta):
+                delay = delay.total_seconds()
+            return time.time() + delay
+
+        if isinstance(at, (int, float)):
+            return float(at)
+
+        if isinstance(at, datetime.time):
+            tz = tz or at.tzinfo
+            today = datetime.datetime.now(tz).date()
+            moment = self._localize(datetime.datetime.combine(today, at.replace(tzinfo=None)), tz)
+            if moment.timestamp() <= time.time():
+                tomorrow = today + datetime.timedelta(days=1)
+                moment = self._localize(datetime.datetime.combine(tomorrow, at.replace(tzinfo=None)), tz)
+            return moment.timestamp()
+
+        if at.tzinfo is None:
+            at = self._localize(at, tz)
+
+        return at.timestamp()
+
+    def _localize(self, moment, tz):
+        if tz is None:
+            return moment
+
+        # pytz timezones need localize to pick the right offset
+        if hasattr(tz, 'localize'):
+            return tz.localize(moment)
+
+        return moment.replace(tzinfo=tz)
+
+    def cancel(self, schedule_key):
+        """Cancels every pending notification scheduled with a key.
+
+        Arguments:
+            schedule_key {string} -- The schedule_key given to the send.
+
+        Returns:
+            int -- The amount of cancelled notification and channel pairs.
+        """
+        return self._schedule_store().cancel(schedule_key)
+
+    def _schedule_store(self):
+        """Gets the schedule from the container or opens the one configured in the settings.
+
+        Returns:
+            notifications.schedule.Schedule
+        """
+        if self.app.has('NotificationSchedule'):
+            return self.app.make('NotificationSchedule')
+
+        if Notify._default_schedule is None:
+            from notifications.schedule import Schedule
+
+            Notify._default_schedule = Schedule(
+                setting('schedule', 'path', 'storage/notifications.sqlite3'),
+                lease=setting('schedule', 'lease', 60))
+
+        return Notify._default_schedule
+
+    def limit(self, concurrency):
+        """Sets how many notifications may be in flight at once with send_async or a parallel send.
+
+        Arguments:
+            concurrency {int} -- The maximum amount of concurrent sends.
+
+        Returns:
+            self
+        """
+        self._concurrency = concurrency
+        return self
+
+    def send(self, *notifications, parallel=False, max_workers=None, idempotency_key=None, priority=None,
+             delay=None, at=None, tz=None, schedule_key=None, **options):
+        """Sends the notifications through every channel set with the via method.
+
+        Every notification and channel pair is recorded in a DispatchReport available on
+        the report attribute.
+
+        Keyword Arguments:
+            parallel {bool} -- Whether to send on a thread pool. Exceptions are then collected in
+                               the report instead of being raised. When the container has a
+                               NotificationLanes binding the pairs run in the lane of their
+                               priority instead. (default: {False})
+            max_workers {int} -- The size of the thread pool. Defaults to the concurrency
+                                 set with the limit method. (default: {None})
+            idempotency_key {string|bool} -- Skips every notification and channel pair already sent
+                                             with this key. True derives the key from the options. (default: {None})
+            priority {string} -- The lane such as urgent or bulk. Defaults to the _priority
+                                 attribute of each notification class. (default: {None})
+            delay {int|float|timedelta} -- Sends the notifications after this many seconds. (default: {None})
+            at {datetime|time|float} -- Sends the notifications at this moment. A time is the next
+                                        time of day it is in the tz timezone. (default: {None})
+            tz {tzinfo} -- The timezone of an at without one, such as the timezone of the
+                           recipient. Defaults to the local time of the server. (default: {None})
+            schedule_key {string} -- The key to cancel the scheduled notifications by. (default: {None})
+
+        Scheduled notifications are stored with their options, which must be JSON serializable,
+        and sent by the notification:schedule command.
+
+        Returns:
+            self
+        """
         self.called_notifications = []
-        for via in self._via:
-            for obj in notifications:
-                notification = obj(self.app)
-                self.called_notifications.append(notification)
-
-                # Set all keyword arguments as protected members
-                for key, value in options.items():
-                    setattr(notification, '_{}'.format(key), value)
-
-                # Call the method on the notifcation class
-                self.app.resolve(
-                    getattr(notification, via)
-                )
-
-                # Resolve the fire method inherited from the component
-                notification = self.app.resolve(
-                    getattr(notification, 'fire_{}'.format(via))
-                )
+        self.report = DispatchReport()
+        if priority is not None:
+            options['priority'] = priority
+        members = self._members(options)
+        pairs = [(via, obj) for via in self._via for obj in notifications]
+
+        due_at = self._due_at(delay, at, tz)
+        if due_at is not None:
+            with self._schedule_store().transaction():
+                for via, obj in pairs:
+                    self.report.append(self._schedule(via, obj, members, due_at, schedule_key, idempotency_key))
+
+            return self
+
+        if not parallel:
+            with self._transaction():
+                for via, obj in pairs:
+                    try:
+                        self.report.append(self._dispatch(via, obj, members, idempotency_key=idempotency_key))
+                    except Exception as e:
+                        self.report.add(via, obj, exception=e)
+                        raise
+
+            return self
+
+        def dispatch(via, obj):
+            try:
+                return self._dispatch(via, obj, members, record=False, idempotency_key=idempotency_key)
+            except Exception as e:
+                return DispatchResult(via, obj, exception=e)
+
+        lanes = self._lanes()
+        if lanes is not None and max_workers is None:
+            futures = [
+                lanes.submit(priority or getattr(obj, '_priority', None), dispatch, via, obj) for via, obj in pairs
+            ]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers or self._concurrency) as executor:
+                futures = [executor.submit(dispatch, via, obj) for via, obj in pairs]
+
+        for future in futures:
+            result = self.report.append(future.result())
+            if result.notification is not None:
+                self.called_notifications.append(result.notification)
+
+        return self
+
+    def _lanes(self):
+        """Gets the lane dispatcher if the container has one.
+
+        Returns:
+            notifications.dispatch.LaneDispatcher|None
+        """
+        if self.app.has('NotificationLanes'):
+            return self.app.make('NotificationLanes')
+
+    def send_many(self, notification, recipients, idempotency_key=None, delay=None, at=None, tz=None,
+                  schedule_key=None, **options):
+        """Sends one notification class to many recipients through every channel set with the via method.
+
+        The notification is built once per channel. Every recipient then gets a shallow copy of
+        the built notification with its own fields set, so templates are rendered once instead
+        of once per recipient. Recipients are consumed lazily and only once so a generator can
+        stream them from the database.
+
+        Arguments:
+            notification {class} -- The notification class.
+            recipients {iterable} -- Email addresses or dictionaries of protected members to set
+                                     per recipient such as {'to': 'user@email.com', 'name': 'Joe'}.
+                                     Members such as channel also change the Slack message.
+
+        Keyword Arguments:
+            idempotency_key {string|bool} -- Skips every recipient already sent to with this key.
+                                             True derives the key from the options. (default: {None})
+            delay {int|float|timedelta} -- Sends the notifications after this many seconds. (default: {None})
+            at {datetime|time|float} -- Sends the notifications at this moment. (default: {None})
+            tz {tzinfo} -- The timezone of an at without one. (default: {None})
+
+        Queued emails are pushed to the queue in chunks instead of one job per recipient.
+        Scheduled sends store one notification per recipient and channel, built when it is due.
+        They can not be given a schedule_key since a key holds one notification per channel.
+
+        Raises:
+            TypeError -- When a schedule_key is given.
+
+        Returns:
+            self
+        """
+        if schedule_key is not None:
+            raise TypeError('send_many does not take a schedule_key, every recipient would replace the last')
+
+        due_at = self._due_at(delay, at, tz)
+        if due_at is not None:
+            self.called_notifications = []
+            members = self._members(options)
+            with self._schedule_store().transaction():
+                for recipient in recipients:
+                    fields = self._members(recipient if isinstance(recipient, dict) else {'to': recipient})
+                    key = idempotency_key
+                    if key and key is not True:
+                        # The same key the recipient gets when sent right away
+                        key = '{}:{}'.format(key, self._hash(fields))
+                    for via in self._via:
+                        self._schedule(via, notification, members + fields, due_at, idempotency_key=key)
+
+            return self
+
+        if self._job_buffer is None:
+            with self.batch():
+                return self.send_many(notification, recipients, idempotency_key, **options)
+
+        self.called_notifications = []
+        members = self._members(options)
+        prototypes = [
+            (via, self._build(via, notification, members)) for via in self._via
+        ]
+
+        for recipient in recipients:
+            fields = recipient if isinstance(recipient, dict) else {'to': recipient}
+
+            for via, prototype in prototypes:
+                key = self._idempotency_key(
+                    idempotency_key, via, notification, members, self._members(fields))
+                if key is not None and not self._dedupe_store().claim(key):
+                    continue
+
+                instance = copy.copy(prototype)
+                for name, value in fields.items():
+                    setattr(instance, '_{}'.format(name), value)
+                apply = getattr(instance, '_apply_{}_members'.format(via), None)
+                if apply is not None:
+                    apply(fields)
+
+                marks = self._marks()
+                try:
+                    dispatch = self._fire(via, notification, instance)
+                except Exception:
+                    self._discard(marks)
+                    if key is not None:
+                        self._dedupe_store().forget(key)
+                    raise
+
+                self._forget_undelivered(dispatch, key)
+                self._buffered(dispatch, key, marks)
+
+        return self
+
+    async def send_async(self, *notifications, idempotency_key=None, delay=None, at=None, tz=None,
+                         schedule_key=None, **options):
+        """Sends the notifications through every channel set with the via method concurrently.
+
+        Each channel is fired through its fire_{channel}_async method so the I/O of every
+        notification overlaps. At most the concurrency set with the limit method is in flight.
+
+        Keyword Arguments:
+            idempotency_key {string|bool} -- Skips every notification and channel pair already sent
+                                             with this key. True derives the key from the options. (default: {None})
+            delay {int|float|timedelta} -- Sends the notifications after this many seconds. (default: {None})
+            at {datetime|time|float} -- Sends the notifications at this moment. (default: {None})
+            tz {tzinfo} -- The timezone of an at without one. (default: {None})
+            schedule_key {string} -- The key to cancel the scheduled notifications by. (default: {None})
+
+        Returns:
+            self
+        """
+        import asyncio
+
+        self.called_notifications = []
+        members = self._members(options)
+
+        due_at = self._due_at(delay, at, tz)
+        if due_at is not None:
+            with self._schedule_store().transaction():
+                for via in self._via:
+                    for obj in notifications:
+                        self._schedule(via, obj, members, due_at, schedule_key, idempotency_key)
+
+            return self
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def dispatch(via, obj):
+            async with semaphore:
+                metrics = self._metrics()
+                if metrics:
+                    metrics.start(via, obj)
+
+                dispatch = DispatchResult(via, obj)
+                key = self._idempotency_key(idempotency_key, via, obj, members)
+                if key is not None and not self._dedupe_store().claim(key):
+                    dispatch.duplicate = True
+                    if metrics:
+                        metrics.record(dispatch)
+                    return
+
+                started = time.perf_counter()
+                try:
+                    dispatch.notification = self._build(via, obj, members)
+                    built = time.perf_counter()
+                    dispatch.build_time = built - started
+
+                    # Call and await the async fire method inherited from the component
+                    try:
+                        breaker = self._breaker(via, dispatch.notification)
+                        if getattr(dispatch.notification, '_digest', False):
+                            self._send(via, obj, dispatch.notification, dispatch)
+                        elif breaker is not None and not breaker.allow():
+                            dispatch.result = self._shed(via, obj, dispatch.notification, dispatch)
+                        else:
+                            plan = DispatchPlan.get(obj, via)
+                            try:
+                                dispatch.result = await plan.call(self.app, dispatch.notification, plan.fire_async)
+                            except Exception:
+                                if breaker is not None:
+                                    breaker.record(False)
+                                raise
+
+                            self._settle(dispatch, breaker)
+                    finally:
+                        dispatch.transport_time = time.perf_counter() - built
+                except Exception as e:
+                    dispatch.exception = e
+                    if key is not None:
+                        self._dedupe_store().forget(key)
+                    raise
+                finally:
+                    if metrics:
+                        dispatch.when_settled(metrics.record)
+
+                self._forget_undelivered(dispatch, key)
+
+        await asyncio.gather(*[
+            dispatch(via, obj) for via in self._via for obj in notifications
+        ])
 
         return self
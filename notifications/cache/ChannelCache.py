@@ -0,0 +1,189 @@
+"""Slack Channel Cache Module."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from notifications.exceptions import SlackApiError
+from notifications.transports import SlackScheduler, SlackTransport
+
+
+class ChannelCache:
+    """Caches Slack channel name to channel ID lookups per authentication token.
+
+    Each token owns one entry holding every channel of the workspace. Entries expire after the
+    TTL and the least recently used token is evicted once more than `size` tokens are cached.
+    """
+
+    def __init__(self, ttl=300, size=128, loader=None, transport=None, scheduler=None):
+        """Channel Cache Constructor.
+
+        Keyword Arguments:
+            ttl {int} -- Seconds a token's channel list stays valid. (default: {300})
+            size {int} -- The maximum amount of tokens to keep channels for. (default: {128})
+            loader {callable} -- Called with a token and returns a {name: id} dictionary.
+                                 Defaults to walking every page of the Slack channels.list API. (default: {None})
+            transport {notifications.transports.SlackTransport} -- The transport used by the default loader. (default: {None})
+            scheduler {notifications.transports.SlackScheduler} -- The scheduler the default loader calls Slack through.
+                                                                   Defaults to a scheduler over the transport. (default: {None})
+        """
+        self.ttl = ttl
+        self.size = size
+        self.loader = loader or self.fetch_channels
+        self.scheduler = scheduler or SlackScheduler(transport or SlackTransport())
+        self.transport = self.scheduler.transport
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # One refresh per token at a time, striped so the locks do not grow with the tokens
+        self._refresh_locks = [threading.Lock() for _ in range(16)]
+
+    def get(self, token, name):
+        """Gets the channel ID for a channel name.
+
+        A missing or expired entry is refreshed once. A name that is still missing after a refresh
+        is remembered as missing, also across later refreshes until it is found, so unknown
+        channels do not hit the API on every call. Concurrent misses for a token share one refresh.
+
+        Arguments:
+            token {string} -- The Slack authentication token.
+            name {string} -- The channel name with or without the leading #.
+
+        Returns:
+            string|None -- The channel ID or None if the channel does not exist.
+        """
+        name = name.lstrip('#')
+
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry and entry['expires'] > time.time():
+                self._entries.move_to_end(token)
+                if name in entry['channels']:
+                    return entry['channels'][name]
+                if name in entry['missing']:
+                    return None
+
+        entry = self._load(token, stale=entry)
+
+        if name not in entry['channels']:
+            with self._lock:
+                entry['missing'].add(name)
+            return None
+
+        return entry['channels'][name]
+
+    def refresh(self, token):
+        """Loads the channels for a token and stores them in the cache.
+
+        Nothing is stored when the loader raises, so a failed lookup is tried again.
+
+        Arguments:
+            token {string} -- The Slack authentication token.
+
+        Returns:
+            dict -- The cache entry.
+        """
+        return self._load(token)
+
+    def _load(self, token, stale=False):
+        """Loads the channels for a token unless another thread replaced the stale entry meanwhile.
+
+        Keyword Arguments:
+            stale {dict|None|bool} -- The entry the caller found wanting, False to always load. (default: {False})
+
+        Returns:
+            dict -- The cache entry.
+        """
+        with self._refresh_locks[hash(token) % len(self._refresh_locks)]:
+            with self._lock:
+                current = self._entries.get(token)
+                missing = set(current['missing']) if current else set()
+
+            fresh = current is not None and current['expires'] > time.time()
+            if stale is not False and current is not stale and fresh:
+                return current
+
+            channels = self.loader(token)
+            entry = {
+                'channels': channels,
+                # Names stay missing across refreshes until a refresh finds them
+                'missing': {name for name in missing if name not in channels},
+                'expires': time.time() + self.ttl,
+            }
+
+            with self._lock:
+                self._entries[token] = entry
+                self._entries.move_to_end(token)
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+
+            return entry
+
+    def warm(self, *tokens):
+        """Loads the channels for each token ahead of time.
+
+        Returns:
+            self
+        """
+        for token in tokens:
+            self.refresh(token)
+
+        return self
+
+    def forget(self, token=None):
+        """Removes a token from the cache or clears the whole cache.
+
+        Keyword Arguments:
+            token {string} -- The token to remove. (default: {None})
+
+        Returns:
+            self
+        """
+        with self._lock:
+            if token is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(token, None)
+
+        return self
+
+    def fetch_channels(self, token):
+        """Walks every page of the Slack channels.list API.
+
+        Pages are requested through the scheduler so they wait for the method's rate limit
+        and honour the Retry-After header of a 429 response.
+
+        Arguments:
+            token {string} -- The Slack authentication token.
+
+        Raises:
+            SlackApiError -- When Slack answers a page with an error.
+
+        Returns:
+            dict -- A dictionary of channel names to channel IDs.
+        """
+        channels = {}
+        cursor = None
+
+        while True:
+            payload = {'token': token, 'limit': 1000, 'exclude_archived': 'true'}
+            if cursor:
+                payload['cursor'] = cursor
+
+            outcome = self.scheduler.post('channels.list', payload)
+            if not outcome.ok:
+                raise SlackApiError('Could not list the Slack channels: {}'.format(outcome.error))
+
+            response = outcome.response.json()
+
+            for channel in response.get('channels', []):
+                channels[channel['name']] = channel['id']
+
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                return channels
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, token):
+        return token in self._entries
@@ -0,0 +1,69 @@
+"""Dedupe Store Module."""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class DedupeStore:
+    """Remembers the idempotency keys of sent notifications in memory.
+
+    Keys expire after the TTL and the least recently used key is evicted once more than
+    `size` keys are stored. Keys are only remembered by the current process.
+    """
+
+    def __init__(self, ttl=86400, size=10000):
+        """Dedupe Store Constructor.
+
+        Keyword Arguments:
+            ttl {int} -- Seconds a key is remembered. (default: {86400})
+            size {int} -- The maximum amount of keys to remember. (default: {10000})
+        """
+        self.ttl = ttl
+        self.size = size
+        self._keys = OrderedDict()
+        self._lock = threading.Lock()
+
+    def claim(self, key):
+        """Remembers a key unless it is already remembered.
+
+        Arguments:
+            key {string} -- The idempotency key.
+
+        Returns:
+            bool -- True if the key was new, False if it was claimed before.
+        """
+        now = time.time()
+
+        with self._lock:
+            expires = self._keys.get(key)
+            if expires is not None and expires > now:
+                self._keys.move_to_end(key)
+                return False
+
+            self._keys[key] = now + self.ttl
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.size:
+                self._keys.popitem(last=False)
+
+        return True
+
+    def forget(self, key):
+        """Forgets a key so it can be claimed again.
+
+        Arguments:
+            key {string} -- The idempotency key.
+        """
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        expires = self._keys.get(key)
+        return expires is not None and expires > time.time()
@@ -0,0 +1,105 @@
+"""Mail Snippet Cache Module."""
+
+import threading
+from collections import OrderedDict
+
+
+class SnippetCache:
+    """Compiles the mail snippet templates once per process and renders them from memory.
+
+    Templates are kept in a least recently used cache. In debug mode a template is compiled
+    again whenever its file changed on disk.
+    """
+
+    def __init__(self, size=32, debug=False, package='notifications', location='snippets/mail'):
+        """Snippet Cache Constructor.
+
+        Keyword Arguments:
+            size {int} -- The maximum amount of compiled templates to keep. (default: {32})
+            debug {bool} -- Whether to check templates for changes on every render. (default: {False})
+            package {string} -- The package the snippets live in. (default: {'notifications'})
+            location {string} -- The snippet directory inside the package. (default: {'snippets/mail'})
+        """
+        self.size = size
+        self.debug = debug
+        self.hits = 0
+        self.misses = 0
+        self.package = package
+        self.location = location
+        self._env = None
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def env(self):
+        """The jinja2 environment, created on the first render.
+
+        Returns:
+            jinja2.Environment
+        """
+        if self._env is None:
+            from jinja2 import Environment, PackageLoader, select_autoescape
+
+            self._env = Environment(
+                loader=PackageLoader(self.package, self.location),
+                autoescape=select_autoescape(['html', 'xml']),
+                cache_size=0,
+            )
+
+        return self._env
+
+    def get(self, name):
+        """Gets the compiled template for a snippet.
+
+        Arguments:
+            name {string} -- The snippet name such as line or panel.
+
+        Returns:
+            jinja2.Template
+        """
+        with self._lock:
+            template = self._templates.get(name)
+            if template is not None and not (self.debug and not template.is_up_to_date):
+                self.hits += 1
+                self._templates.move_to_end(name)
+                return template
+
+            self.misses += 1
+            template = self.env.get_template('{}.html'.format(name))
+            self._templates[name] = template
+            self._templates.move_to_end(name)
+            while len(self._templates) > self.size:
+                self._templates.popitem(last=False)
+
+            return template
+
+    def render(self, name, dictionary):
+        """Renders a snippet.
+
+        Arguments:
+            name {string} -- The snippet name such as line or panel.
+            dictionary {dict} -- The variables to pass to the snippet.
+
+        Returns:
+            string
+        """
+        return self.get(name).render(dictionary)
+
+    def clear(self):
+        """Removes every compiled template.
+
+        Returns:
+            self
+        """
+        with self._lock:
+            self._templates.clear()
+
+        return self
+
+    def stats(self):
+        """Gets the cache counters.
+
+        Returns:
+            dict
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._templates)}
@@ -0,0 +1,94 @@
+"""SQLite Dedupe Store Module."""
+
+import sqlite3
+import threading
+import time
+
+
+class SqliteDedupeStore:
+    """Remembers the idempotency keys of sent notifications in a SQLite database.
+
+    Every process pointing at the same database file shares its keys, so a job that is
+    retried by another worker is still recognized as a duplicate. Expired keys are
+    purged every `purge_every` claims.
+    """
+
+    def __init__(self, path, ttl=86400, purge_every=1000):
+        """SQLite Dedupe Store Constructor.
+
+        Arguments:
+            path {string} -- The database file. Use :memory: for a private in-memory database.
+
+        Keyword Arguments:
+            ttl {int} -- Seconds a key is remembered. (default: {86400})
+            purge_every {int} -- How many claims to make between purges of expired keys. (default: {1000})
+        """
+        self.path = path
+        self.ttl = ttl
+        self.purge_every = purge_every
+        self._claims = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS notification_keys '
+            '(key TEXT PRIMARY KEY, expires REAL NOT NULL)')
+
+    def claim(self, key):
+        """Remembers a key unless it is already remembered.
+
+        Arguments:
+            key {string} -- The idempotency key.
+
+        Returns:
+            bool -- True if the key was new, False if it was claimed before.
+        """
+        now = time.time()
+
+        with self._lock:
+            self._claims += 1
+            if self._claims % self.purge_every == 0:
+                self.purge()
+
+            # An expired key counts as new. The insert is ignored when another
+            # process holds the key, which makes the claim atomic.
+            self._connection.execute(
+                'DELETE FROM notification_keys WHERE key = ? AND expires <= ?', (key, now))
+            cursor = self._connection.execute(
+                'INSERT OR IGNORE INTO notification_keys (key, expires) VALUES (?, ?)',
+                (key, now + self.ttl))
+
+            return cursor.rowcount == 1
+
+    def forget(self, key):
+        """Forgets a key so it can be claimed again.
+
+        Arguments:
+            key {string} -- The idempotency key.
+        """
+        with self._lock:
+            self._connection.execute('DELETE FROM notification_keys WHERE key = ?', (key,))
+
+    def purge(self):
+        """Deletes every expired key."""
+        self._connection.execute('DELETE FROM notification_keys WHERE expires <= ?', (time.time(),))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM notification_keys')
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM notification_keys WHERE expires > ?', (time.time(),)).fetchone()[0]
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT 1 FROM notification_keys WHERE key = ? AND expires > ?',
+                (key, time.time())).fetchone() is not None
@@ -0,0 +1,4 @@
+from .ChannelCache import ChannelCache
+from .DedupeStore import DedupeStore
+from .SnippetCache import SnippetCache
+from .SqliteDedupeStore import SqliteDedupeStore
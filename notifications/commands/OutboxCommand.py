@@ -0,0 +1,33 @@
+""" A OutboxCommand Command """
+from cleo import Command
+from notifications import Notify
+from notifications.outbox import OutboxWorker
+from notifications.settings import setting
+
+
+class OutboxCommand(Command):
+    """
+    Delivers the notifications waiting in the outbox.
+
+    notification:outbox
+        {--once : Stop once no notification is due instead of waiting for more.}
+        {--sleep=1 : Seconds to wait between polls of an empty outbox.}
+    """
+
+    def handle(self):
+        from wsgi import container
+
+        worker = OutboxWorker(
+            container,
+            Notify(container)._outbox_store(),
+            batch_size=setting('outbox', 'batch_size', 100),
+            max_attempts=setting('outbox', 'max_attempts', 5),
+            backoff=setting('outbox', 'backoff', 2),
+        )
+
+        if self.option('once'):
+            counts = worker.drain()
+            self.info('Sent {sent}, retried {retried} and failed {failed} notifications'.format(**counts))
+        else:
+            self.info('Draining the notification outbox')
+            worker.work(sleep=float(self.option('sleep')))
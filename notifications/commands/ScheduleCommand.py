@@ -0,0 +1,33 @@
+""" A ScheduleCommand Command """
+from cleo import Command
+from notifications import Notify
+from notifications.schedule import ScheduleWorker
+from notifications.settings import setting
+
+
+class ScheduleCommand(Command):
+    """
+    Sends scheduled notifications once they are due.
+
+    notification:schedule
+        {--once : Stop once no notification is due instead of waiting for more.}
+        {--sleep=1 : The longest time in seconds to wait between checks.}
+    """
+
+    def handle(self):
+        from wsgi import container
+
+        worker = ScheduleWorker(
+            container,
+            Notify(container)._schedule_store(),
+            batch_size=setting('schedule', 'batch_size', 100),
+            max_attempts=setting('schedule', 'max_attempts', 5),
+            backoff=setting('schedule', 'backoff', 2),
+        )
+
+        if self.option('once'):
+            counts = worker.drain()
+            self.info('Sent {sent}, retried {retried} and failed {failed} notifications'.format(**counts))
+        else:
+            self.info('Sending scheduled notifications')
+            worker.work(sleep=float(self.option('sleep')))
@@ -1 +1,3 @@
-from .NotificationCommand import NotificationCommand
\ No newline at end of file
+from .NotificationCommand import NotificationCommand
+from .OutboxCommand import OutboxCommand
+from .ScheduleCommand import ScheduleCommand
@@ -0,0 +1,147 @@
+"""Database Component Class."""
+
+import threading
+from contextlib import ExitStack, contextmanager
+
+from notifications.settings import setting
+
+
+class DatabaseComponent:
+    _data = None
+    _run = True
+
+    _default_notification_table = None
+
+    # The open batch of each thread, joined by the tables written inside it
+    _batches = threading.local()
+
+    def data(self, dictionary):
+        """Adds data to show with the notification in the application.
+
+        Arguments:
+            dictionary {dict} -- JSON serializable data such as a message and a link.
+
+        Returns:
+            self
+        """
+        data = dict(self._data or {})
+        data.update(dictionary)
+        self._data = data
+        return self
+
+    def database(self):
+        """Used to show a not implemented type exception.
+
+        Raises:
+            Exception
+        """
+        raise Exception(
+            'The {} notification does not have a database method'.format(self))
+
+    def fire_database(self):
+        """Stores the notification for the notifiable set with the to option.
+
+        Inside a send or batch the rows of every notification are inserted at once.
+        """
+        if self._run:
+            table = self._notification_table()
+            DatabaseComponent._join(table)
+            table.add(self._recipient_database(), self.__class__.__name__, self._data or {})
+
+    async def fire_database_async(self):
+        """Stores the notification without blocking the event loop."""
+        import asyncio
+
+        await asyncio.get_event_loop().run_in_executor(None, self.fire_database)
+
+    def database_digest(self, notifications):
+        """Merges notifications for the same notifiable into this one.
+
+        The digest stores the data of every notification in a list under the notifications key.
+
+        Arguments:
+            notifications {list} -- The buffered notifications, this one first.
+
+        Returns:
+            self
+        """
+        self._data = {'notifications': [notification._data or {} for notification in notifications]}
+        return self
+
+    def _recipient_database(self):
+        return getattr(self, '_to', None)
+
+    @staticmethod
+    @contextmanager
+    def batch():
+        """Inserts the rows this thread adds to a notification table inside the with block when it ends.
+
+        A table joins the batch when the first notification is stored in it, so the table
+        is only opened once the database channel is used. Notify flushes the joined tables
+        in chunks between sends. Nested batches are part of the outermost one.
+        """
+        if getattr(DatabaseComponent._batches, 'stack', None) is not None:
+            yield
+            return
+
+        with ExitStack() as stack:
+            DatabaseComponent._batches.stack = stack
+            DatabaseComponent._batches.tables = set()
+            try:
+                yield
+            finally:
+                DatabaseComponent._batches.stack = None
+                DatabaseComponent._batches.tables = None
+
+    @staticmethod
+    def joined():
+        """Gets the tables that joined the open batch of this thread.
+
+        Returns:
+            list
+        """
+        return list(getattr(DatabaseComponent._batches, 'tables', None) or ())
+
+    @staticmethod
+    def _join(table):
+        stack = getattr(DatabaseComponent._batches, 'stack', None)
+        if stack is not None and table not in DatabaseComponent._batches.tables:
+            DatabaseComponent._batches.tables.add(table)
+            stack.enter_context(table.transaction())
+
+    def _notification_table(self):
+        return DatabaseComponent.notification_table(self.app)
+
+    @staticmethod
+    def notification_table(app):
+        """Gets the notification table from the container or opens the one configured in the settings.
+
+        A configured connection stores notifications in the application database through
+        Orator. Otherwise they are stored in a SQLite file.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+
+        Returns:
+            notifications.database.NotificationTable|notifications.database.OratorNotificationTable
+        """
+        if app.has('NotificationTable'):
+            return app.make('NotificationTable')
+
+        if DatabaseComponent._default_notification_table is None:
+            connection = setting('database', 'connection')
+            table = setting('database', 'table', 'notifications')
+
+            if connection:
+                from config.database import DB
+                from notifications.database import OratorNotificationTable
+
+                DatabaseComponent._default_notification_table = OratorNotificationTable(
+                    DB, None if connection == 'default' else connection, table=table)
+            else:
+                from notifications.database import NotificationTable
+
+                DatabaseComponent._default_notification_table = NotificationTable(
+                    setting('database', 'path', 'storage/notifications.sqlite3'), table=table)
+
+        return DatabaseComponent._default_notification_table
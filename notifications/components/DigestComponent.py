@@ -0,0 +1,60 @@
+"""Digest Component Class."""
+
+
+class DigestComponent:
+    _digest = False
+    _digest_window = None
+    _digest_size = None
+
+    def digest(self, window=None, size=None):
+        """Merges this notification with others sent to the same recipient into one digest.
+
+        Keyword Arguments:
+            window {float} -- Seconds to wait for more notifications. Defaults to the coalescer's window. (default: {None})
+            size {int} -- The maximum amount of notifications in one digest. Defaults to the coalescer's size. (default: {None})
+
+        Returns:
+            self
+        """
+        self._digest = True
+        self._digest_window = window
+        self._digest_size = size
+        return self
+
+    def _rebatch(self, notification=None):
+        """Sends the digest through the batch another notification was built in.
+
+        A digest may fire after the batch its first notification was built in has ended.
+        It uses the mail session and job buffer of the notification that filled it, or
+        none when it is fired by its window or a flush.
+
+        Keyword Arguments:
+            notification {object} -- The notification that filled the digest. (default: {None})
+        """
+        self._mail_session = getattr(notification, '_mail_session', None)
+        self._job_buffer = getattr(notification, '_job_buffer', None)
+
+    def _recipient(self, via):
+        """Gets who the notification is sent to on a channel.
+
+        Arguments:
+            via {string} -- The channel such as mail or slack.
+
+        Returns:
+            string|None
+        """
+        recipient = getattr(self, '_recipient_{}'.format(via), None)
+        return recipient() if recipient else None
+
+    def _endpoint(self, via):
+        """Gets the endpoint a channel calls to fire the notification.
+
+        Arguments:
+            via {string} -- The channel such as mail or slack.
+
+        Returns:
+            string|None -- None when firing does not leave the process, such as dry,
+                           queued or outbox notifications.
+        """
+        endpoint = getattr(self, '_endpoint_{}'.format(via), None)
+        return endpoint() if endpoint else None
@@ -0,0 +1,94 @@
+"""Mail Body Module."""
+
+
+class MailBody:
+    """The instructions that build the body of an email.
+
+    Builders only record which snippet or view to render with which variables. The body is
+    rendered the first time it is read, so dry or queued emails never render in the web
+    process. Copies of a notification share their body and render it once.
+    """
+
+    __slots__ = ('instructions', '_fragments')
+
+    _default_snippet_cache = None
+
+    def __init__(self, instructions=None):
+        """Mail Body Constructor.
+
+        Keyword Arguments:
+            instructions {list} -- (kind, name, dictionary) instructions to start with. (default: {None})
+        """
+        self.instructions = [tuple(instruction) for instruction in instructions or []]
+        self._fragments = None
+
+    def snippet(self, name, dictionary):
+        """Adds one of the mail snippets such as line or panel."""
+        self._add(('snippet', name, dictionary))
+
+    def view(self, template, dictionary):
+        """Adds a template rendered through the View binding."""
+        self._add(('view', template, dictionary))
+
+    def text(self, text):
+        """Adds text that is already rendered."""
+        self._add(('text', text, None))
+
+    @property
+    def rendered(self):
+        return self._fragments is not None
+
+    def render(self, app):
+        """Renders every instruction that was not rendered yet.
+
+        Arguments:
+            app {masonite.app.App} -- The container with the View and MailSnippetCache bindings.
+
+        Returns:
+            list -- The rendered fragments of the body.
+        """
+        if self._fragments is None:
+            self._fragments = [self._render(app, *instruction) for instruction in self.instructions]
+
+        return self._fragments
+
+    def prerender(self, app, kinds=('view',)):
+        """Renders the instructions of some kinds now and keeps the others as instructions.
+
+        Arguments:
+            app {masonite.app.App} -- The container with the View and MailSnippetCache bindings.
+
+        Keyword Arguments:
+            kinds {tuple} -- The kinds of instructions to render. (default: {('view',)})
+
+        Returns:
+            list -- The instructions with the rendered ones turned into text.
+        """
+        return [
+            ('text', self._render(app, *instruction), None) if instruction[0] in kinds else instruction
+            for instruction in self.instructions
+        ]
+
+    def _render(self, app, kind, name, dictionary):
+        if kind == 'text':
+            return name
+
+        if kind == 'view':
+            return app.make('View')(name, dictionary).rendered_template
+
+        if app.has('MailSnippetCache'):
+            return app.make('MailSnippetCache').render(name, dictionary)
+
+        if MailBody._default_snippet_cache is None:
+            # Compiling snippets pulls in jinja2 so only load it once an email renders
+            from notifications.cache.SnippetCache import SnippetCache
+            MailBody._default_snippet_cache = SnippetCache()
+
+        return MailBody._default_snippet_cache.render(name, dictionary)
+
+    def _add(self, instruction):
+        self.instructions.append(instruction)
+        self._fragments = None
+
+    def __len__(self):
+        return len(self.instructions)
@@ -1,16 +1,18 @@
 """Mail Component Class."""
 
-from masonite import Queue
-from masonite.queues import ShouldQueue
+from notifications.components.MailBody import MailBody
 from notifications.exceptions import InvalidNotificationType
-
-from config import mail
+from notifications.settings import setting
 
 
 class MailComponent:
-    template = ''
     _driver = None
     _run = True
+    _stream = False
+    _mail_session = None
+    _job_buffer = None
+    _outbox = None
+    _queued = False
 
     def __init__(self, app):
         """Mail Component Constructor.
@@ -19,8 +21,29 @@ class MailComponent:
             app {masonite.app.App} -- The Masonite container object.
         """
         self.app = app
-        self._view = self.app.make('View')
         self._subject = None
+        self._body = MailBody()
+
+    @property
+    def template(self):
+        """The rendered body of the email.
+
+        Builders only record what to render. The body is rendered when it is first read,
+        which for the snippets of queued emails happens in the queue worker.
+
+        Returns:
+            string
+        """
+        return ''.join(self._fragments)
+
+    @template.setter
+    def template(self, template):
+        self._body = MailBody()
+        self._body.text(template)
+
+    @property
+    def _fragments(self):
+        return self._body.render(self.app)
 
     def line(self, message):
         """Writes a line to a template.
@@ -31,8 +54,7 @@ class MailComponent:
         Returns:
             self
         """
-        self.template += self._view('/notifications/snippets/mail/line',
-                                    {'message': message}).rendered_template
+        self._body.snippet('line', {'message': message})
         return self
 
     def action(self, message, href=None, style='success'):
@@ -48,8 +70,7 @@ class MailComponent:
         Returns:
             self
         """
-        self.template += self._view('/notifications/snippets/mail/action',
-                                    {'message': message, 'style': style, 'href': href}).rendered_template
+        self._body.snippet('action', {'message': message, 'style': style, 'href': href})
         return self
 
     def view(self, template, dictionary={}):
@@ -64,7 +85,7 @@ class MailComponent:
         Returns:
             self
         """
-        self.template += self._view(template, dictionary).rendered_template
+        self._body.view(template, dictionary)
         return self
 
     def panel(self, message):
@@ -76,8 +97,7 @@ class MailComponent:
         Returns:
             self
         """
-        self.template += self._view('/notifications/snippets/mail/panel',
-                                    {'message': message}).rendered_template
+        self._body.snippet('panel', {'message': message})
         return self
 
     def heading(self, message):
@@ -89,8 +109,7 @@ class MailComponent:
         Returns:
             self
         """
-        self.template += self._view('/notifications/snippets/mail/heading',
-                                    {'message': message}).rendered_template
+        self._body.snippet('heading', {'message': message})
         return self
 
     def subject(self, message):
@@ -114,6 +133,18 @@ class MailComponent:
         self._run = False
         return self
 
+    def stream(self):
+        """Sets whether the body should be handed to the mail driver as fragments.
+
+        Only drivers with a stream method receive the fragments. Every other driver
+        receives the joined body.
+
+        Returns:
+            self
+        """
+        self._stream = True
+        return self
+
     def driver(self, driver):
         """Specifies the driver to use.
 
@@ -135,20 +166,84 @@ class MailComponent:
         raise Exception(
             'The {} notification does not have a mail method'.format(self))
 
+    def mail_digest(self, notifications):
+        """Merges emails to the same recipient into this one.
+
+        The digest keeps this email's subject and joins the body of every email.
+        Override it to build the digest with the mail builders instead.
+
+        Arguments:
+            notifications {list} -- The buffered notifications, this one first.
+
+        Returns:
+            self
+        """
+        self._body = MailBody([
+            instruction for notification in notifications for instruction in notification._body.instructions])
+        return self
+
+    def _recipient_mail(self):
+        return getattr(self, '_to', None)
+
+    def _endpoint_mail(self):
+        from masonite.queues import ShouldQueue
+
+        if not self._run or self._outbox is not None or self._queued or isinstance(self, ShouldQueue):
+            return None
+
+        return self._driver or 'default'
+
     def fire_mail(self):
         """Used to fire the actual email and run the logic for sending emails.
+
+        Notifications that should be queued push a serializable MailJob, or add it to the
+        job buffer of a batch so the whole fan out is pushed in chunks. Views are rendered
+        before queueing and the job carries the unrendered snippets for the queue worker. Emails shed by an open circuit
+        breaker with the queue fallback are queued the same way. Jobs go to the queue
+        channel configured for the priority of the notification. When Notify writes
+        to an outbox the rendered email is stored there instead.
         """
-        driver = mail.DRIVER if not self._driver else None
+        # Imported when the first email is sent so importing notifications stays cheap
+        from masonite import Queue
+        from masonite.queues import ShouldQueue
+        from notifications.jobs import MailJob
+
+        from config import mail
+
+        driver = self._driver or mail.DRIVER
         if self._run:
-            if isinstance(self, ShouldQueue):
-                self.app.make(Queue).push(self.app.make('Mail')
-                                          .driver(driver)
-                                          .to(self._to)
-                                          .subject(self._subject)
-                                          .send, args=(self.template,))
+            if self._outbox is not None:
+                self._outbox.add('mail', {
+                    'driver': driver, 'to': self._to, 'subject': self._subject, 'body': self.template,
+                })
+            elif self._queued or isinstance(self, ShouldQueue):
+                job = MailJob(driver, self._to, self._subject, self._body,
+                              compress_over=setting('queue', 'compress_over'), container=self.app)
+                channel = setting('priority', 'queues', {}).get(getattr(self, '_priority', None))
+                if self._job_buffer is not None:
+                    self._job_buffer.append(job, channel)
+                elif channel:
+                    self.app.make(Queue).push(job, channel=channel)
+                else:
+                    self.app.make(Queue).push(job)
+            elif self._mail_session is not None:
+                self._mail_session.send(driver, self._to, self._subject, self.template)
             else:
-                self.app.make('Mail') \
+                mailer = self.app.make('Mail') \
                     .driver(driver) \
                     .to(self._to) \
-                    .subject(self._subject) \
-                    .send(self.template)
+                    .subject(self._subject)
+
+                if self._stream and hasattr(mailer, 'stream'):
+                    mailer.stream(iter(self._fragments))
+                else:
+                    mailer.send(self.template)
+
+    async def fire_mail_async(self):
+        """Fires the email without blocking the event loop.
+
+        Mail drivers are synchronous so the send runs on the event loop's executor.
+        """
+        import asyncio
+
+        await asyncio.get_event_loop().run_in_executor(None, self.fire_mail)
@@ -1,30 +1,54 @@
 """Slack Component."""
 
-import json
-
-import requests
+from notifications.components.SlackMessage import SlackMessage
 from notifications.exceptions import SlackChannelNotFound
+from notifications.settings import setting
 
 
 class SlackComponent:
 
     app = None
-    _text = ''
-    _channel = ''
-    _as_user = True
-    _username = 'My Bot'
-    _as_current_user = False
-    _icon_emoji = ''
-    _mrkdwn = True
-    _reply_broadcast = False
-    _attachments = []
     _run = True
-    _unfurl = True
-    _as_snippet = False
+    _outbox = None
+
+    # Created on first use so importing the component does not import requests
+    _default_transport = None
+    _default_channel_cache = None
+    _default_scheduler = None
+    _default_webhook_batcher = None
+
+    # Option members such as channel='C1' that set a message field, by field
+    _slack_members = {
+        'token': '_token',
+        'channel': '_channel',
+        'text': '_text',
+        'username': '_username',
+        'icon_emoji': '_icon_emoji',
+        'as_user': '_as_current_user',
+        'mrkdwn': '_mrkdwn',
+        'reply_broadcast': '_reply_broadcast',
+        'unfurl': '_unfurl',
+        'initial_comment': '_initial_comment',
+    }
+
+    @property
+    def _message(self):
+        """The Slack message of this notification, created on first use.
+
+        Notify sets option members such as channel='C1' before the slack method runs, so the
+        message starts with them and the builders of the slack method override them.
+
+        Returns:
+            notifications.components.SlackMessage
+        """
+        message = self.__dict__.get('_slack_message')
+        if message is None:
+            message = self.__dict__['_slack_message'] = SlackMessage()
+            for field, member in self._slack_members.items():
+                if member in self.__dict__:
+                    setattr(message, field, self.__dict__[member])
 
-    _attach = ''
-    _dont_link = True
-    _as_markdown = False
+        return message
 
     def text(self, message):
         """Specifies the text to be sent in the message.
@@ -35,7 +59,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._text = message
+        self._message.text = message
         return self
 
     def channel(self, channel):
@@ -47,11 +71,31 @@ class SlackComponent:
         Returns:
             self
         """
-        if channel.startswith('#'):
-            self._channel = self.find_channel(channel)
+        webhook = setting('slack', 'webhooks', {}).get(channel)
+        if webhook:
+            # Channels with a webhook are posted to without looking up their ID
+            self._message.webhook = webhook
+            self._message.channel = channel
+        elif channel.startswith('#'):
+            self._message.channel = self.find_channel(channel)
         else:
-            self._channel = channel
+            self._message.channel = channel
+
+        return self
+
+    def webhook(self, url):
+        """Posts the message to an incoming webhook instead of calling chat.postMessage.
+
+        The message goes to the channel the webhook was created for, so no token or channel
+        lookup is needed. Messages to the same webhook within a short window are combined.
 
+        Arguments:
+            url {string} -- The URL of the incoming webhook.
+
+        Returns:
+            self
+        """
+        self._message.webhook = url
         return self
 
     def token(self, token):
@@ -63,7 +107,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._token = token
+        self._message.token = token
         return self
 
     def as_user(self, username):
@@ -75,7 +119,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._username = username
+        self._message.username = username
         return self
 
     def icon(self, emoji):
@@ -87,7 +131,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._icon_emoji = emoji
+        self._message.icon_emoji = emoji
         return self
 
     def as_current_user(self):
@@ -98,7 +142,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._as_current_user = True
+        self._message.as_user = True
         return self
 
     def without_markdown(self):
@@ -107,7 +151,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._mrkdwn = False
+        self._message.mrkdwn = False
         return self
 
     def dont_unfurl(self):
@@ -119,7 +163,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._unfurl = False
+        self._message.unfurl = False
         return self
 
     def can_reply(self):
@@ -128,7 +172,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._reply_broadcast = True
+        self._message.reply_broadcast = True
         return self
 
     def as_snippet(self, file_type='python', name='snippet', title='My Snippet'):
@@ -142,10 +186,10 @@ class SlackComponent:
         Returns:
             self
         """
-        self._as_snippet = True
-        self._snippet_name = name
-        self._type = file_type
-        self._title = title
+        self._message.snippet = True
+        self._message.filename = name
+        self._message.filetype = file_type
+        self._message.title = title
         return self
 
     def comment(self, comment):
@@ -157,7 +201,7 @@ class SlackComponent:
         Returns:
             self
         """
-        self._initial_comment = comment
+        self._message.initial_comment = comment
         return self
 
     def button(self, text, url, **options):
@@ -170,29 +214,18 @@ class SlackComponent:
         Returns:
             self
         """
-        additional = {}
-        if options.get('confirm'):
-            additional.update(options.get('confirm'))
-
         data = {
             "type": "button",
             "text": text,
             # "name": options.get('name', 'button'),
             "style": options.get('style', 'primary'),
             "url": url
-        }.update(additional)
-
-        if not self._attachments:
-            self._attachments.append(
-                {
-                    "fallback": "Your device is not able to view button links.",
-                    'actions': [
-                        data
-                    ]
-                }
-            )
-        else:
-            self._attachments[0]['actions'].append(data)
+        }
+
+        if options.get('confirm'):
+            data.update(options.get('confirm'))
+
+        self._message.add_action(data)
         return self
 
     def dry(self):
@@ -204,20 +237,95 @@ class SlackComponent:
         self._run = False
         return self
 
-    def attach(self, file): 
-        pass
+    def slack_digest(self, notifications):
+        """Merges messages to the same channel into this one.
 
-    def thumbnail(self, location): 
-        pass
+        The digest keeps this message's settings and joins the text of every message
+        on its own line. Override it to build the digest with the Slack builders instead.
+
+        Arguments:
+            notifications {list} -- The buffered notifications, this one first.
+
+        Returns:
+            self
+        """
+        text = '\n'.join(notification._message.get('text') for notification in notifications)
+
+        # Copies made by Notify.send_many share one message
+        self.__dict__['_slack_message'] = self._message.copy()
+        return self.text(text)
+
+    def _apply_slack_members(self, members):
+        """Sets the message fields named by members set after the message was built.
+
+        Notify.send_many sets the fields of each recipient on a copy of a built notification,
+        so a recipient such as {'channel': 'C2'} overrides the channel of the message.
+
+        Arguments:
+            members {dict} -- The members without their leading underscore.
+        """
+        fields = {
+            field: members[member[1:]] for field, member in self._slack_members.items() if member[1:] in members
+        }
+        if not fields:
+            return
+
+        # Copies made by Notify.send_many share one message
+        message = self.__dict__['_slack_message'] = self._message.copy()
+        for field, value in fields.items():
+            setattr(message, field, value)
+
+    def _recipient_slack(self):
+        return self._message.get('channel') or self._message.get('webhook')
+
+    def _endpoint_slack(self):
+        if not self._run or self._outbox is not None:
+            return None
+
+        if self._message.get('webhook'):
+            return self._message.get('webhook')
+
+        transport = getattr(self._scheduler(), 'transport', None)
+        return getattr(transport, 'base_url', 'slack')
+
+    def attach(self, file):
+        """Uploads a file with the message.
+
+        The file is streamed from disk when it is sent, so large files are never loaded into
+        memory. The text of the message becomes the comment on the file.
+
+        Arguments:
+            file {string|notifications.transports.SlackFile} -- The path of the file.
+
+        Returns:
+            self
+        """
+        from notifications.transports.SlackFile import SlackFile
+
+        self._message.file = file if isinstance(file, SlackFile) else SlackFile.open(file)
+        return self
+
+    def thumbnail(self, location):
+        """Shows a thumbnail image next to the message.
+
+        Arguments:
+            location {string} -- The URL of the image.
+
+        Returns:
+            self
+        """
+        self._message.thumb_url = location
+        return self
 
     def dont_link(self):
         pass
 
     def find_channel(self, name):
-        """Calls the Slack API to find the channel name. 
+        """Finds the channel ID for a channel name.
 
         This is so we do not have to specify the channel ID's. Slack requires channel ID's
-        to be used.
+        to be used. Lookups go through the shared channel cache so the Slack API is only
+        called when the cache for the token is empty, expired or missing the channel.
 
         Arguments:
             name {string} -- The channel name to find.
@@ -229,18 +337,92 @@ class SlackComponent:
             self
         """
         if self._run:
-            response = requests.post('https://slack.com/api/channels.list', {
-                'token': self._token
-            })
-            for channel in response.json()['channels']:
-                if channel['name'] == name.split('#')[1]:
-                    return channel['id']
+            channel_id = self._channel_cache().get(self._message.get('token'), name)
+            if channel_id:
+                return channel_id
 
             raise SlackChannelNotFound(
                 'Could not find the {} channel'.format(name))
         else:
             return 'TEST_ID'
 
+    def _channel_cache(self):
+        """Gets the channel cache shared by every Slack notification.
+
+        Returns:
+            notifications.cache.ChannelCache
+        """
+        if self.app and self.app.has('SlackChannelCache'):
+            return self.app.make('SlackChannelCache')
+
+        return SlackComponent._defaults()._default_channel_cache
+
+    def _transport(self):
+        """Gets the pooled HTTP transport shared by every Slack notification.
+
+        Returns:
+            notifications.transports.SlackTransport
+        """
+        if self.app and self.app.has('SlackTransport'):
+            return self.app.make('SlackTransport')
+
+        return SlackComponent._defaults()._default_transport
+
+    def _scheduler(self):
+        """Gets the rate limit aware scheduler shared by every Slack notification.
+
+        When the container only has a transport, a scheduler for that transport is
+        bound on first use.
+
+        Returns:
+            notifications.transports.SlackScheduler
+        """
+        if self.app and self.app.has('SlackScheduler'):
+            return self.app.make('SlackScheduler')
+
+        if self.app and self.app.has('SlackTransport'):
+            from notifications.transports import SlackScheduler
+
+            self.app.bind('SlackScheduler', SlackScheduler(self.app.make('SlackTransport')))
+            return self.app.make('SlackScheduler')
+
+        return SlackComponent._defaults()._default_scheduler
+
+    def _webhook_batcher(self):
+        """Gets the batcher that combines messages to the same webhook.
+
+        Returns:
+            notifications.transports.SlackWebhookBatcher
+        """
+        if self.app and self.app.has('SlackWebhookBatcher'):
+            return self.app.make('SlackWebhookBatcher')
+
+        if SlackComponent._default_webhook_batcher is None:
+            from notifications.transports import SlackWebhookBatcher
+
+            SlackComponent._default_webhook_batcher = SlackWebhookBatcher(
+                self._scheduler(), window=setting('slack', 'webhook_window', 0.5))
+
+        return SlackComponent._default_webhook_batcher
+
+    @staticmethod
+    def _defaults():
+        """Creates the transport, scheduler and channel cache shared by every Slack notification.
+
+        Returns:
+            class -- The SlackComponent class.
+        """
+        if SlackComponent._default_scheduler is None:
+            from notifications.cache import ChannelCache
+            from notifications.transports import SlackScheduler, SlackTransport
+
+            transport = SlackTransport()
+            SlackComponent._default_transport = transport
+            SlackComponent._default_scheduler = SlackScheduler(transport)
+            SlackComponent._default_channel_cache = ChannelCache(scheduler=SlackComponent._default_scheduler)
+
+        return SlackComponent
+
     def slack(self):
         """Throws a not implemented type exception.
 
@@ -252,30 +434,93 @@ class SlackComponent:
 
     def fire_slack(self):
         """Internal class to be called to run the logic and actually fire the Slack message.
+
+        The message is sent through the scheduler so it waits for Slack's rate limits
+        instead of being dropped. When Notify writes to an outbox the request is stored there instead.
+
+        Returns:
+            notifications.transports.SlackOutcome|concurrent.futures.Future|None -- A future of the
+                outcome for webhook messages and None when the message is dry or stored.
+        """
+        self._build_slack()
+        if self._run:
+            if self._outbox is not None:
+                return self._store_slack()
+
+            if self._message.get('webhook'):
+                return self._post_webhook()
+
+            return self._scheduler().post(*self._slack_request())
+
+    async def fire_slack_async(self):
+        """Fires the Slack message without blocking the event loop.
+
+        The request goes through the scheduler on the event loop's executor.
+
+        Returns:
+            notifications.transports.SlackOutcome|None -- None when the message is dry or stored.
+        """
+        self._build_slack()
+        if self._run:
+            if self._outbox is not None:
+                return self._store_slack()
+
+            import asyncio
+            import functools
+
+            if self._message.get('webhook'):
+                future = await asyncio.get_event_loop().run_in_executor(None, self._post_webhook)
+                return await asyncio.wrap_future(future)
+
+            return await asyncio.get_event_loop().run_in_executor(
+                None, functools.partial(self._scheduler().post, *self._slack_request()))
+
+    def _store_slack(self):
+        """Adds the Slack request to the outbox.
+
+        Attached files are stored by path and streamed by the worker. Webhook messages
+        are stored with their URL and JSON body.
+        """
+        if self._message.get('webhook'):
+            url, body = self._message.to_webhook()
+            self._outbox.add('slack', {'webhook': url, 'body': body})
+            return
+
+        method, data, *files = self._slack_request()
+        payload = {'method': method, 'data': data}
+        if files:
+            payload['file'] = files[0]['file'].path
+
+        self._outbox.add('slack', payload)
+
+    def _post_webhook(self):
+        """Hands the message to the webhook batcher.
+
+        Raises:
+            Exception -- Thrown if the message uploads a file, which webhooks can not do.
+
+        Returns:
+            concurrent.futures.Future
+        """
+        if self._message.get('snippet') or self._message.get('file') is not None:
+            raise Exception('Slack webhooks can not upload files or snippets')
+
+        return self._webhook_batcher().post(*self._message.to_webhook())
+
+    def _build_slack(self):
+        """Calls the slack method if the message was not built yet.
+
+        Notify builds the message before firing it, so this only runs when a fire
+        method is called directly.
+        """
+        if '_slack_message' not in self.__dict__:
+            self.app.resolve(self.slack)
+
+    def _slack_request(self):
+        """Builds the Slack API method and the payload for the message.
+
+        Returns:
+            tuple -- The API method and the payload, followed by the files to upload when a
+                     file is attached.
         """
-        notification = self.app.resolve(self.slack)
-        if notification._run:
-            if notification._as_snippet:
-                requests.post('https://slack.com/api/files.upload', {
-                    'token': notification._token,
-                    'channels': notification._channel,
-                    'content': notification._text,
-                    'filename': notification._snippet_name,
-                    'filetype': notification._type,
-                    'initial_comment': notification._initial_comment,
-                    'title': notification._title,
-                })
-            else:
-                requests.post('https://slack.com/api/chat.postMessage', {
-                    'token': notification._token,
-                    'channel': notification._channel,
-                    'text': notification._text,
-                    'username': notification._username,
-                    'icon_emoji': notification._icon_emoji,
-                    'as_user': notification._as_current_user,
-                    'mrkdwn': notification._mrkdwn,
-                    'reply_broadcast': notification._reply_broadcast,
-                    'unfurl_links': notification._unfurl,
-                    'unfurl_media': notification._unfurl,
-                    'attachments': json.dumps(notification._attachments),
-                })
+        return self._message.to_request()
@@ -0,0 +1,166 @@
+"""Slack Message Module."""
+
+import json
+
+
+class SlackMessage:
+    """The settings of one Slack message.
+
+    A message is created per notification and only holds the fields that were set.
+    Fields that were never set fall back to DEFAULTS when the payload is built.
+    """
+
+    __slots__ = (
+        'token', 'channel', 'text', 'username', 'icon_emoji', 'as_user', 'mrkdwn',
+        'reply_broadcast', 'unfurl', 'attachments', 'snippet', 'filename', 'filetype',
+        'title', 'initial_comment', 'file', 'thumb_url', 'webhook',
+    )
+
+    DEFAULTS = {
+        'text': '',
+        'username': 'My Bot',
+        'icon_emoji': '',
+        'as_user': False,
+        'mrkdwn': True,
+        'reply_broadcast': False,
+        'unfurl': True,
+        'snippet': False,
+    }
+
+    def get(self, field):
+        """Gets a field or its default.
+
+        Arguments:
+            field {string} -- The name of the field.
+
+        Returns:
+            any
+        """
+        return getattr(self, field, self.DEFAULTS.get(field))
+
+    def fields(self):
+        """Gets every field that was set.
+
+        Returns:
+            dict
+        """
+        return {field: getattr(self, field) for field in self.__slots__ if hasattr(self, field)}
+
+    def copy(self):
+        """Copies the message so the copy can be changed on its own.
+
+        Returns:
+            notifications.components.SlackMessage
+        """
+        message = SlackMessage()
+        for field, value in self.fields().items():
+            setattr(message, field, value)
+        if hasattr(self, 'attachments'):
+            message.attachments = [
+                dict(attachment, actions=list(attachment.get('actions', [])))
+                for attachment in self.attachments]
+
+        return message
+
+    def add_action(self, action):
+        """Adds an action to the first attachment of the message.
+
+        Arguments:
+            action {dict} -- The action such as a button.
+        """
+        if not hasattr(self, 'attachments'):
+            self.attachments = [{
+                'fallback': 'Your device is not able to view button links.',
+                'actions': [],
+            }]
+
+        self.attachments[0]['actions'].append(action)
+
+    def to_request(self):
+        """Builds the Slack API method and the payload for the message.
+
+        Returns:
+            tuple -- The API method and the payload, followed by the files to upload when a
+                     file is attached.
+        """
+        get = self.get
+
+        if hasattr(self, 'file'):
+            payload = {
+                'token': get('token'),
+                'channels': get('channel'),
+                'filename': getattr(self, 'filename', self.file.name),
+            }
+            for field in ('filetype', 'title'):
+                if hasattr(self, field):
+                    payload[field] = getattr(self, field)
+            comment = getattr(self, 'initial_comment', get('text'))
+            if comment:
+                payload['initial_comment'] = comment
+
+            return 'files.upload', payload, {'file': self.file}
+
+        if get('snippet'):
+            payload = {
+                'token': get('token'),
+                'channels': get('channel'),
+                'content': get('text'),
+            }
+            for field in ('filename', 'filetype', 'initial_comment', 'title'):
+                if hasattr(self, field):
+                    payload[field] = getattr(self, field)
+
+            return 'files.upload', payload
+
+        payload = {
+            'token': get('token'),
+            'channel': get('channel'),
+            'text': get('text'),
+            'username': get('username'),
+            'icon_emoji': get('icon_emoji'),
+            'as_user': get('as_user'),
+            'mrkdwn': get('mrkdwn'),
+            'reply_broadcast': get('reply_broadcast'),
+            'unfurl_links': get('unfurl'),
+            'unfurl_media': get('unfurl'),
+        }
+        attachments = self._attachments()
+        if attachments is not None:
+            payload['attachments'] = json.dumps(attachments)
+
+        return 'chat.postMessage', payload
+
+    def to_webhook(self):
+        """Builds the incoming webhook URL and the JSON body for the message.
+
+        Webhooks post to the channel they were created for, so the body has no token or channel.
+
+        Returns:
+            tuple -- The webhook URL and the body.
+        """
+        get = self.get
+        body = {
+            'text': get('text'),
+            'mrkdwn': get('mrkdwn'),
+            'unfurl_links': get('unfurl'),
+            'unfurl_media': get('unfurl'),
+        }
+        for field in ('username', 'icon_emoji'):
+            if hasattr(self, field):
+                body[field] = getattr(self, field)
+        attachments = self._attachments()
+        if attachments is not None:
+            body['attachments'] = attachments
+
+        return self.webhook, body
+
+    def _attachments(self):
+        attachments = getattr(self, 'attachments', None)
+        if hasattr(self, 'thumb_url'):
+            attachments = [dict(attachment) for attachment in attachments or [{'fallback': self.get('text')}]]
+            attachments[0]['thumb_url'] = self.thumb_url
+
+        return attachments
+
+    def __repr__(self):
+        return '<SlackMessage {}>'.format(self.fields())
@@ -1,2 +1,6 @@
+from .DatabaseComponent import DatabaseComponent
+from .DigestComponent import DigestComponent
+from .MailBody import MailBody
 from .MailComponent import MailComponent
-from .SlackComponent import SlackComponent
\ No newline at end of file
+from .SlackComponent import SlackComponent
+from .SlackMessage import SlackMessage
@@ -0,0 +1,163 @@
+"""Lease Table Module."""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from notifications.database.RowBuffer import RowBuffer
+
+
+class LeaseTable(RowBuffer):
+    """A SQLite table of rows that workers lease until they are done, retried or failed.
+
+    Workers claim due rows by leasing them. A row that is not marked done or retried before
+    its lease runs out is claimed again, so rows survive restarts and crashed workers.
+
+    Subclasses set TABLE, DUE as the column holding when a row is due, COLUMNS as the
+    columns claim returns besides the id and attempts, PAYLOAD as the JSON column among
+    them, SCHEMA as the statements creating the table and INSERT as the statement adding
+    a row.
+    """
+
+    TABLE = None
+    DUE = None
+    COLUMNS = ()
+    PAYLOAD = None
+    SCHEMA = ()
+    INSERT = None
+
+    def __init__(self, path, lease=60):
+        """Lease Table Constructor.
+
+        Arguments:
+            path {string} -- The database file. Use :memory: for a private in-memory database.
+
+        Keyword Arguments:
+            lease {int} -- Seconds a worker owns the rows it claimed. (default: {60})
+        """
+        self.path = path
+        self.lease = lease
+        # Set whenever rows are added so a worker in this process can wake up early
+        self.added = threading.Event()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        for statement in self.SCHEMA:
+            self._connection.execute(statement)
+
+    def next_due(self):
+        """Gets when the next pending row is due.
+
+        Returns:
+            float|None -- The UNIX timestamp, None when nothing is pending.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT MIN({}) FROM {} WHERE status = 'pending'".format(self.DUE, self.TABLE)).fetchone()[0]
+
+    def claim(self, limit=100):
+        """Leases the earliest rows that are due.
+
+        Arguments:
+            limit {int} -- The maximum amount of rows to claim. (default: {100})
+
+        Returns:
+            list -- Dictionaries with the id, attempts and COLUMNS of each row.
+        """
+        claim = uuid.uuid4().hex
+        now = time.time()
+        names = ('id',) + tuple(self.COLUMNS) + ('attempts',)
+
+        with self._write() as connection:
+            connection.execute(
+                'UPDATE {table} SET claim = ?, {due} = ?, attempts = attempts + 1 '
+                'WHERE id IN (SELECT id FROM {table} '
+                "WHERE status = 'pending' AND {due} <= ? ORDER BY {due}, id LIMIT ?)".format(
+                    table=self.TABLE, due=self.DUE),
+                (claim, now + self.lease, now, limit))
+            rows = connection.execute(
+                'SELECT {} FROM {} WHERE claim = ? ORDER BY id'.format(', '.join(names), self.TABLE),
+                (claim,)).fetchall()
+
+        rows = [dict(zip(names, row)) for row in rows]
+        for row in rows:
+            row[self.PAYLOAD] = json.loads(row[self.PAYLOAD])
+
+        return rows
+
+    def done(self, ids):
+        """Removes finished rows.
+
+        Arguments:
+            ids {list} -- The ids of the finished rows.
+        """
+        if not ids:
+            return
+
+        with self._write() as connection:
+            connection.executemany(
+                'DELETE FROM {} WHERE id = ?'.format(self.TABLE), [(id,) for id in ids])
+
+    def retry(self, id, error, delay):
+        """Releases a row so it is claimed again after a delay.
+
+        Arguments:
+            id {int} -- The id of the row.
+            error {string} -- Why the row failed.
+            delay {float} -- Seconds to wait before the row is due again.
+        """
+        with self._write() as connection:
+            connection.execute(
+                'UPDATE {} SET claim = NULL, error = ?, {} = ? WHERE id = ?'.format(self.TABLE, self.DUE),
+                (error, time.time() + delay, id))
+
+    def fail(self, id, error):
+        """Marks a row as failed so it is never claimed again.
+
+        Arguments:
+            id {int} -- The id of the row.
+            error {string} -- Why the row failed.
+        """
+        with self._write() as connection:
+            connection.execute(
+                "UPDATE {} SET claim = NULL, error = ?, status = 'failed' WHERE id = ?".format(self.TABLE),
+                (error, id))
+
+    def stats(self):
+        """Counts the rows per status.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            return dict(self._connection.execute(
+                'SELECT status, COUNT(*) FROM {} GROUP BY status'.format(self.TABLE)).fetchall())
+
+    def close(self):
+        self._connection.close()
+
+    def _insert(self, rows):
+        with self._write() as connection:
+            connection.executemany(self.INSERT, rows)
+        self.added.set()
+
+    @contextmanager
+    def _write(self):
+        """Runs the with block in a write transaction that is rolled back on errors."""
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._connection
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def __len__(self):
+        return self.stats().get('pending', 0)
@@ -0,0 +1,124 @@
+"""Lease Worker Module."""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class LeaseWorker:
+    """Claims the due rows of a lease table in batches and sends them.
+
+    One worker waits for the next due time of the whole table instead of a thread or queue
+    job sleeping per row. Failed rows are retried with exponential backoff until they run
+    out of attempts.
+
+    Subclasses implement `_send(session, row)` and may override `_session` to share a
+    connection between the rows of a batch.
+    """
+
+    NAME = 'notification-worker'
+
+    def __init__(self, app, table, batch_size=100, max_attempts=5, backoff=2):
+        """Lease Worker Constructor.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+            table {notifications.database.LeaseTable} -- The table to send from.
+
+        Keyword Arguments:
+            batch_size {int} -- The amount of rows claimed at once. (default: {100})
+            max_attempts {int} -- How many times a row is tried before it is marked failed. (default: {5})
+            backoff {float} -- A row is retried after backoff to the power of its attempts seconds. (default: {2})
+        """
+        self.app = app
+        self.table = table
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.counts = {'sent': 0, 'retried': 0, 'failed': 0}
+        self._stopped = threading.Event()
+
+    def drain(self):
+        """Sends rows until no row is due.
+
+        Returns:
+            dict -- How many rows were sent, retried and failed in total.
+        """
+        while True:
+            rows = self.table.claim(self.batch_size)
+            if not rows:
+                return self.counts
+
+            self.run(rows)
+
+    def work(self, sleep=1):
+        """Sends due rows until stopped, sleeping until the next row is due.
+
+        Rows added by this process wake the worker at once. Rows added by other processes
+        are noticed after at most `sleep` seconds.
+
+        Keyword Arguments:
+            sleep {float} -- The longest time to wait between checks. (default: {1})
+        """
+        while not self._stopped.is_set():
+            self.table.added.clear()
+            self.drain()
+
+            due_at = self.table.next_due()
+            wait = sleep if due_at is None else min(max(due_at - time.time(), 0), sleep)
+            self.table.added.wait(wait)
+
+    def start(self, sleep=1):
+        """Runs the work loop on a daemon thread.
+
+        Keyword Arguments:
+            sleep {float} -- The longest time to wait between checks. (default: {1})
+
+        Returns:
+            threading.Thread
+        """
+        thread = threading.Thread(target=self.work, args=(sleep,), daemon=True, name=self.NAME)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stops the work loop after the current batch."""
+        self._stopped.set()
+        self.table.added.set()
+
+    def run(self, rows):
+        """Sends a batch of claimed rows.
+
+        Arguments:
+            rows {list} -- Rows from the claim method of the table.
+        """
+        sent = []
+
+        with self._session() as session:
+            for row in rows:
+                try:
+                    self._send(session, row)
+                except Exception as e:
+                    self._failed(row, e)
+                else:
+                    sent.append(row['id'])
+
+        self.table.done(sent)
+        self.counts['sent'] += len(sent)
+
+    @contextmanager
+    def _session(self):
+        yield None
+
+    def _send(self, session, row):
+        raise NotImplementedError
+
+    def _failed(self, row, exception):
+        error = '{}: {}'.format(exception.__class__.__name__, exception)
+
+        if row['attempts'] >= self.max_attempts:
+            self.table.fail(row['id'], error)
+            self.counts['failed'] += 1
+        else:
+            self.table.retry(row['id'], error, self.backoff ** row['attempts'])
+            self.counts['retried'] += 1
@@ -0,0 +1,154 @@
+"""Notification Table Module."""
+
+import json
+import sqlite3
+import threading
+import time
+
+from notifications.database.RowBuffer import RowBuffer
+
+
+class NotificationTable(RowBuffer):
+    """Stores notifications for in-app display in a SQLite table.
+
+    Rows are ordered by their id so feeds are paged with a keyset cursor instead of an
+    offset. A partial index covers only the unread rows of each notifiable, so counting,
+    listing and marking unread notifications stay fast however many read rows pile up.
+    """
+
+    def __init__(self, path, table='notifications'):
+        """Notification Table Constructor.
+
+        Arguments:
+            path {string} -- The database file. Use :memory: for a private in-memory database.
+
+        Keyword Arguments:
+            table {string} -- The name of the table. (default: {'notifications'})
+        """
+        self.path = path
+        self.table = table
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS {0} ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'notifiable TEXT NOT NULL, '
+            'type TEXT NOT NULL, '
+            'data TEXT NOT NULL, '
+            'read_at REAL, '
+            'created_at REAL NOT NULL)'.format(table))
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS {0}_feed ON {0} (notifiable, id)'.format(table))
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS {0}_unread ON {0} (notifiable, id) '
+            'WHERE read_at IS NULL'.format(table))
+
+    def add(self, notifiable, type, data):
+        """Adds a notification.
+
+        Arguments:
+            notifiable {string} -- Who the notification is for, such as a user id.
+            type {string} -- The kind of notification, usually its class name.
+            data {dict} -- The JSON serializable data to display.
+        """
+        self._append((str(notifiable), type, json.dumps(data), time.time()))
+
+    def feed(self, notifiable, limit=20, before=None, unread=False):
+        """Gets the newest notifications of a notifiable.
+
+        Pass the id of the last notification of a page as before to get the next page.
+
+        Arguments:
+            notifiable {string} -- Who the notifications are for.
+
+        Keyword Arguments:
+            limit {int} -- The maximum amount of notifications to get. (default: {20})
+            before {int} -- Only get notifications older than this id. (default: {None})
+            unread {bool} -- Only get unread notifications. (default: {False})
+
+        Returns:
+            list -- Dictionaries with the id, type, data, read_at and created_at of each notification.
+        """
+        query = 'SELECT id, type, data, read_at, created_at FROM {} WHERE notifiable = ?'.format(self.table)
+        bindings = [str(notifiable)]
+
+        if unread:
+            query += ' AND read_at IS NULL'
+        if before is not None:
+            query += ' AND id < ?'
+            bindings.append(before)
+
+        query += ' ORDER BY id DESC LIMIT ?'
+        bindings.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, bindings).fetchall()
+
+        return [dict(row, data=json.loads(row['data'])) for row in rows]
+
+    def unread(self, notifiable, limit=20, before=None):
+        """Gets the newest unread notifications of a notifiable.
+
+        Returns:
+            list
+        """
+        return self.feed(notifiable, limit, before, unread=True)
+
+    def unread_count(self, notifiable):
+        """Counts the unread notifications of a notifiable.
+
+        Arguments:
+            notifiable {string} -- Who the notifications are for.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM {} WHERE notifiable = ? AND read_at IS NULL'.format(self.table),
+                (str(notifiable),)).fetchone()[0]
+
+    def mark_read(self, notifiable, ids=None):
+        """Marks notifications of a notifiable as read.
+
+        Arguments:
+            notifiable {string} -- Who the notifications are for.
+
+        Keyword Arguments:
+            ids {list} -- The notifications to mark. Marks every unread notification when not given. (default: {None})
+
+        Returns:
+            int -- The amount of notifications that were marked.
+        """
+        query = 'UPDATE {} SET read_at = ? WHERE notifiable = ? AND read_at IS NULL'.format(self.table)
+        bindings = [time.time(), str(notifiable)]
+
+        if ids is not None:
+            ids = list(ids)
+            if not ids:
+                return 0
+            query += ' AND id IN ({})'.format(', '.join('?' * len(ids)))
+            bindings.extend(ids)
+
+        with self._lock:
+            return self._connection.execute(query, bindings).rowcount
+
+    def close(self):
+        self._connection.close()
+
+    def _insert(self, rows):
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                self._connection.executemany(
+                    'INSERT INTO {} (notifiable, type, data, created_at) VALUES (?, ?, ?, ?)'.format(self.table),
+                    rows)
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
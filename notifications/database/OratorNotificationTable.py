@@ -0,0 +1,155 @@
+"""Orator Notification Table Module."""
+
+import json
+import threading
+import time
+
+from notifications.database.RowBuffer import RowBuffer
+
+
+class OratorNotificationTable(RowBuffer):
+    """Stores notifications for in-app display in a table of the application database.
+
+    Queries go through the Orator connection of the application, so every web and worker
+    process shares the same rows. It has the same methods as NotificationTable and pages
+    feeds with the same keyset cursor. Rows are inserted in chunks of CHUNK_SIZE rows so
+    a fan out stays below the bound parameter limit of the database.
+
+    Create the table from a migration of the application:
+
+        def up(self):
+            OratorNotificationTable(self.db).create_table()
+
+        def down(self):
+            self.schema.drop_if_exists('notifications')
+    """
+
+    def __init__(self, db, connection=None, table='notifications'):
+        """Orator Notification Table Constructor.
+
+        Arguments:
+            db {orator.DatabaseManager} -- The database manager, usually DB from config.database.
+
+        Keyword Arguments:
+            connection {string} -- The name of the connection. Uses the default connection when None. (default: {None})
+            table {string} -- The name of the table. (default: {'notifications'})
+        """
+        self.db = db
+        self.connection = connection
+        self.table = table
+        self._local = threading.local()
+
+    def create_table(self):
+        """Creates the table and its indexes if they do not exist yet.
+
+        The (notifiable, id) index serves feeds. The (notifiable, read_at, id) index serves
+        unread feeds, counts and marking read without reading the rows that are already read.
+        """
+        from orator import Schema
+
+        schema = Schema(self.db)
+        if self.connection is not None:
+            schema = schema.connection(self.connection)
+
+        if schema.has_table(self.table):
+            return
+
+        with schema.create(self.table) as table:
+            table.increments('id')
+            table.string('notifiable')
+            table.string('type')
+            table.text('data')
+            table.double('read_at').nullable()
+            table.double('created_at')
+            table.index(['notifiable', 'id'])
+            table.index(['notifiable', 'read_at', 'id'])
+
+    def add(self, notifiable, type, data):
+        """Adds a notification.
+
+        Arguments:
+            notifiable {string} -- Who the notification is for, such as a user id.
+            type {string} -- The kind of notification, usually its class name.
+            data {dict} -- The JSON serializable data to display.
+        """
+        self._append({'notifiable': str(notifiable), 'type': type, 'data': json.dumps(data), 'created_at': time.time()})
+
+    def feed(self, notifiable, limit=20, before=None, unread=False):
+        """Gets the newest notifications of a notifiable.
+
+        Pass the id of the last notification of a page as before to get the next page.
+
+        Arguments:
+            notifiable {string} -- Who the notifications are for.
+
+        Keyword Arguments:
+            limit {int} -- The maximum amount of notifications to get. (default: {20})
+            before {int} -- Only get notifications older than this id. (default: {None})
+            unread {bool} -- Only get unread notifications. (default: {False})
+
+        Returns:
+            list -- Dictionaries with the id, type, data, read_at and created_at of each notification.
+        """
+        query = self._query() \
+            .select('id', 'type', 'data', 'read_at', 'created_at') \
+            .where('notifiable', str(notifiable))
+
+        if unread:
+            query = query.where_null('read_at')
+        if before is not None:
+            query = query.where('id', '<', before)
+
+        rows = query.order_by('id', 'desc').limit(limit).get()
+
+        return [dict(row, data=json.loads(row['data'])) for row in rows]
+
+    def unread(self, notifiable, limit=20, before=None):
+        """Gets the newest unread notifications of a notifiable.
+
+        Returns:
+            list
+        """
+        return self.feed(notifiable, limit, before, unread=True)
+
+    def unread_count(self, notifiable):
+        """Counts the unread notifications of a notifiable.
+
+        Arguments:
+            notifiable {string} -- Who the notifications are for.
+
+        Returns:
+            int
+        """
+        return self._query().where('notifiable', str(notifiable)).where_null('read_at').count()
+
+    def mark_read(self, notifiable, ids=None):
+        """Marks notifications of a notifiable as read.
+
+        Arguments:
+            notifiable {string} -- Who the notifications are for.
+
+        Keyword Arguments:
+            ids {list} -- The notifications to mark. Marks every unread notification when not given. (default: {None})
+
+        Returns:
+            int -- The amount of notifications that were marked.
+        """
+        query = self._query().where('notifiable', str(notifiable)).where_null('read_at')
+
+        if ids is not None:
+            ids = list(ids)
+            if not ids:
+                return 0
+            query = query.where_in('id', ids)
+
+        return query.update({'read_at': time.time()})
+
+    def close(self):
+        pass
+
+    def _query(self):
+        return self.db.connection(self.connection).table(self.table)
+
+    def _insert(self, rows):
+        for start in range(0, len(rows), self.CHUNK_SIZE):
+            self._query().insert(rows[start:start + self.CHUNK_SIZE])
@@ -0,0 +1,81 @@
+"""Row Buffer Module."""
+
+from contextlib import contextmanager
+
+
+class RowBuffer:
+    """Buffers the rows a thread adds inside a transaction so they are inserted together.
+
+    Classes using it set `_local` to a threading.local and implement `_insert(rows)`.
+    Notify flushes the buffer between sends once it holds CHUNK_SIZE rows, so a fan out
+    never keeps more than one chunk in memory.
+    """
+
+    CHUNK_SIZE = 500
+
+    @contextmanager
+    def transaction(self):
+        """Inserts every row added by this thread inside the with block together.
+
+        The rows are inserted when the block ends, also when it raises, so the rows of sends
+        that finished are kept. Sends drop their own rows with discard when they fail.
+        Nested transactions are part of the outermost one.
+        """
+        if self._buffer() is not None:
+            yield self
+            return
+
+        self._local.rows = []
+        try:
+            yield self
+        finally:
+            rows, self._local.rows = self._local.rows, None
+            if rows:
+                self._insert(rows)
+
+    def buffered(self):
+        """Gets the amount of rows this thread buffered.
+
+        Returns:
+            int
+        """
+        rows = self._buffer()
+        return len(rows) if rows is not None else 0
+
+    def discard(self, mark):
+        """Drops the rows this thread buffered after a mark taken with buffered.
+
+        Arguments:
+            mark {int} -- The amount of rows to keep.
+        """
+        rows = self._buffer()
+        if rows is not None:
+            del rows[mark:]
+
+    def flush(self):
+        """Inserts the rows this thread buffered so far.
+
+        The rows leave the buffer before they are inserted, so they are not inserted
+        again when the insert fails.
+
+        Returns:
+            int -- The amount of rows inserted.
+        """
+        rows = self._buffer()
+        if not rows:
+            return 0
+
+        chunk = rows[:]
+        del rows[:]
+        self._insert(chunk)
+        return len(chunk)
+
+    def _append(self, row):
+        rows = self._buffer()
+        if rows is not None:
+            rows.append(row)
+        else:
+            self._insert([row])
+
+    def _buffer(self):
+        return getattr(self._local, 'rows', None)
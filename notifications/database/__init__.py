@@ -0,0 +1,5 @@
+from .LeaseTable import LeaseTable
+from .LeaseWorker import LeaseWorker
+from .NotificationTable import NotificationTable
+from .OratorNotificationTable import OratorNotificationTable
+from .RowBuffer import RowBuffer
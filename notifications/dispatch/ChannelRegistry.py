@@ -0,0 +1,110 @@
+"""Channel Registry Module."""
+
+import importlib
+import threading
+
+
+class ChannelRegistry:
+    """Knows which component sends each notification channel.
+
+    Components are registered by dotted path and only imported the first time their channel
+    is used. Packages add channels through the masonite_notifications.channels entry point
+    group, which is only scanned once a channel is asked for that is not registered.
+    """
+
+    ENTRY_POINTS = 'masonite_notifications.channels'
+
+    _paths = {
+        'mail': 'notifications.components.MailComponent.MailComponent',
+        'slack': 'notifications.components.SlackComponent.SlackComponent',
+        'database': 'notifications.components.DatabaseComponent.DatabaseComponent',
+    }
+    _components = {}
+    _discovered = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, channel, component):
+        """Registers the component that sends a channel.
+
+        Arguments:
+            channel {string} -- The channel such as sms.
+            component {class|string} -- The component class or its dotted path.
+        """
+        with cls._lock:
+            if isinstance(component, str):
+                cls._paths[channel] = component.replace(':', '.')
+                cls._components.pop(channel, None)
+            else:
+                cls._components[channel] = component
+
+    @classmethod
+    def component(cls, channel):
+        """Gets the component of a channel, importing it on first use.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+
+        Returns:
+            class|None -- None when no component sends the channel.
+        """
+        component = cls._components.get(channel)
+        if component is not None:
+            return component
+
+        if channel not in cls._paths and not cls._discovered:
+            cls.discover()
+
+        path = cls._paths.get(channel)
+        if path is None:
+            return None
+
+        module, name = path.rsplit('.', 1)
+        component = getattr(importlib.import_module(module), name)
+
+        with cls._lock:
+            return cls._components.setdefault(channel, component)
+
+    @classmethod
+    def channels(cls):
+        """Gets the name of every registered and installed channel.
+
+        Returns:
+            list
+        """
+        if not cls._discovered:
+            cls.discover()
+
+        return sorted(set(cls._paths) | set(cls._components))
+
+    @classmethod
+    def discover(cls):
+        """Registers the channels of the entry points of every installed package.
+
+        Channels that are already registered are kept.
+        """
+        for channel, path in cls._entry_points():
+            with cls._lock:
+                if channel not in cls._paths and channel not in cls._components:
+                    cls._paths[channel] = path.replace(':', '.')
+
+        cls._discovered = True
+
+    @classmethod
+    def _entry_points(cls):
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            import pkg_resources
+            return [
+                (point.name, '{}.{}'.format(point.module_name, '.'.join(point.attrs)))
+                for point in pkg_resources.iter_entry_points(cls.ENTRY_POINTS)
+            ]
+
+        points = entry_points()
+        if hasattr(points, 'select'):
+            group = points.select(group=cls.ENTRY_POINTS)
+        else:
+            group = points.get(cls.ENTRY_POINTS, [])
+
+        return [(point.name, point.value) for point in group]
@@ -0,0 +1,205 @@
+"""Circuit Breaker Module."""
+
+import threading
+import time
+from collections import deque
+
+
+class CircuitBreaker:
+    """Stops calling an endpoint while too many of its recent calls failed.
+
+    Outcomes are counted in a rolling window split into buckets. Once at least `minimum`
+    calls were made in the window and the share of failures reaches the threshold, the
+    breaker opens and every call is refused without touching the network. After the
+    cooldown the breaker is half open and lets `probes` calls through. It closes again
+    when a probe succeeds and opens for another cooldown when one fails.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    BUCKETS = 10
+
+    def __init__(self, threshold=0.5, minimum=10, window=30, cooldown=30, probes=1):
+        """Circuit Breaker Constructor.
+
+        Keyword Arguments:
+            threshold {float} -- The share of failed calls that opens the breaker. (default: {0.5})
+            minimum {int} -- The amount of calls in the window needed before the breaker can open. (default: {10})
+            window {float} -- Seconds of outcomes the failure rate is computed from. (default: {30})
+            cooldown {float} -- Seconds the breaker stays open before it is probed. (default: {30})
+            probes {int} -- The amount of calls let through at once while half open. (default: {1})
+        """
+        self.threshold = threshold
+        self.minimum = minimum
+        self.window = window
+        self.cooldown = cooldown
+        self.probes = probes
+        self._state = self.CLOSED
+        self._opened_at = 0
+        self._probing = 0
+        self._buckets = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                return self.HALF_OPEN
+
+            return self._state
+
+    def allow(self):
+        """Checks whether a call may be made.
+
+        Returns:
+            bool -- False when the call should be shed.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probing = 0
+
+            if self._probing >= self.probes:
+                return False
+
+            self._probing += 1
+            return True
+
+    def record(self, ok):
+        """Records the outcome of a call that was allowed.
+
+        Arguments:
+            ok {bool} -- Whether the endpoint handled the call.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probing = max(self._probing - 1, 0)
+                if ok:
+                    self._close()
+                else:
+                    self._open(now)
+                return
+
+            if self._state == self.OPEN:
+                return
+
+            bucket = self._bucket(now)
+            bucket[1] += 1
+            if not ok:
+                bucket[2] += 1
+
+            calls = sum(bucket[1] for bucket in self._buckets)
+            failures = sum(bucket[2] for bucket in self._buckets)
+            if calls >= self.minimum and failures >= calls * self.threshold:
+                self._open(now)
+
+    def reset(self):
+        """Closes the breaker and forgets every outcome."""
+        with self._lock:
+            self._close()
+
+    def _bucket(self, now):
+        index = int(now * self.BUCKETS / self.window) if self.window else 0
+        while self._buckets and self._buckets[0][0] <= index - self.BUCKETS:
+            self._buckets.popleft()
+
+        if not self._buckets or self._buckets[-1][0] != index:
+            self._buckets.append([index, 0, 0])
+
+        return self._buckets[-1]
+
+    def _open(self, now):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probing = 0
+        self._buckets.clear()
+
+    def _close(self):
+        self._state = self.CLOSED
+        self._probing = 0
+        self._buckets.clear()
+
+    def __repr__(self):
+        return '<CircuitBreaker {}>'.format(self.state)
+
+
+class CircuitBreakers:
+    """Keeps one circuit breaker per channel and endpoint and knows what to do with shed calls.
+
+    Shed notifications are dropped, pushed to the queue or written to the outbox spool
+    depending on the fallback of their channel.
+    """
+
+    FALLBACKS = ('drop', 'queue', 'spool')
+
+    def __init__(self, threshold=0.5, minimum=10, window=30, cooldown=30, probes=1, fallback='drop'):
+        """Circuit Breakers Constructor.
+
+        Keyword Arguments:
+            fallback {string|dict} -- One of drop, queue or spool, or a dictionary of them per
+                                      channel such as {'mail': 'queue'}. Channels missing from the
+                                      dictionary are dropped. (default: {'drop'})
+
+        Every other keyword argument is passed to each CircuitBreaker.
+        """
+        self.options = {
+            'threshold': threshold, 'minimum': minimum, 'window': window,
+            'cooldown': cooldown, 'probes': probes,
+        }
+        self.fallbacks = fallback
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, channel, endpoint):
+        """Gets the breaker of a channel and endpoint.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+            endpoint {string} -- The endpoint the channel calls such as the mail driver.
+
+        Returns:
+            notifications.dispatch.CircuitBreaker
+        """
+        key = (channel, endpoint)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(**self.options))
+
+        return breaker
+
+    def fallback(self, channel):
+        """Gets what happens to notifications shed from a channel.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+
+        Returns:
+            string -- One of drop, queue or spool.
+        """
+        if isinstance(self.fallbacks, dict):
+            return self.fallbacks.get(channel, 'drop')
+
+        return self.fallbacks
+
+    def states(self):
+        """Gets the state of every breaker.
+
+        Returns:
+            dict -- States keyed by (channel, endpoint).
+        """
+        return {key: breaker.state for key, breaker in list(self._breakers.items())}
+
+    def reset(self):
+        """Closes every breaker."""
+        for breaker in list(self._breakers.values()):
+            breaker.reset()
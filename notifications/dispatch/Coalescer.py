@@ -0,0 +1,183 @@
+"""Coalescer Module."""
+
+import atexit
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from collections import deque
+
+
+class Coalescer:
+    """Merges notifications sent to the same recipient into one digest.
+
+    Notifications that asked for a digest are buffered per channel, notification class and
+    recipient. A buffer is fired as one digest once it holds `size` notifications or its
+    window closes, whichever comes first. The digest is the first notification of the buffer
+    after its {channel}_digest method was called with every buffered notification.
+
+    Windows are closed by one timer thread per coalescer that sleeps until the earliest
+    deadline, and buffers still open when the interpreter exits are fired then.
+
+    Digests fired by a closing window do not reach the sender, so their exceptions are
+    kept in `errors` as (key, exception) pairs, newest last.
+    """
+
+    MAX_ERRORS = 100
+
+    _coalescers = weakref.WeakSet()
+
+    def __init__(self, window=60, size=50):
+        """Coalescer Constructor.
+
+        Keyword Arguments:
+            window {float} -- Seconds a buffer stays open after its first notification.
+                              A window of 0 keeps the buffer open until it is full or flushed. (default: {60})
+            size {int} -- The maximum amount of notifications merged into one digest. (default: {50})
+        """
+        self.window = window
+        self.size = size
+        self._buffers = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._thread = None
+        self.errors = deque(maxlen=self.MAX_ERRORS)
+        self._coalescers.add(self)
+
+    def add(self, via, notification, fire):
+        """Buffers a built notification.
+
+        Arguments:
+            via {string} -- The channel such as mail or slack.
+            notification {object} -- The built notification.
+            fire {callable} -- Called with the channel, the notification class and the digest
+                               when the buffer is fired.
+
+        Returns:
+            any -- Whatever fire returned if the buffer is full, otherwise None.
+        """
+        key = (via, notification.__class__, notification._recipient(via))
+        window = self.window if notification._digest_window is None else notification._digest_window
+        size = notification._digest_size or self.size
+
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = {'notifications': [], 'fire': fire}
+                if window > 0:
+                    self._schedule(time.monotonic() + window, key, buffer)
+
+            buffer['notifications'].append(notification)
+            if len(buffer['notifications']) < size:
+                return None
+
+            self._pop(key)
+
+        return self._fire(key, buffer, notification)
+
+    def flush(self):
+        """Fires every open buffer.
+
+        Returns:
+            list -- Whatever fire returned for each digest.
+        """
+        with self._lock:
+            buffers = [(key, self._pop(key)) for key in list(self._buffers)]
+
+        return [self._fire(key, buffer) for key, buffer in buffers]
+
+    def pending(self):
+        """Gets the amount of notifications waiting in open buffers.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return sum(len(buffer['notifications']) for buffer in self._buffers.values())
+
+    def _pop(self, key):
+        buffer = self._buffers.pop(key)
+
+        # Deadlines of fired buffers are skipped when they come up, drop them once they pile up
+        if len(self._deadlines) > 2 * len(self._buffers) + 64:
+            self._deadlines = [
+                entry for entry in self._deadlines if self._buffers.get(entry[2]) is entry[3]
+            ]
+            heapq.heapify(self._deadlines)
+
+        return buffer
+
+    def _schedule(self, deadline, key, buffer):
+        heapq.heappush(self._deadlines, (deadline, next(self._sequence), key, buffer))
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name='notification-digests')
+            self._thread.start()
+        elif self._deadlines[0][3] is buffer:
+            self._wakeup.notify()
+
+    def _run(self):
+        """Fires the buffers whose window closed until no window is open."""
+        while True:
+            with self._lock:
+                expired = self._expired()
+                while not expired:
+                    if not self._deadlines:
+                        self._thread = None
+                        return
+
+                    self._wakeup.wait(self._deadlines[0][0] - time.monotonic())
+                    expired = self._expired()
+
+            for key, buffer in expired:
+                self._expire(key, buffer)
+
+    def _expired(self):
+        now = time.monotonic()
+        expired = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, key, buffer = heapq.heappop(self._deadlines)
+            # The buffer may have been fired before its window closed
+            if self._buffers.get(key) is buffer:
+                expired.append((key, self._buffers.pop(key)))
+
+        return expired
+
+    def _expire(self, key, buffer):
+        try:
+            self._fire(key, buffer)
+        except Exception as e:
+            self.errors.append((key, e))
+
+    def _fire(self, key, buffer, notification=None):
+        via, notification_class, _ = key
+        notifications = buffer['notifications']
+        digest = notifications[0]
+        digest._rebatch(notification)
+
+        if len(notifications) > 1:
+            getattr(digest, '{}_digest'.format(via))(notifications)
+
+        # The digest is sent as a normal notification
+        digest._digest = False
+
+        return buffer['fire'](via, notification_class, digest)
+
+    @classmethod
+    def _flush_at_exit(cls):
+        """Fires the open buffers of every coalescer so their digests are not lost."""
+        for coalescer in list(cls._coalescers):
+            with coalescer._lock:
+                buffers = [(key, coalescer._pop(key)) for key in list(coalescer._buffers)]
+
+            for key, buffer in buffers:
+                coalescer._expire(key, buffer)
+
+    def __len__(self):
+        return len(self._buffers)
+
+
+atexit.register(Coalescer._flush_at_exit)
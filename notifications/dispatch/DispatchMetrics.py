@@ -0,0 +1,181 @@
+"""Dispatch Metrics Module."""
+
+import bisect
+import threading
+from collections import defaultdict
+
+
+class Histogram:
+    """Latency histogram with fixed bucket boundaries in seconds."""
+
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, buckets=None):
+        self.buckets = tuple(buckets or self.BUCKETS)
+        # One extra bucket counts everything slower than the last boundary
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def percentile(self, percent):
+        """Gets the upper bound of the bucket the given percentile falls in.
+
+        Arguments:
+            percent {float} -- The percentile between 0 and 100.
+
+        Returns:
+            float|None -- None when nothing was observed or it is slower than every bucket.
+        """
+        if not self.count:
+            return None
+
+        target = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else None
+
+    def to_dict(self):
+        return {
+            'buckets': dict(zip(self.buckets, self.counts)),
+            'slower': self.counts[-1],
+            'count': self.count,
+            'sum': self.sum,
+        }
+
+
+class DispatchMetrics:
+    """Counts and times every notification sent through Notify.
+
+    Counters are kept per channel and notification class for sent, failed and dry sends.
+    Latency is split into build time, the notification's own channel method, and transport
+    time, the component's fire method.
+    """
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+        self._before = []
+        self._after = []
+        self._lock = threading.Lock()
+
+    def before(self, callback):
+        """Registers a callback that runs before a notification is built.
+
+        Arguments:
+            callback {callable} -- Called with the channel and the notification class.
+
+        Returns:
+            self
+        """
+        self._before.append(callback)
+        return self
+
+    def after(self, callback):
+        """Registers a callback that runs after a notification was sent, failed or skipped.
+
+        Arguments:
+            callback {callable} -- Called with the notifications.dispatch.DispatchResult.
+
+        Returns:
+            self
+        """
+        self._after.append(callback)
+        return self
+
+    def start(self, channel, notification_class):
+        """Runs the before callbacks.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+            notification_class {class} -- The notification class about to be built.
+        """
+        for callback in self._before:
+            callback(channel, notification_class)
+
+    def record(self, result):
+        """Counts and times a dispatch and runs the after callbacks.
+
+        Arguments:
+            result {notifications.dispatch.DispatchResult} -- The dispatch to record.
+        """
+        key = (result.channel, result.notification_class.__name__)
+
+        with self._lock:
+            self.counters[key + (result.status,)] += 1
+            if result.build_time is not None:
+                self.histograms[key + ('build',)].observe(result.build_time)
+            if result.transport_time is not None:
+                self.histograms[key + ('transport',)].observe(result.transport_time)
+
+        for callback in self._after:
+            callback(result)
+
+    def count(self, status, channel=None, notification_class=None):
+        """Gets a counter, summed over every channel or class that is not given.
+
+        Arguments:
+            status {string} -- One of sent, failed or dry.
+
+        Keyword Arguments:
+            channel {string} -- Only count this channel. (default: {None})
+            notification_class {class|string} -- Only count this notification class. (default: {None})
+
+        Returns:
+            int
+        """
+        if isinstance(notification_class, type):
+            notification_class = notification_class.__name__
+
+        return sum(
+            value for (key_channel, key_class, key_status), value in list(self.counters.items())
+            if key_status == status
+            and channel in (None, key_channel)
+            and notification_class in (None, key_class)
+        )
+
+    def histogram(self, channel, notification_class, phase):
+        """Gets the histogram for a channel, notification class and phase.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+            notification_class {class|string} -- The notification class.
+            phase {string} -- Either build or transport.
+
+        Returns:
+            notifications.dispatch.Histogram
+        """
+        if isinstance(notification_class, type):
+            notification_class = notification_class.__name__
+
+        return self.histograms.get((channel, notification_class, phase), Histogram())
+
+    def snapshot(self):
+        """Gets every counter and histogram as plain dictionaries.
+
+        Returns:
+            dict
+        """
+        with self._lock:
+            return {
+                'counters': {'.'.join(key): value for key, value in self.counters.items()},
+                'histograms': {'.'.join(key): histogram.to_dict() for key, histogram in self.histograms.items()},
+            }
+
+    def reset(self):
+        """Clears every counter and histogram.
+
+        Returns:
+            self
+        """
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+        return self
@@ -0,0 +1,140 @@
+"""Dispatch Plan Module."""
+
+import inspect
+import types
+
+from masonite.exceptions import ContainerError
+from notifications.dispatch.ChannelRegistry import ChannelRegistry
+
+
+class DispatchPlan:
+    """The channel methods of a notification class and their container dependencies.
+
+    Plans are computed once per notification class and channel and cached, so sending a
+    notification does not look methods up by name or inspect their signatures again.
+    Dependencies are still fetched from the container on every call since bindings may change.
+    Notification classes that do not inherit from the registered component of the channel
+    are mixed with it, so the component's builders and helper methods work on them.
+    """
+
+    _plans = {}
+    _classes = {}
+
+    def __init__(self, notification_class, channel):
+        """Dispatch Plan Constructor.
+
+        Arguments:
+            notification_class {class} -- The notification class.
+            channel {string} -- The channel such as mail or slack.
+        """
+        self.notification_class = notification_class
+        self.channel = channel
+        self.composed = self._compose(notification_class, channel)
+        self.build = self._method(channel)
+        self.fire = self._method('fire_{}'.format(channel))
+        self.fire_async = self._method('fire_{}_async'.format(channel))
+
+    @classmethod
+    def get(cls, notification_class, channel):
+        """Gets the cached plan for a notification class and channel.
+
+        Arguments:
+            notification_class {class} -- The notification class.
+            channel {string} -- The channel such as mail or slack.
+
+        Returns:
+            notifications.dispatch.DispatchPlan
+        """
+        key = (notification_class, channel)
+        plan = cls._plans.get(key)
+        if plan is None:
+            plan = cls._plans[key] = cls(notification_class, channel)
+
+        return plan
+
+    @classmethod
+    def forget(cls):
+        """Clears every cached plan."""
+        cls._plans.clear()
+        cls._classes.clear()
+
+    @classmethod
+    def _compose(cls, notification_class, channel):
+        """Gets the notification class mixed with the registered component of the channel.
+
+        Returns:
+            class -- The notification class itself when it already inherits from the component.
+        """
+        component = ChannelRegistry.component(channel)
+        if component is None or issubclass(notification_class, component):
+            return notification_class
+
+        key = (notification_class, component)
+        composed = cls._classes.get(key)
+        if composed is None:
+            try:
+                composed = type(notification_class.__name__, (notification_class, component), {
+                    '__module__': notification_class.__module__,
+                    '__qualname__': notification_class.__qualname__,
+                })
+            except TypeError:
+                # The bases have no consistent method resolution order
+                composed = notification_class
+            composed = cls._classes.setdefault(key, composed)
+
+        return composed
+
+    def _method(self, name):
+        """Looks up a method and the parameters it needs from the container.
+
+        Returns:
+            tuple -- The method name, the function and its parameters. The function and
+                     parameters are None when the method can not be planned and has to be
+                     resolved through the container on every call.
+        """
+        function = getattr(self.composed, name, None)
+
+        if not inspect.isfunction(function):
+            return (name, None, None)
+
+        # Drop self since the function is called with the notification
+        return (name, function, list(inspect.signature(function).parameters.values())[1:])
+
+    def call(self, app, notification, method):
+        """Calls a planned method on a notification with its dependencies from the container.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+            notification {object} -- The notification instance.
+            method {tuple} -- One of build, fire or fire_async.
+
+        Returns:
+            any -- Whatever the method returned.
+        """
+        name, function, parameters = method
+        if function is None or name in notification.__dict__:
+            return app.resolve(getattr(notification, name))
+
+        # The lookups are private to the container, resolve as usual on containers without them
+        if parameters and not self._can_find(app):
+            return app.resolve(types.MethodType(function, notification))
+
+        arguments = []
+        for parameter in parameters:
+            if parameter.annotation is not inspect.Parameter.empty:
+                arguments.append(app._find_annotated_parameter(parameter))
+            elif getattr(app, 'resolve_parameters', False):
+                arguments.append(app._find_parameter(parameter))
+            else:
+                # Let the container raise its usual error
+                return app.resolve(types.MethodType(function, notification))
+
+        try:
+            return function(notification, *arguments)
+        except TypeError as e:
+            # Raise what the container raises for the same call
+            raise ContainerError(str(e)) from e
+
+    @staticmethod
+    def _can_find(app):
+        return hasattr(app, '_find_annotated_parameter') and hasattr(app, '_find_parameter')
@@ -0,0 +1,198 @@
+"""Dispatch Report Module."""
+
+from notifications.exceptions import NotificationFailed
+
+
+class DispatchResult:
+    """The outcome of sending one notification through one channel."""
+
+    def __init__(self, channel, notification_class, notification=None, exception=None, result=None):
+        """Dispatch Result Constructor.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+            notification_class {class} -- The notification class that was sent.
+
+        Keyword Arguments:
+            notification {object} -- The notification instance if it could be built. (default: {None})
+            exception {Exception} -- The exception raised while sending. (default: {None})
+            result {any} -- Whatever the channel's fire method returned. (default: {None})
+        """
+        self.channel = channel
+        self.notification_class = notification_class
+        self.notification = notification
+        self.exception = exception
+        self.result = result
+        self.build_time = None
+        self.transport_time = None
+        self.coalesced = False
+        self.duplicate = False
+        self.shed = None
+        self.scheduled = None
+
+    @property
+    def ok(self):
+        """Whether sending did not raise and the channel did not report a failed outcome
+        such as a Slack response that is not ok.
+
+        Returns:
+            bool
+        """
+        return self.exception is None and getattr(self.result, 'ok', True) is not False
+
+    @property
+    def pending(self):
+        """Whether the outcome is still a future, such as a Slack webhook message waiting
+        for its batch to be posted.
+
+        Returns:
+            bool
+        """
+        return hasattr(self.result, 'add_done_callback')
+
+    @property
+    def delivered(self):
+        """Whether the notification was sent or handed to the queue or outbox.
+
+        Returns:
+            bool
+        """
+        return self.ok and not self.pending and self.shed != 'drop'
+
+    @property
+    def error(self):
+        """Gets why sending failed.
+
+        Returns:
+            Exception|string|None
+        """
+        if self.exception is not None:
+            return self.exception
+
+        if not self.ok:
+            return getattr(self.result, 'error', None) or 'failed'
+
+    def when_settled(self, callback):
+        """Calls back once the outcome of the send is known.
+
+        A pending result is replaced by the outcome of its future, or the exception of the
+        future is recorded, before the callback runs. Other results call back at once.
+
+        Arguments:
+            callback {callable} -- Called with this result.
+        """
+        future = self.result
+        if not self.pending:
+            callback(self)
+            return
+
+        def settle(future):
+            if self.result is future:
+                try:
+                    self.result = future.result()
+                except Exception as e:
+                    self.exception = e
+            callback(self)
+
+        future.add_done_callback(settle)
+
+    @property
+    def status(self):
+        """Whether the notification was sent, failed, was dry, was buffered for a digest,
+        was skipped as a duplicate, was shed by an open circuit breaker or was scheduled for later.
+
+        Returns:
+            string
+        """
+        if not self.ok:
+            return 'failed'
+
+        if self.pending:
+            return 'pending'
+
+        if self.notification is not None and not getattr(self.notification, '_run', True):
+            return 'dry'
+
+        if self.duplicate:
+            return 'duplicate'
+
+        if self.coalesced:
+            return 'coalesced'
+
+        if self.shed:
+            return 'shed'
+
+        if self.scheduled is not None:
+            return 'scheduled'
+
+        return 'sent'
+
+    def __repr__(self):
+        return '<DispatchResult {}:{} {}>'.format(
+            self.channel, self.notification_class.__name__,
+            'ok' if self.ok else repr(self.error))
+
+
+class DispatchReport:
+    """Collects the result of every notification and channel pair of a send."""
+
+    def __init__(self):
+        self.results = []
+
+    def append(self, result):
+        """Records an existing result.
+
+        Arguments:
+            result {notifications.dispatch.DispatchResult} -- The result to record.
+
+        Returns:
+            notifications.dispatch.DispatchResult
+        """
+        self.results.append(result)
+        return result
+
+    def add(self, channel, notification_class, notification=None, exception=None, result=None):
+        """Records the result of a notification and channel pair.
+
+        Returns:
+            notifications.dispatch.DispatchResult
+        """
+        dispatch_result = DispatchResult(channel, notification_class, notification, exception, result)
+        self.results.append(dispatch_result)
+        return dispatch_result
+
+    @property
+    def succeeded(self):
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self):
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def raise_first(self):
+        """Raises the exception of the first failed result if there is one.
+
+        Raises:
+            NotificationFailed -- Thrown for a failed outcome that did not raise.
+
+        Returns:
+            self
+        """
+        for result in self.failed:
+            if result.exception is not None:
+                raise result.exception
+
+            raise NotificationFailed('The {} notification failed on {} with {}'.format(
+                result.notification_class.__name__, result.channel, result.error))
+
+        return self
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
@@ -0,0 +1,208 @@
+"""Lane Dispatcher Module."""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+class Lane:
+    """A bounded queue of sends with its own weight and concurrency budget."""
+
+    def __init__(self, name, weight=1, concurrency=1, size=1000):
+        """Lane Constructor.
+
+        Arguments:
+            name {string} -- The lane such as urgent or bulk.
+
+        Keyword Arguments:
+            weight {int} -- The share of free workers the lane gets while other lanes are busy. (default: {1})
+            concurrency {int} -- The maximum amount of sends of the lane running at once. (default: {1})
+            size {int} -- The maximum amount of waiting sends. Submitting to a full lane blocks. (default: {1000})
+        """
+        self.name = name
+        self.weight = weight
+        self.concurrency = concurrency
+        self.size = size
+        self.active = 0
+        self.done = 0
+        self.current = 0
+        self.items = deque()
+
+    @property
+    def ready(self):
+        return bool(self.items) and self.active < self.concurrency
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return '<Lane {} {} waiting {} active>'.format(self.name, len(self.items), self.active)
+
+
+class LaneDispatcher:
+    """Runs sends on a shared pool of workers, split into priority lanes.
+
+    Each lane is bounded and may only run `concurrency` sends at once, so a bulk fan out
+    can never take the workers reserved for urgent notifications. Free workers pick the
+    next lane by smooth weighted round robin between the lanes that have work and budget.
+    Workers are started on the first submit.
+    """
+
+    LANES = {
+        'urgent': {'weight': 8, 'concurrency': 8, 'size': 1000},
+        'default': {'weight': 4, 'concurrency': 4, 'size': 5000},
+        'bulk': {'weight': 1, 'concurrency': 2, 'size': 10000},
+    }
+
+    def __init__(self, lanes=None, workers=None, default='default'):
+        """Lane Dispatcher Constructor.
+
+        Keyword Arguments:
+            lanes {dict} -- Lane options keyed by lane name. (default: {LANES})
+            workers {int} -- The size of the shared pool. Defaults to the sum of the lane
+                             budgets so every lane can always use its full budget. (default: {None})
+            default {string} -- The lane used for unknown lane names. (default: {'default'})
+        """
+        self.lanes = {
+            name: Lane(name, **options) for name, options in (lanes or self.LANES).items()
+        }
+        self.default = default if default in self.lanes else next(iter(self.lanes))
+        self.workers = workers or sum(lane.concurrency for lane in self.lanes.values())
+        self._threads = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def lane(self, name):
+        """Gets a lane by name, falling back to the default lane.
+
+        Arguments:
+            name {string|None} -- The lane such as urgent or bulk.
+
+        Returns:
+            notifications.dispatch.Lane
+        """
+        return self.lanes[name if name in self.lanes else self.default]
+
+    def submit(self, lane, function, *args, timeout=None, **kwargs):
+        """Adds a send to a lane.
+
+        Arguments:
+            lane {string} -- The lane such as urgent or bulk.
+            function {callable} -- The send to run.
+
+        Keyword Arguments:
+            timeout {float} -- Seconds to wait while the lane is full. (default: {None})
+
+        Raises:
+            queue.Full -- When the lane is still full after the timeout.
+
+        Returns:
+            concurrent.futures.Future
+        """
+        lane = self.lane(lane)
+        future = Future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The lane dispatcher was shut down')
+
+            while len(lane.items) >= lane.size:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Full('The {} lane is full'.format(lane.name))
+                self._condition.wait(remaining)
+
+            lane.items.append((future, function, args, kwargs))
+            self._start()
+            self._condition.notify_all()
+
+        return future
+
+    def stats(self):
+        """Gets the amount of waiting, running and finished sends of every lane.
+
+        Returns:
+            dict
+        """
+        with self._condition:
+            return {
+                name: {'waiting': len(lane.items), 'active': lane.active, 'done': lane.done}
+                for name, lane in self.lanes.items()
+            }
+
+    def shutdown(self, wait=True):
+        """Stops the workers once every waiting send ran.
+
+        Keyword Arguments:
+            wait {bool} -- Whether to wait for the workers to stop. (default: {True})
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _start(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, daemon=True,
+                                      name='notification-lane-{}'.format(len(self._threads)))
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                lane = self._pick()
+                while lane is None:
+                    if self._closed and not any(waiting.items for waiting in self.lanes.values()):
+                        return
+                    self._condition.wait()
+                    lane = self._pick()
+
+                future, function, args, kwargs = lane.items.popleft()
+                lane.active += 1
+                self._condition.notify_all()
+
+            result = exception = None
+            running = future.set_running_or_notify_cancel()
+            if running:
+                try:
+                    result = function(*args, **kwargs)
+                except BaseException as e:
+                    exception = e
+
+            # Free the budget before the caller sees the result
+            with self._condition:
+                lane.active -= 1
+                lane.done += 1
+                self._condition.notify_all()
+
+            if running:
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+
+    def _pick(self):
+        """Picks the next lane by smooth weighted round robin between the ready lanes.
+
+        Returns:
+            notifications.dispatch.Lane|None
+        """
+        ready = [lane for lane in self.lanes.values() if lane.ready]
+        if not ready:
+            return None
+
+        total = 0
+        for lane in ready:
+            lane.current += lane.weight
+            total += lane.weight
+
+        chosen = max(ready, key=lambda lane: lane.current)
+        chosen.current -= total
+        return chosen
@@ -0,0 +1,7 @@
+from .ChannelRegistry import ChannelRegistry
+from .CircuitBreaker import CircuitBreaker, CircuitBreakers
+from .Coalescer import Coalescer
+from .DispatchMetrics import DispatchMetrics, Histogram
+from .DispatchPlan import DispatchPlan
+from .DispatchReport import DispatchReport, DispatchResult
+from .LaneDispatcher import Lane, LaneDispatcher
@@ -4,3 +4,11 @@ class InvalidNotificationType(Exception):
 
 class SlackChannelNotFound(Exception):
     pass
+
+
+class SlackApiError(Exception):
+    pass
+
+
+class NotificationFailed(Exception):
+    pass
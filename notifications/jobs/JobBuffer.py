@@ -0,0 +1,74 @@
+"""Job Buffer Module."""
+
+import threading
+
+from masonite import Queue
+from notifications.jobs.MailJob import MailBatchJob
+
+
+class JobBuffer:
+    """Collects mail jobs during a fan out and pushes them to the queue in chunks.
+
+    Each chunk is pushed as a single MailBatchJob so a fan out costs one queue
+    operation per chunk instead of one per email. Jobs for different queue channels
+    are chunked separately.
+    """
+
+    def __init__(self, app, chunk_size=500):
+        """Job Buffer Constructor.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+
+        Keyword Arguments:
+            chunk_size {int} -- The amount of emails per queue job. (default: {500})
+        """
+        self.app = app
+        self.chunk_size = chunk_size
+        self.pushed = 0
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def append(self, job, channel=None):
+        """Adds a job and pushes a chunk once the buffer is full.
+
+        Arguments:
+            job {notifications.jobs.MailJob} -- The job to add.
+
+        Keyword Arguments:
+            channel {string} -- The queue channel to push the job to. (default: {None})
+        """
+        with self._lock:
+            jobs = self._jobs.setdefault(channel, [])
+            jobs.append(job)
+            if len(jobs) < self.chunk_size:
+                return
+
+            del self._jobs[channel]
+
+        self._push(jobs, channel)
+
+    def flush(self):
+        """Pushes every buffered job.
+
+        Returns:
+            self
+        """
+        with self._lock:
+            chunks, self._jobs = self._jobs, {}
+
+        for channel, jobs in chunks.items():
+            self._push(jobs, channel)
+
+        return self
+
+    def _push(self, jobs, channel=None):
+        job = MailBatchJob(jobs, container=self.app, channel=channel)
+        if channel:
+            self.app.make(Queue).push(job, channel=channel)
+        else:
+            self.app.make(Queue).push(job)
+        self.pushed += 1
+
+    def __len__(self):
+        return sum(len(jobs) for jobs in self._jobs.values())
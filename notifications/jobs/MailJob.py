@@ -0,0 +1,220 @@
+"""Mail Job Module."""
+
+import json
+import zlib
+
+from masonite import Queue
+from masonite.queues import Queueable
+from notifications.exceptions import NotificationFailed
+from notifications.settings import setting
+
+
+class MailJob(Queueable):
+    """A serializable queue job for one email.
+
+    Only the driver name, recipient, subject and body are sent across the queue boundary.
+    Views are rendered before the job is queued since they may rely on view composers and
+    shared variables of the web process. Snippets of a body that was not rendered yet are
+    sent as instructions and rendered by the worker.
+    Bodies can be compressed with zlib to keep large emails small on the queue.
+    """
+
+    def __init__(self, driver, to, subject, body, compress_over=None, container=None):
+        """Mail Job Constructor.
+
+        Arguments:
+            driver {string} -- The name of the mail driver.
+            to {string} -- The email address to send to.
+            subject {string} -- The subject of the email.
+            body {string|notifications.components.MailBody} -- The HTML body of the email.
+
+        Keyword Arguments:
+            compress_over {int} -- Compress bodies longer than this many characters. (default: {None})
+            container {masonite.app.App} -- The container used when the job runs in process.
+                                            It is never serialized. (default: {None})
+        """
+        self.driver = driver
+        self.to = to
+        self.subject = subject
+        self.container = container
+        self.deferred = False
+
+        if not isinstance(body, str):
+            body = self._serialize(body)
+
+        self.compressed = compress_over is not None and len(body) > compress_over
+        self.body = zlib.compress(body.encode('utf-8')) if self.compressed else body
+
+    def _serialize(self, body):
+        """Turns a mail body into its JSON instructions, or renders it when that is not possible.
+
+        Arguments:
+            body {notifications.components.MailBody} -- The body of the email.
+
+        Returns:
+            string
+        """
+        if not body.rendered:
+            instructions = body.instructions
+            if any(kind == 'view' for kind, _, _ in instructions):
+                instructions = body.prerender(self._container())
+
+            if all(kind == 'text' for kind, _, _ in instructions):
+                return ''.join(text for _, text, _ in instructions)
+
+            try:
+                serialized = json.dumps(instructions)
+            except TypeError:
+                # Snippets were given variables that can not cross the queue boundary
+                pass
+            else:
+                self.deferred = True
+                return serialized
+
+        return ''.join(body.render(self._container()))
+
+    def message(self):
+        """Gets the body of the email, rendering it if it was deferred.
+
+        Returns:
+            string
+        """
+        body = self.body
+        if self.compressed:
+            body = zlib.decompress(body).decode('utf-8')
+
+        if self.deferred:
+            from notifications.components import MailBody
+            return ''.join(MailBody(json.loads(body)).render(self._container()))
+
+        return body
+
+    def handle(self):
+        """Sends the email."""
+        self._container().make('Mail') \
+            .driver(self.driver) \
+            .to(self.to) \
+            .subject(self.subject) \
+            .send(self.message())
+
+    def _container(self):
+        if self.container is not None:
+            return self.container
+
+        # Queue workers run outside the request so fetch the application container
+        from wsgi import container
+        return container
+
+    def to_dict(self):
+        """Gets the payload as a dictionary.
+
+        Returns:
+            dict
+        """
+        return {
+            'driver': self.driver,
+            'to': self.to,
+            'subject': self.subject,
+            'body': self.body,
+            'compressed': self.compressed,
+            'deferred': self.deferred,
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        """Creates a job from a dictionary created by to_dict.
+
+        Arguments:
+            payload {dict} -- The payload.
+
+        Returns:
+            notifications.jobs.MailJob
+        """
+        job = cls(payload['driver'], payload['to'], payload['subject'], '')
+        job.body = payload['body']
+        job.compressed = payload['compressed']
+        job.deferred = payload.get('deferred', False)
+        return job
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+        self.container = None
+
+    def __repr__(self):
+        return '<MailJob {} {}>'.format(self.driver, self.to)
+
+
+class MailBatchJob(Queueable):
+    """Sends many mail jobs as a single queue job over one mail connection.
+
+    An email that fails does not stop the rest of the batch. The failed emails are pushed
+    back to the queue as a new batch until they were tried `max_attempts` times.
+    """
+
+    def __init__(self, jobs, container=None, channel=None, attempts=1):
+        """Mail Batch Job Constructor.
+
+        Arguments:
+            jobs {list} -- The notifications.jobs.MailJob instances to send.
+
+        Keyword Arguments:
+            container {masonite.app.App} -- The container used when the job runs in process.
+                                            It is never serialized. (default: {None})
+            channel {string} -- The queue channel failed emails are pushed back to. (default: {None})
+            attempts {int} -- How many times these emails were tried, counting this one. (default: {1})
+        """
+        self.jobs = list(jobs)
+        self.container = container
+        self.channel = channel
+        self.attempts = attempts
+
+    def handle(self):
+        """Sends every email over a shared mail session.
+
+        Raises:
+            NotificationFailed -- When emails still fail on their last attempt.
+        """
+        from notifications.transports import MailSession
+
+        container = self.container
+        if container is None:
+            from wsgi import container
+
+        failed = []
+        with MailSession(container) as session:
+            for job in self.jobs:
+                try:
+                    session.send(job.driver, job.to, job.subject, job.message())
+                except Exception as e:
+                    failed.append((job, e))
+
+        if not failed:
+            return
+
+        if self.attempts < setting('queue', 'max_attempts', 3):
+            retry = MailBatchJob([job for job, _ in failed], container=self.container,
+                                 channel=self.channel, attempts=self.attempts + 1)
+            if self.channel:
+                container.make(Queue).push(retry, channel=self.channel)
+            else:
+                container.make(Queue).push(retry)
+            return
+
+        raise NotificationFailed('{} of {} emails failed after {} attempts, the first to {} with {}'.format(
+            len(failed), len(self.jobs), self.attempts, failed[0][0].to, failed[0][1]))
+
+    def __getstate__(self):
+        return {'jobs': self.jobs, 'channel': self.channel, 'attempts': self.attempts}
+
+    def __setstate__(self, state):
+        self.jobs = state['jobs']
+        self.channel = state.get('channel')
+        self.attempts = state.get('attempts', 1)
+        self.container = None
+
+    def __len__(self):
+        return len(self.jobs)
@@ -0,0 +1,2 @@
+from .JobBuffer import JobBuffer
+from .MailJob import MailBatchJob, MailJob
@@ -0,0 +1,48 @@
+"""Outbox Module."""
+
+import json
+import time
+
+from notifications.database.LeaseTable import LeaseTable
+
+
+class Outbox(LeaseTable):
+    """Stores rendered notifications in a SQLite table until a worker delivers them.
+
+    Rows added inside a transaction are written together when the transaction ends.
+    Workers claim rows by leasing them. A row that is not marked done or retried before
+    its lease runs out is claimed again, so rows survive a crashed worker.
+    """
+
+    TABLE = 'notification_outbox'
+    DUE = 'available_at'
+    COLUMNS = ('channel', 'payload')
+    PAYLOAD = 'payload'
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS notification_outbox ('
+        'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+        'channel TEXT NOT NULL, '
+        'payload TEXT NOT NULL, '
+        "status TEXT NOT NULL DEFAULT 'pending', "
+        'attempts INTEGER NOT NULL DEFAULT 0, '
+        'available_at REAL NOT NULL, '
+        'claim TEXT, '
+        'error TEXT, '
+        'created_at REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS notification_outbox_available '
+        'ON notification_outbox (status, available_at)',
+    )
+    INSERT = (
+        'INSERT INTO notification_outbox (channel, payload, available_at, created_at) '
+        'VALUES (?, ?, ?, ?)'
+    )
+
+    def add(self, channel, payload):
+        """Adds a rendered notification.
+
+        Arguments:
+            channel {string} -- The channel such as mail or slack.
+            payload {dict} -- The JSON serializable payload the worker sends.
+        """
+        now = time.time()
+        self._append((channel, json.dumps(payload), now, now))
@@ -0,0 +1,57 @@
+"""Outbox Worker Module."""
+
+from notifications.components import SlackComponent
+from notifications.database.LeaseWorker import LeaseWorker
+from notifications.transports import MailSession, SlackFile
+
+
+class OutboxWorker(LeaseWorker):
+    """Delivers the rows of an outbox in batches.
+
+    Each batch sends its emails over one mail session and its Slack messages through
+    the shared Slack scheduler. Failed rows are retried with exponential backoff until
+    they run out of attempts.
+    """
+
+    NAME = 'notification-outbox'
+
+    def __init__(self, app, outbox, batch_size=100, max_attempts=5, backoff=2):
+        """Outbox Worker Constructor.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+            outbox {notifications.outbox.Outbox} -- The outbox to drain.
+
+        Keyword Arguments:
+            batch_size {int} -- The amount of rows claimed at once. (default: {100})
+            max_attempts {int} -- How many times a row is tried before it is marked failed. (default: {5})
+            backoff {float} -- A row is retried after backoff to the power of its attempts seconds. (default: {2})
+        """
+        super().__init__(app, outbox, batch_size, max_attempts, backoff)
+        self.outbox = outbox
+
+    def _session(self):
+        return MailSession(self.app)
+
+    def _send(self, session, row):
+        payload = row['payload']
+
+        if row['channel'] == 'mail':
+            session.send(payload['driver'], payload['to'], payload['subject'], payload['body'])
+        elif row['channel'] == 'slack' and 'webhook' in payload:
+            outcome = self._scheduler().post_webhook(payload['webhook'], payload['body'])
+            if not outcome.ok:
+                raise Exception('Slack responded with {}'.format(outcome.error))
+        elif row['channel'] == 'slack':
+            files = {'file': SlackFile.open(payload['file'])} if payload.get('file') else None
+            outcome = self._scheduler().post(payload['method'], payload['data'], files)
+            if not outcome.ok:
+                raise Exception('Slack responded with {}'.format(outcome.error))
+        else:
+            raise Exception('The outbox can not deliver the {} channel'.format(row['channel']))
+
+    def _scheduler(self):
+        if self.app.has('SlackScheduler'):
+            return self.app.make('SlackScheduler')
+
+        return SlackComponent._defaults()._default_scheduler
@@ -0,0 +1,2 @@
+from .Outbox import Outbox
+from .OutboxWorker import OutboxWorker
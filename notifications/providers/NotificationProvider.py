@@ -1,17 +1,106 @@
 """ A NotificationProvider Service Provider """
 
+import pydoc
+
 from masonite.provider import ServiceProvider
 from notifications import Notify
-from notifications.commands import NotificationCommand
+from notifications.cache import ChannelCache, DedupeStore, SnippetCache, SqliteDedupeStore
+from notifications.commands import NotificationCommand, OutboxCommand, ScheduleCommand
+from notifications.dispatch import ChannelRegistry, CircuitBreakers, Coalescer, DispatchMetrics, LaneDispatcher
+from notifications.outbox import Outbox
+from notifications.settings import setting
+from notifications.transports import SlackScheduler, SlackTransport, SlackWebhookBatcher
 
 
 class NotificationProvider(ServiceProvider):
 
     wsgi = False
 
+    # Callbacks registered on the dispatch metrics. Before hooks receive the channel
+    # and notification class, after hooks receive the DispatchResult.
+    before_hooks = []
+    after_hooks = []
+
     def register(self):
+        for channel, component in setting('dispatch', 'channels', {}).items():
+            ChannelRegistry.register(channel, component)
+
         self.app.bind('Notify', Notify(self.app))
+        self.app.bind('NotificationMetrics', DispatchMetrics())
         self.app.bind('NotificationCommand', NotificationCommand())
+        self.app.bind('NotificationOutboxCommand', OutboxCommand())
+        self.app.bind('NotificationScheduleCommand', ScheduleCommand())
+        self.app.bind('NotificationLanes', LaneDispatcher(
+            lanes=setting('priority', 'lanes', None),
+            workers=setting('priority', 'workers', None),
+        ))
+        self.app.bind('NotificationCoalescer', Coalescer(
+            window=setting('digest', 'window', 60),
+            size=setting('digest', 'size', 50),
+        ))
+        self.app.bind('SlackTransport', SlackTransport(
+            base_url=setting('slack', 'base_url', 'https://slack.com/api'),
+            pool_size=setting('slack', 'pool_size', 10),
+            timeout=setting('slack', 'timeout', 10),
+            retries=setting('slack', 'retries', 3),
+        ))
+        self.app.bind('SlackScheduler', SlackScheduler(
+            self.app.make('SlackTransport'),
+            max_retries=setting('slack', 'max_retries', 3),
+            channel_rate=setting('slack', 'channel_rate', 1),
+            channel_burst=setting('slack', 'channel_burst', 3),
+            bucket_cache_size=setting('slack', 'bucket_cache_size', 1024),
+        ))
+        self.app.bind('SlackWebhookBatcher', SlackWebhookBatcher(
+            self.app.make('SlackScheduler'),
+            window=setting('slack', 'webhook_window', 0.5),
+        ))
+        self.app.bind('SlackChannelCache', ChannelCache(
+            ttl=setting('slack', 'channel_cache_ttl', 300),
+            size=setting('slack', 'channel_cache_size', 128),
+            scheduler=self.app.make('SlackScheduler'),
+        ))
+        self.app.bind('NotificationDedupeStore', self._dedupe_store())
+        if setting('breaker', 'enabled', False):
+            self.app.bind('NotificationBreakers', CircuitBreakers(
+                threshold=setting('breaker', 'threshold', 0.5),
+                minimum=setting('breaker', 'minimum', 10),
+                window=setting('breaker', 'window', 30),
+                cooldown=setting('breaker', 'cooldown', 30),
+                probes=setting('breaker', 'probes', 1),
+                fallback=setting('breaker', 'fallback', 'drop'),
+            ))
+        if setting('outbox', 'enabled', False):
+            self.app.bind('NotificationOutbox', Outbox(
+                setting('outbox', 'path', 'storage/notifications.sqlite3'),
+                lease=setting('outbox', 'lease', 60),
+            ))
+        self.app.bind('MailSnippetCache', SnippetCache(
+            size=setting('mail', 'snippet_cache_size', 32),
+            debug=bool(pydoc.locate('config.application.DEBUG')),
+        ))
+
+    def _dedupe_store(self):
+        if setting('dedupe', 'store', 'memory') == 'sqlite':
+            return SqliteDedupeStore(
+                setting('dedupe', 'path', 'storage/notifications.sqlite3'),
+                ttl=setting('dedupe', 'ttl', 86400),
+            )
+
+        return DedupeStore(
+            ttl=setting('dedupe', 'ttl', 86400),
+            size=setting('dedupe', 'size', 10000),
+        )
 
     def boot(self):
-        pass
+        metrics = self.app.make('NotificationMetrics')
+        for hook in self.before_hooks:
+            metrics.before(hook)
+        for hook in self.after_hooks:
+            metrics.after(hook)
+
+        # Walk the channel list of each configured token once so the first
+        # notifications do not pay for the lookup.
+        tokens = setting('slack', 'warm_tokens', [])
+        if tokens:
+            self.app.make('SlackChannelCache').warm(*tokens)
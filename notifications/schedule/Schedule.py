@@ -0,0 +1,74 @@
+"""Schedule Module."""
+
+import json
+import time
+
+from notifications.database.LeaseTable import LeaseTable
+
+
+class Schedule(LeaseTable):
+    """Stores notifications that are sent later in a SQLite table.
+
+    Rows are ordered by an index on their due time, so adding a row, finding the next due
+    row and cancelling rows by key stay O(log n) with millions of pending rows. Workers
+    claim due rows by leasing them, so rows survive restarts and crashed workers.
+    """
+
+    TABLE = 'notification_schedule'
+    DUE = 'due_at'
+    COLUMNS = ('channel', 'notification', 'options')
+    PAYLOAD = 'options'
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS notification_schedule ('
+        'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+        'key TEXT, '
+        'channel TEXT NOT NULL, '
+        'notification TEXT NOT NULL, '
+        'options TEXT NOT NULL, '
+        "status TEXT NOT NULL DEFAULT 'pending', "
+        'attempts INTEGER NOT NULL DEFAULT 0, '
+        'due_at REAL NOT NULL, '
+        'claim TEXT, '
+        'error TEXT, '
+        'created_at REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS notification_schedule_due '
+        'ON notification_schedule (status, due_at)',
+        'CREATE UNIQUE INDEX IF NOT EXISTS notification_schedule_key '
+        'ON notification_schedule (key, channel, notification)',
+    )
+    INSERT = (
+        'INSERT OR REPLACE INTO notification_schedule '
+        '(key, channel, notification, options, due_at, created_at) '
+        'VALUES (?, ?, ?, ?, ?, ?)'
+    )
+
+    def add(self, due_at, channel, notification, options, key=None):
+        """Adds a notification to send later.
+
+        A row with the same key, channel and notification replaces the pending one, so
+        scheduling a reminder again moves it instead of sending it twice.
+
+        Arguments:
+            due_at {float} -- The UNIX timestamp to send the notification at.
+            channel {string} -- The channel such as mail or slack.
+            notification {string} -- The dotted path of the notification class.
+            options {dict} -- The JSON serializable options of the send.
+
+        Keyword Arguments:
+            key {string} -- The key to cancel the notification by. (default: {None})
+        """
+        self._append((key, channel, notification, json.dumps(options), due_at, time.time()))
+
+    def cancel(self, key):
+        """Removes every pending notification scheduled with a key.
+
+        Arguments:
+            key {string} -- The key given when scheduling.
+
+        Returns:
+            int -- The amount of cancelled notifications.
+        """
+        with self._write() as connection:
+            return connection.execute(
+                "DELETE FROM notification_schedule WHERE key = ? AND status = 'pending' AND claim IS NULL",
+                (key,)).rowcount
@@ -0,0 +1,51 @@
+"""Schedule Worker Module."""
+
+import pydoc
+from contextlib import contextmanager
+
+from notifications.database.LeaseWorker import LeaseWorker
+from notifications.exceptions import NotificationFailed
+
+
+class ScheduleWorker(LeaseWorker):
+    """Sends scheduled notifications once they are due.
+
+    One worker waits for the next due time of the whole schedule instead of a thread or
+    queue job sleeping per notification. Failed sends are retried with exponential backoff
+    until they run out of attempts.
+    """
+
+    NAME = 'notification-schedule'
+
+    def __init__(self, app, schedule, batch_size=100, max_attempts=5, backoff=2):
+        """Schedule Worker Constructor.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+            schedule {notifications.schedule.Schedule} -- The schedule to send from.
+
+        Keyword Arguments:
+            batch_size {int} -- The amount of rows claimed at once. (default: {100})
+            max_attempts {int} -- How many times a row is tried before it is marked failed. (default: {5})
+            backoff {float} -- A row is retried after backoff to the power of its attempts seconds. (default: {2})
+        """
+        super().__init__(app, schedule, batch_size, max_attempts, backoff)
+        self.schedule = schedule
+
+    @contextmanager
+    def _session(self):
+        from notifications import Notify
+
+        yield Notify(self.app)
+
+    def _send(self, notify, row):
+        notification = pydoc.locate(row['notification'])
+        if notification is None:
+            raise Exception('The {} notification could not be imported'.format(row['notification']))
+
+        options = row['options']
+        members = [tuple(member) for member in options['members']]
+        dispatch = notify._dispatch(row['channel'], notification, members, record=False,
+                                    idempotency_key=options.get('idempotency_key'))
+        if dispatch.status == 'failed':
+            raise NotificationFailed(str(dispatch.error))
@@ -0,0 +1,2 @@
+from .Schedule import Schedule
+from .ScheduleWorker import ScheduleWorker
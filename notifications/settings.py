@@ -0,0 +1,52 @@
+"""Notification Settings."""
+
+import importlib
+
+# The loaded config file, False when the application has none, None until first use
+_config = None
+
+
+def setting(section, key, default=None):
+    """Fetches a value from the optional config/notifications.py file of the application.
+
+    Each section is an uppercase dictionary inside the config file such as SLACK or MAIL.
+    The file is only looked up once, call forget to look it up again.
+
+    Arguments:
+        section {string} -- The name of the section dictionary.
+        key {string} -- The key inside the section.
+
+    Keyword Arguments:
+        default {any} -- Returned if the file, section or key does not exist. (default: {None})
+
+    Returns:
+        any
+    """
+    config = _config if _config is not None else _load()
+    if config is False:
+        return default
+
+    options = getattr(config, section.upper(), None)
+    if isinstance(options, dict):
+        return options.get(key, default)
+
+    return default
+
+
+def forget():
+    """Forgets the loaded config file so the next setting looks it up again."""
+    global _config
+    _config = None
+
+
+def _load():
+    global _config
+    try:
+        _config = importlib.import_module('config.notifications')
+    except ImportError as e:
+        # Only a missing config file falls back to the defaults
+        if e.name not in ('config', 'config.notifications'):
+            raise
+        _config = False
+
+    return _config
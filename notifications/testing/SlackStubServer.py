@@ -0,0 +1,85 @@
+"""Slack Stub Server Module."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+
+
+class SlackStubServer(ThreadingMixIn, HTTPServer):
+    """In process HTTP server that records Slack API calls and replies with canned JSON.
+
+    Point a SlackTransport at the url property to send notifications to it.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SlackStubHandler)
+        self.calls = []
+        self.responses = {}
+        self.connections = 0
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/api'.format(self.server_port)
+
+    def start(self):
+        """Serves requests on a background thread.
+
+        Returns:
+            self
+        """
+        threading.Thread(target=self.serve_forever, args=(0.01,), daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class SlackStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        method = self.path.rsplit('/', 1)[-1]
+        if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+            data = {key: value[0] for key, value in parse_qs(body.decode()).items()}
+        else:
+            data = body
+
+        self.server.calls.append((method, data))
+        response = self.server.responses.get(method, {'ok': True})
+        if callable(response):
+            response = response(data)
+
+        # Responses may be a (status, headers, body) tuple to simulate errors
+        status, headers = 200, {}
+        if isinstance(response, tuple):
+            status, headers, response = response
+
+        content = json.dumps(response).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
@@ -0,0 +1,78 @@
+"""SMTP Sink Server Module."""
+
+import threading
+from socketserver import StreamRequestHandler, TCPServer, ThreadingMixIn
+
+
+class SmtpSinkServer(ThreadingMixIn, TCPServer):
+    """In process SMTP server that accepts every message and keeps it in memory.
+
+    Set drop_after to close each connection after that many messages to simulate
+    a relay dropping connections.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), SmtpSinkHandler)
+        self.messages = []
+        self.connections = 0
+        self.drop_after = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        """Serves connections on a background thread.
+
+        Returns:
+            self
+        """
+        threading.Thread(target=self.serve_forever, args=(0.01,), daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stops serving and closes the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class SmtpSinkHandler(StreamRequestHandler):
+
+    def reply(self, line):
+        self.wfile.write('{}\r\n'.format(line).encode())
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply('220 localhost ESMTP sink')
+        received = 0
+        while True:
+            line = self.rfile.readline().decode().strip()
+            command = line[:4].upper()
+            if not line or command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            elif command in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                for data_line in iter(self.rfile.readline, b''):
+                    if data_line in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(data_line)
+                self.server.messages.append(b''.join(data).decode())
+                self.reply('250 OK')
+                received += 1
+                if self.server.drop_after and received >= self.server.drop_after:
+                    return
+            else:
+                self.reply('250 OK')
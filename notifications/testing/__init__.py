@@ -0,0 +1,2 @@
+from .SlackStubServer import SlackStubServer
+from .SmtpSinkServer import SmtpSinkServer
@@ -0,0 +1,110 @@
+"""Mail Session Module."""
+
+import smtplib
+import threading
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+
+class MailSession:
+    """Reuses one mail driver connection for every email sent during a batch.
+
+    SMTP emails are sent over a single connection that is opened on the first email,
+    reopened if the server drops it and closed when the session ends. Every other driver
+    is resolved once and reused for the whole batch.
+    """
+
+    def __init__(self, app, retries=1):
+        """Mail Session Constructor.
+
+        Arguments:
+            app {masonite.app.App} -- The Masonite container object.
+
+        Keyword Arguments:
+            retries {int} -- How many times to reconnect when the SMTP connection drops. (default: {1})
+        """
+        self.app = app
+        self.retries = retries
+        self.sent = 0
+        self.connections = 0
+        self._smtp = None
+        self._drivers = {}
+        self._lock = threading.Lock()
+
+    def send(self, driver, to, subject, body):
+        """Sends an email through the session.
+
+        Arguments:
+            driver {string} -- The name of the mail driver.
+            to {string} -- The email address to send to.
+            subject {string} -- The subject of the email.
+            body {string} -- The HTML body of the email.
+        """
+        with self._lock:
+            if driver == 'smtp':
+                self._send_smtp(to, subject, body)
+            else:
+                self._driver(driver).to(to).subject(subject).send(body)
+
+            self.sent += 1
+
+    def close(self):
+        """Closes the SMTP connection if one is open."""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._smtp = None
+
+            self._drivers = {}
+
+    def _driver(self, driver):
+        if driver not in self._drivers:
+            self._drivers[driver] = self.app.make('Mail').driver(driver)
+
+        return self._drivers[driver]
+
+    def _connect(self):
+        config = self.app.make('MailConfig').DRIVERS['smtp']
+
+        if config.get('ssl') is True:
+            smtp = smtplib.SMTP_SSL(config['host'], int(config['port']))
+        else:
+            smtp = smtplib.SMTP(config['host'], int(config['port']))
+            if config.get('tls') is True:
+                smtp.starttls()
+
+        if config.get('username'):
+            smtp.login(config['username'], config['password'])
+
+        self.connections += 1
+        return smtp
+
+    def _send_smtp(self, to, subject, body):
+        config = self.app.make('MailConfig')
+
+        message = MIMEMultipart('alternative')
+        message['Subject'] = subject
+        message['From'] = '{0} <{1}>'.format(config.FROM['name'], config.FROM['address'])
+        message['To'] = to
+        message.attach(MIMEText(body, 'html'))
+
+        for attempt in range(self.retries + 1):
+            try:
+                if self._smtp is None:
+                    self._smtp = self._connect()
+
+                self._smtp.sendmail(config.FROM['address'], to, message.as_string())
+                return
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._smtp = None
+                if attempt == self.retries:
+                    raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
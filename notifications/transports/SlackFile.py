@@ -0,0 +1,145 @@
+"""Slack File Module."""
+
+import mmap
+import os
+import threading
+import uuid
+import weakref
+
+
+class SlackFile:
+    """A file on disk that is uploaded to Slack without being loaded into memory.
+
+    Files larger than MMAP_OVER bytes are memory-mapped and sent in chunks, so the operating
+    system pages them in as they are sent. Smaller files are read once. Uploads of the same
+    unchanged file share one SlackFile and therefore one read while any of them is alive.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MMAP_OVER = 1024 * 1024
+
+    _files = weakref.WeakValueDictionary()
+    _files_lock = threading.Lock()
+
+    def __init__(self, path, name=None):
+        """Slack File Constructor.
+
+        Arguments:
+            path {string} -- The path of the file.
+
+        Keyword Arguments:
+            name {string} -- The file name shown in Slack. Defaults to the base name of the path. (default: {None})
+        """
+        self.path = path
+        self.name = name or os.path.basename(path)
+        self.size = os.path.getsize(path)
+        self._buffer = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path):
+        """Gets the shared SlackFile for a path, or creates it when the file changed.
+
+        Arguments:
+            path {string} -- The path of the file.
+
+        Returns:
+            notifications.transports.SlackFile
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+
+        with cls._files_lock:
+            file = cls._files.get(key)
+            if file is None:
+                file = cls._files[key] = cls(path)
+
+            return file
+
+    def chunks(self, size=None):
+        """Yields the contents of the file in chunks.
+
+        Keyword Arguments:
+            size {int} -- The size of each chunk. (default: {CHUNK_SIZE})
+
+        Returns:
+            generator
+        """
+        size = size or self.CHUNK_SIZE
+        buffer = self.buffer()
+        for offset in range(0, self.size, size):
+            yield buffer[offset:offset + size]
+
+    def buffer(self):
+        """Maps or reads the file the first time it is needed.
+
+        Returns:
+            mmap.mmap|memoryview
+        """
+        with self._lock:
+            if self._buffer is None:
+                with open(self.path, 'rb') as file:
+                    if self.size > self.MMAP_OVER:
+                        self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    else:
+                        self._buffer = memoryview(file.read())
+
+            return self._buffer
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return '<SlackFile {} {} bytes>'.format(self.path, self.size)
+
+
+class MultipartStream:
+    """A multipart/form-data body that is generated while it is sent.
+
+    The length is known up front so the request is sent with a Content-Length header. The
+    stream can be iterated again, which lets rate limited uploads be retried.
+    """
+
+    def __init__(self, fields, files, boundary=None):
+        """Multipart Stream Constructor.
+
+        Arguments:
+            fields {dict} -- The form fields.
+            files {dict} -- Field names and the notifications.transports.SlackFile to send for each.
+
+        Keyword Arguments:
+            boundary {string} -- The multipart boundary. (default: {None})
+        """
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary={}'.format(self.boundary)
+        self._parts = []
+
+        for name, value in (fields or {}).items():
+            if value is None:
+                continue
+            header = '--{}\r\nContent-Disposition: form-data; name="{}"\r\n\r\n'.format(self.boundary, name)
+            self._parts.append((header.encode('utf-8'), str(value).encode('utf-8')))
+
+        for name, file in files.items():
+            header = (
+                '--{}\r\nContent-Disposition: form-data; name="{}"; filename="{}"\r\n'
+                'Content-Type: application/octet-stream\r\n\r\n'
+            ).format(self.boundary, name, file.name.replace('"', '%22'))
+            self._parts.append((header.encode('utf-8'), file))
+
+        self._end = '--{}--\r\n'.format(self.boundary).encode('utf-8')
+
+    def __iter__(self):
+        for header, body in self._parts:
+            yield header
+            if isinstance(body, SlackFile):
+                for chunk in body.chunks():
+                    yield chunk
+            else:
+                yield body
+            yield b'\r\n'
+
+        yield self._end
+
+    def __len__(self):
+        return sum(len(header) + len(body) + 2 for header, body in self._parts) + len(self._end)
@@ -0,0 +1,235 @@
+"""Slack Scheduler Module."""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of rejecting callers.
+
+    Every reservation takes a token even if the bucket is empty. The caller is told how long
+    to wait for its token so requests queue locally in the order they arrived.
+    """
+
+    def __init__(self, rate, capacity):
+        """Token Bucket Constructor.
+
+        Arguments:
+            rate {float} -- Tokens added per second.
+            capacity {float} -- The maximum amount of tokens the bucket holds.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token from the bucket.
+
+        Returns:
+            float -- Seconds to wait before the token may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+
+            if self.tokens >= 0:
+                return 0
+
+            return -self.tokens / self.rate
+
+    def full(self):
+        """Whether the bucket refilled completely, so a new bucket would behave the same.
+
+        Returns:
+            bool
+        """
+        with self._lock:
+            return self.tokens + (time.monotonic() - self.updated) * self.rate >= self.capacity
+
+    def pause(self, seconds):
+        """Empties the bucket so no token is available for the given amount of seconds.
+
+        Arguments:
+            seconds {float} -- How long to hold back every caller.
+        """
+        with self._lock:
+            self.tokens = min(self.tokens, 0) - seconds * self.rate
+            self.updated = time.monotonic()
+
+
+class SlackOutcome:
+    """The final outcome of a Slack API call made through the scheduler."""
+
+    def __init__(self, method, channel, ok, error=None, attempts=1, response=None):
+        self.method = method
+        self.channel = channel
+        self.ok = ok
+        self.error = error
+        self.attempts = attempts
+        self.response = response
+
+    @property
+    def unavailable(self):
+        """Whether the call failed because Slack could not handle it rather than because of the request.
+
+        Returns:
+            bool
+        """
+        if self.ok:
+            return False
+
+        if self.error in ('ratelimited', 'invalid_response'):
+            return True
+
+        return self.response is not None and self.response.status_code >= 500
+
+    def __repr__(self):
+        return '<SlackOutcome {} {} {}>'.format(
+            self.method, self.channel, 'ok' if self.ok else self.error)
+
+
+class SlackScheduler:
+    """Schedules Slack API calls within Slack's rate limits.
+
+    Each API method draws from a token bucket for its rate limit tier and each channel draws
+    from its own bucket, so bursts are queued locally instead of being rejected by Slack.
+    A 429 response pauses the method for the Retry-After header and the call is tried again.
+    """
+
+    # Requests per minute for each of Slack's rate limit tiers.
+    TIERS = {
+        1: 1,
+        2: 20,
+        3: 50,
+        4: 100,
+    }
+
+    METHODS = {
+        'channels.list': 2,
+        'files.upload': 2,
+        'chat.postMessage': 4,
+    }
+
+    def __init__(self, transport, max_retries=3, channel_rate=1, channel_burst=3, bucket_cache_size=1024):
+        """Slack Scheduler Constructor.
+
+        Arguments:
+            transport {notifications.transports.SlackTransport} -- The transport requests are sent with.
+
+        Keyword Arguments:
+            max_retries {int} -- How many times a rate limited call is retried. (default: {3})
+            channel_rate {float} -- Messages per second allowed for each channel. (default: {1})
+            channel_burst {int} -- Messages a channel may send at once before being queued. (default: {3})
+            bucket_cache_size {int} -- The amount of method and channel buckets to keep. The least
+                                       recently used buckets that refilled are dropped beyond it. (default: {1024})
+        """
+        self.transport = transport
+        self.max_retries = max_retries
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.bucket_cache_size = bucket_cache_size
+        self._methods = OrderedDict()
+        self._channels = OrderedDict()
+        self._lock = threading.Lock()
+
+    def post(self, method, data=None, files=None):
+        """Posts to a Slack API method once the rate limits allow it.
+
+        Arguments:
+            method {string} -- The API method such as chat.postMessage.
+
+        Keyword Arguments:
+            data {dict} -- The form fields to send. (default: {None})
+            files {dict} -- Files to send as a multipart upload. (default: {None})
+
+        Returns:
+            notifications.transports.SlackOutcome
+        """
+        data = data or {}
+        channel = data.get('channel') or data.get('channels')
+        method_bucket = self.method_bucket(method)
+        channel_bucket = self.channel_bucket(channel) if channel else None
+
+        for attempt in range(1, self.max_retries + 2):
+            wait = method_bucket.reserve()
+            if channel_bucket:
+                wait = max(wait, channel_bucket.reserve())
+            if wait:
+                time.sleep(wait)
+
+            response = self.transport.post(method, data, files)
+
+            if response.status_code == 429:
+                method_bucket.pause(float(response.headers.get('Retry-After', 1)))
+                continue
+
+            try:
+                body = response.json()
+            except ValueError:
+                body = {'ok': False, 'error': 'invalid_response'}
+
+            return SlackOutcome(method, channel, body.get('ok', False),
+                                body.get('error'), attempt, response)
+
+        return SlackOutcome(method, channel, False, 'ratelimited', attempt, response)
+
+    def post_webhook(self, url, body):
+        """Posts a message to an incoming webhook, waiting for the webhook's rate limit.
+
+        Each webhook draws from its own channel bucket since a webhook posts to one channel.
+
+        Arguments:
+            url {string} -- The URL of the incoming webhook.
+            body {dict} -- The JSON message.
+
+        Returns:
+            notifications.transports.SlackOutcome
+        """
+        bucket = self.channel_bucket(url)
+
+        for attempt in range(1, self.max_retries + 2):
+            wait = bucket.reserve()
+            if wait:
+                time.sleep(wait)
+
+            response = self.transport.post_json(url, body)
+
+            if response.status_code == 429:
+                bucket.pause(float(response.headers.get('Retry-After', 1)))
+                continue
+
+            # Webhooks answer with a plain text ok or the error
+            ok = response.status_code == 200
+            return SlackOutcome('webhook', url, ok, None if ok else response.text.strip() or 'invalid_response',
+                                attempt, response)
+
+        return SlackOutcome('webhook', url, False, 'ratelimited', attempt, response)
+
+    def method_bucket(self, method):
+        per_minute = self.TIERS[self.METHODS.get(method, 3)]
+        return self._bucket(self._methods, method, per_minute / 60, per_minute)
+
+    def channel_bucket(self, channel):
+        return self._bucket(self._channels, channel, self.channel_rate, self.channel_burst)
+
+    def _bucket(self, buckets, key, rate, capacity):
+        with self._lock:
+            bucket = buckets.get(key)
+            if bucket is not None:
+                buckets.move_to_end(key)
+                return bucket
+
+            bucket = buckets[key] = TokenBucket(rate, capacity)
+            # Buckets that are still waiting to refill are kept so their limit holds
+            while len(buckets) > self.bucket_cache_size:
+                oldest, oldest_bucket = next(iter(buckets.items()))
+                if not oldest_bucket.full():
+                    break
+                del buckets[oldest]
+
+            return bucket
@@ -0,0 +1,116 @@
+"""Slack Transport Module."""
+
+import json
+import threading
+
+from notifications.transports.SlackFile import MultipartStream, SlackFile
+
+
+class SlackTransport:
+    """Pooled keep-alive HTTP session used for all Slack API traffic.
+
+    One session is shared by every Slack notification so connections to Slack are
+    reused instead of paying for a new TCP and TLS handshake on every message.
+    """
+
+    def __init__(self, base_url='https://slack.com/api', pool_size=10, timeout=10, retries=3, backoff=0.3):
+        """Slack Transport Constructor.
+
+        Keyword Arguments:
+            base_url {string} -- The URL API methods are appended to. Point this at a stub server in tests.
+                                 (default: {'https://slack.com/api'})
+            pool_size {int} -- The maximum amount of open connections kept alive. (default: {10})
+            timeout {int|tuple} -- Seconds to wait for a connection and a response. (default: {10})
+            retries {int} -- How many times a failed connection is retried. Requests that reached
+                             Slack are never retried since API calls like chat.postMessage are not
+                             idempotent. (default: {3})
+            backoff {float} -- The backoff factor between connection retries. (default: {0.3})
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff = backoff
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The pooled requests session, opened on the first request.
+
+        Returns:
+            requests.Session
+        """
+        with self._lock:
+            if self._session is None:
+                self._session = self._open()
+
+        return self._session
+
+    def _open(self):
+        # requests is only imported once Slack is actually called
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=Retry(total=self.retries, connect=self.retries,
+                              read=0, status=0, backoff_factor=self.backoff),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def url(self, method):
+        """Gets the full URL for a Slack API method.
+
+        Arguments:
+            method {string} -- The API method such as chat.postMessage.
+
+        Returns:
+            string
+        """
+        return '{}/{}'.format(self.base_url, method)
+
+    def post(self, method, data=None, files=None):
+        """Posts to a Slack API method.
+
+        Arguments:
+            method {string} -- The API method such as chat.postMessage.
+
+        Keyword Arguments:
+            data {dict} -- The form fields to send. (default: {None})
+            files {dict} -- Files to send as a multipart upload. SlackFile values are
+                            streamed from disk instead of being read into memory. (default: {None})
+
+        Returns:
+            requests.Response
+        """
+        if files and any(isinstance(file, SlackFile) for file in files.values()):
+            body = MultipartStream(data, files)
+            return self.session.post(self.url(method), data=body, timeout=self.timeout,
+                                     headers={'Content-Type': body.content_type})
+
+        return self.session.post(self.url(method), data=data, files=files, timeout=self.timeout)
+
+    def post_json(self, url, body):
+        """Posts a JSON body to a full URL such as an incoming webhook.
+
+        Arguments:
+            url {string} -- The URL to post to.
+            body {dict} -- The JSON serializable body.
+
+        Returns:
+            requests.Response
+        """
+        return self.session.post(url, data=json.dumps(body).encode('utf-8'), timeout=self.timeout,
+                                 headers={'Content-Type': 'application/json'})
+
+    def close(self):
+        """Closes every pooled connection."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
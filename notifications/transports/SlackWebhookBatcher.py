@@ -0,0 +1,155 @@
+"""Slack Webhook Batcher Module."""
+
+import threading
+from concurrent.futures import Future
+
+
+class SlackWebhookBatcher:
+    """Combines messages posted to the same incoming webhook into one multi-block message.
+
+    The first message to a webhook opens a window. Every plain text message with the same
+    username and icon that arrives before the window closes becomes a section block of
+    one combined message, up to Slack's limits of 50 blocks, 3000 characters per section
+    and 40000 characters of text. Messages with attachments or blocks of their own are
+    posted on their own.
+    """
+
+    MAX_BLOCKS = 50
+    MAX_SECTION = 3000
+    MAX_TEXT = 40000
+
+    def __init__(self, scheduler, window=0.5):
+        """Slack Webhook Batcher Constructor.
+
+        Arguments:
+            scheduler {notifications.transports.SlackScheduler} -- The scheduler webhooks are posted through.
+
+        Keyword Arguments:
+            window {float} -- Seconds to wait for more messages to the same webhook.
+                              A window of 0 posts every message on its own. (default: {0.5})
+        """
+        self.scheduler = scheduler
+        self.window = window
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def post(self, url, body):
+        """Posts a message to a webhook, combined with the other messages of its window.
+
+        Arguments:
+            url {string} -- The URL of the incoming webhook.
+            body {dict} -- The JSON message.
+
+        Returns:
+            concurrent.futures.Future -- Resolves to the SlackOutcome of the post that carried the message.
+        """
+        future = Future()
+        if self.window <= 0 or not self._batchable(body):
+            self._post(url, [body], [future])
+            return future
+
+        key = (url, body.get('username'), body.get('icon_emoji'))
+        full = []
+
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is not None and not self._fits(buffer, body):
+                full.append(self._pop(key))
+                buffer = None
+
+            if buffer is None:
+                buffer = self._buffers[key] = {'url': url, 'bodies': [], 'futures': [], 'length': 0}
+                # Not a daemon so buffered messages are still posted when the process exits
+                buffer['timer'] = threading.Timer(self.window, self._expire, [key, buffer])
+                buffer['timer'].start()
+
+            buffer['bodies'].append(body)
+            buffer['futures'].append(future)
+            buffer['length'] += len(body.get('text') or '')
+            if len(buffer['bodies']) >= self.MAX_BLOCKS:
+                full.append(self._pop(key))
+
+        for buffer in full:
+            self._post(buffer['url'], buffer['bodies'], buffer['futures'])
+
+        return future
+
+    def flush(self):
+        """Posts every open window.
+
+        Returns:
+            int -- The amount of posts made.
+        """
+        with self._lock:
+            buffers = [self._pop(key) for key in list(self._buffers)]
+
+        for buffer in buffers:
+            self._post(buffer['url'], buffer['bodies'], buffer['futures'])
+
+        return len(buffers)
+
+    def pending(self):
+        """Gets the amount of messages waiting in open windows.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return sum(len(buffer['bodies']) for buffer in self._buffers.values())
+
+    def combine(self, bodies):
+        """Builds one message from the messages of a window.
+
+        Arguments:
+            bodies {list} -- The JSON messages, oldest first.
+
+        Returns:
+            dict
+        """
+        if len(bodies) == 1:
+            return bodies[0]
+
+        body = {
+            key: value for key, value in bodies[0].items()
+            if key in ('username', 'icon_emoji', 'unfurl_links', 'unfurl_media')
+        }
+        body['text'] = '\n'.join(message.get('text') or '' for message in bodies)
+        body['blocks'] = [
+            {'type': 'section', 'text': {
+                'type': 'mrkdwn' if message.get('mrkdwn', True) else 'plain_text',
+                'text': message.get('text') or ' ',
+            }}
+            for message in bodies
+        ]
+        return body
+
+    def _batchable(self, body):
+        text = body.get('text') or ''
+        return 'attachments' not in body and 'blocks' not in body and 0 < len(text) <= self.MAX_SECTION
+
+    def _fits(self, buffer, body):
+        return buffer['length'] + len(body.get('text') or '') + len(buffer['bodies']) <= self.MAX_TEXT
+
+    def _expire(self, key, buffer):
+        with self._lock:
+            if self._buffers.get(key) is not buffer:
+                return
+            self._pop(key)
+
+        self._post(buffer['url'], buffer['bodies'], buffer['futures'])
+
+    def _pop(self, key):
+        buffer = self._buffers.pop(key)
+        buffer['timer'].cancel()
+        return buffer
+
+    def _post(self, url, bodies, futures):
+        try:
+            outcome = self.scheduler.post_webhook(url, self.combine(bodies))
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        for future in futures:
+            future.set_result(outcome)
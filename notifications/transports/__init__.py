@@ -0,0 +1,5 @@
+from .MailSession import MailSession
+from .SlackFile import MultipartStream, SlackFile
+from .SlackScheduler import SlackOutcome, SlackScheduler, TokenBucket
+from .SlackTransport import SlackTransport
+from .SlackWebhookBatcher import SlackWebhookBatcher
@@ -4,9 +4,17 @@ setup(
     name='masonite-notifications',
     packages=[
         'notifications',
+        'notifications.cache',
         'notifications.components',
+        'notifications.database',
+        'notifications.dispatch',
+        'notifications.jobs',
+        'notifications.outbox',
         'notifications.snippets',
+        'notifications.testing',
         'notifications.providers',
+        'notifications.schedule',
+        'notifications.transports',
         'notifications.commands',
     ],
     version='1.0.1',
@@ -0,0 +1,14 @@
+import pytest
+from notifications.testing import SlackStubServer, SmtpSinkServer
+
+
+@pytest.fixture
+def smtp_server():
+    with SmtpSinkServer() as server:
+        yield server
+
+
+@pytest.fixture
+def slack_server():
+    with SlackStubServer() as server:
+        yield server
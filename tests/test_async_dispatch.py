@@ -0,0 +1,71 @@
+import asyncio
+
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.transports import SlackTransport
+
+
+class Tracker:
+    in_flight = 0
+    peak = 0
+
+
+class PingNotification(Notifiable):
+
+    def ping(self):
+        pass
+
+    async def fire_ping_async(self):
+        Tracker.in_flight += 1
+        Tracker.peak = max(Tracker.peak, Tracker.in_flight)
+        await asyncio.sleep(0.01)
+        Tracker.in_flight -= 1
+
+
+class SlackNotification(Notifiable):
+
+    def slack(self):
+        return self.token('test_token') \
+            .text('Deployed!') \
+            .channel('C1')
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncDispatch:
+
+    def setup_method(self):
+        Tracker.in_flight = Tracker.peak = 0
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.notify = Notify(self.app)
+
+    def test_send_async_overlaps_sends(self):
+        run(self.notify.via('ping').send_async(*[PingNotification] * 5))
+
+        assert len(self.notify.called_notifications) == 5
+        assert Tracker.peak == 5
+
+    def test_send_async_honors_concurrency_limit(self):
+        run(self.notify.via('ping').limit(2).send_async(*[PingNotification] * 6))
+
+        assert Tracker.peak == 2
+
+    def test_send_async_sets_protected_members(self):
+        run(self.notify.via('ping').send_async(PingNotification, to='test@email.com'))
+
+        assert self.notify.called_notifications[0]._to == 'test@email.com'
+
+    def test_send_async_fires_slack(self, slack_server):
+        self.app.bind('SlackTransport', SlackTransport(base_url=slack_server.url))
+
+        run(self.notify.via('slack').send_async(SlackNotification, SlackNotification))
+
+        assert [method for method, _ in slack_server.calls] == ['chat.postMessage'] * 2
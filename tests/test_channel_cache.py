@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+from masonite.app import App
+from notifications import Notifiable
+from notifications.cache import ChannelCache
+from notifications.exceptions import SlackApiError, SlackChannelNotFound
+from notifications.transports import SlackTransport
+
+
+class SlackNotification(Notifiable):
+
+    def __init__(self, app):
+        self.app = app
+        self.token('token')
+
+
+class TestChannelCache:
+
+    def setup_method(self):
+        self.calls = []
+        self.cache = ChannelCache(loader=self.loader)
+
+    def loader(self, token):
+        self.calls.append(token)
+        return {'general': 'C1', 'random': 'C2'}
+
+    def test_lookups_only_load_once(self):
+        for _ in range(100):
+            assert self.cache.get('token', '#general') == 'C1'
+        assert self.calls == ['token']
+
+    def test_entries_are_keyed_by_token(self):
+        self.cache.get('first', '#general')
+        self.cache.get('second', '#general')
+        assert self.calls == ['first', 'second']
+
+    def test_expired_entries_are_refreshed(self):
+        self.cache.ttl = -1
+        self.cache.get('token', '#general')
+        self.cache.get('token', '#general')
+        assert len(self.calls) == 2
+
+    def test_missing_channel_refreshes_once(self):
+        self.cache.warm('token')
+        assert self.cache.get('token', '#unknown') is None
+        assert self.cache.get('token', '#unknown') is None
+        assert len(self.calls) == 2
+
+    def test_missing_names_survive_refreshes(self):
+        for _ in range(10):
+            assert self.cache.get('token', '#first-unknown') is None
+            assert self.cache.get('token', '#second-unknown') is None
+
+        assert len(self.calls) == 2
+
+    def test_missing_names_are_found_by_a_later_refresh(self):
+        self.cache.get('token', '#new')
+        self.loader = lambda token: {'new': 'C3'}
+        self.cache.loader = self.loader
+
+        assert self.cache.refresh('token')['missing'] == set()
+        assert self.cache.get('token', '#new') == 'C3'
+
+    def test_concurrent_misses_share_one_refresh(self):
+        started = threading.Event()
+
+        def loader(token):
+            self.calls.append(token)
+            started.wait(1)
+            return {'general': 'C1'}
+
+        self.cache.loader = loader
+        threads = [threading.Thread(target=self.cache.get, args=('token', '#general')) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+
+        assert self.calls == ['token']
+
+    def test_cache_is_bounded(self):
+        self.cache.size = 2
+        self.cache.warm('first', 'second', 'third')
+        assert len(self.cache) == 2
+        assert 'first' not in self.cache
+
+    def test_fetch_channels_walks_every_page(self, slack_server):
+        pages = {
+            None: {'ok': True, 'channels': [{'name': 'general', 'id': 'C1'}], 'response_metadata': {'next_cursor': 'next'}},
+            'next': {'ok': True, 'channels': [{'name': 'random', 'id': 'C2'}], 'response_metadata': {'next_cursor': ''}},
+        }
+        slack_server.responses['channels.list'] = lambda data: pages[data.get('cursor')]
+        cache = ChannelCache(transport=SlackTransport(base_url=slack_server.url))
+
+        assert cache.fetch_channels('token') == {'general': 'C1', 'random': 'C2'}
+        assert len(slack_server.calls) == 2
+
+    def test_failed_lookups_are_not_cached(self, slack_server):
+        slack_server.responses['channels.list'] = {'ok': False, 'error': 'invalid_auth'}
+        cache = ChannelCache(transport=SlackTransport(base_url=slack_server.url))
+
+        with pytest.raises(SlackApiError):
+            cache.get('token', '#general')
+        assert 'token' not in cache
+
+        slack_server.responses['channels.list'] = {'ok': True, 'channels': [{'name': 'general', 'id': 'C1'}]}
+        assert cache.get('token', '#general') == 'C1'
+
+    def test_rate_limited_lookups_wait_and_retry(self, slack_server):
+        responses = [
+            (429, {'Retry-After': '0'}, {'ok': False, 'error': 'ratelimited'}),
+            {'ok': True, 'channels': [{'name': 'general', 'id': 'C1'}]},
+        ]
+        slack_server.responses['channels.list'] = lambda data: responses.pop(0)
+        cache = ChannelCache(transport=SlackTransport(base_url=slack_server.url))
+        cache.scheduler.method_bucket('channels.list').rate = 100
+
+        assert cache.get('token', '#general') == 'C1'
+        assert len(slack_server.calls) == 2
+
+    def test_find_channel_uses_container_cache(self):
+        app = App()
+        app.bind('SlackChannelCache', self.cache)
+        notification = SlackNotification(app)
+
+        assert notification.find_channel('#random') == 'C2'
+        with pytest.raises(SlackChannelNotFound):
+            notification.find_channel('#unknown')
+        with pytest.raises(SlackChannelNotFound):
+            notification.find_channel('#unknown')
+        assert self.calls == ['token', 'token']
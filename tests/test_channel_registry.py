@@ -0,0 +1,90 @@
+import subprocess
+import sys
+from collections import OrderedDict
+
+from masonite.app import App
+from notifications import Notifiable, Notify
+from notifications.dispatch import ChannelRegistry, DispatchPlan
+
+
+class SmsComponent:
+
+    def fire_sms(self):
+        self.app.make('Outbox').append((self._to, self._sms_text))
+
+
+class PushComponent:
+
+    def push(self, text):
+        self._push_text = text
+        return self
+
+    def fire_push(self):
+        self.app.make('Outbox').append(self._payload())
+
+    def _payload(self):
+        return {'to': self._to, 'text': self._push_text}
+
+
+class AlertNotification(Notifiable):
+
+    def sms(self):
+        self._sms_text = 'Server down'
+
+
+class TestChannelRegistry:
+
+    def setup_method(self):
+        self.paths = dict(ChannelRegistry._paths)
+        self.components = dict(ChannelRegistry._components)
+        ChannelRegistry._discovered = True
+        DispatchPlan.forget()
+        self.app = App()
+        self.app.bind('Outbox', [])
+
+    def teardown_method(self):
+        ChannelRegistry._paths = self.paths
+        ChannelRegistry._components = self.components
+        ChannelRegistry._discovered = False
+        DispatchPlan.forget()
+
+    def test_registered_components_send_their_channel(self):
+        ChannelRegistry.register('sms', SmsComponent)
+
+        Notify(self.app).sms(AlertNotification, to='+15550100')
+
+        assert self.app.make('Outbox') == [('+15550100', 'Server down')]
+
+    def test_component_builders_and_helpers_work_on_the_notification(self):
+        ChannelRegistry.register('push', PushComponent)
+
+        class PushNotification(Notifiable):
+
+            def push(self):
+                return super().push('Deployed')
+
+        Notify(self.app).push(PushNotification, to='device-1')
+
+        assert self.app.make('Outbox') == [{'to': 'device-1', 'text': 'Deployed'}]
+        composed = DispatchPlan.get(PushNotification, 'push').composed
+        assert issubclass(composed, PushNotification) and issubclass(composed, PushComponent)
+        assert composed.__name__ == 'PushNotification'
+
+    def test_dotted_paths_are_imported_on_first_use(self):
+        ChannelRegistry.register('sms', 'collections:OrderedDict')
+
+        assert 'sms' not in ChannelRegistry._components
+        assert ChannelRegistry.component('sms') is OrderedDict
+        assert 'sms' in ChannelRegistry.channels()
+
+    def test_unknown_channels_have_no_component(self):
+        assert ChannelRegistry.component('pigeon') is None
+
+    def test_importing_the_package_does_not_load_channel_dependencies(self):
+        code = (
+            'import sys, notifications, notifications.providers; '
+            'print(sorted(name for name in ("requests", "jinja2", "asyncio") if name in sys.modules))'
+        )
+        output = subprocess.check_output([sys.executable, '-c', code])
+
+        assert output.strip() == b'[]'
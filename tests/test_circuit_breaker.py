@@ -0,0 +1,173 @@
+import pytest
+from masonite import Queue
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.cache import DedupeStore
+from notifications.dispatch import CircuitBreaker, CircuitBreakers
+from notifications.jobs import MailJob
+from notifications.outbox import Outbox
+from notifications.transports import SlackScheduler, SlackTransport
+
+
+class DownMailer:
+
+    def __init__(self):
+        self.calls = 0
+
+    def driver(self, driver):
+        return self
+
+    def to(self, to):
+        return self
+
+    def subject(self, subject):
+        return self
+
+    def send(self, message):
+        self.calls += 1
+        raise ConnectionError('relay down')
+
+
+class RecordingQueue:
+
+    def __init__(self):
+        self.pushed = []
+
+    def push(self, *objects, args=()):
+        self.pushed.extend(objects)
+
+
+class OutageNotification(Notifiable):
+
+    def mail(self):
+        self.subject('Outage').driver('smtp').line('Relay down')
+
+    def slack(self):
+        self.token('token').channel('C1').text('Relay down')
+
+
+class TestCircuitBreaker:
+
+    def setup_method(self):
+        self.breaker = CircuitBreaker(threshold=0.5, minimum=4, window=30, cooldown=30)
+
+    def test_opens_once_the_failure_rate_reaches_the_threshold(self):
+        for ok in (True, False, True):
+            self.breaker.record(ok)
+        assert self.breaker.allow()
+
+        self.breaker.record(False)
+
+        assert self.breaker.state == 'open'
+        assert not self.breaker.allow()
+
+    def test_needs_the_minimum_amount_of_calls(self):
+        for _ in range(3):
+            self.breaker.record(False)
+
+        assert self.breaker.state == 'closed'
+
+    def test_half_open_breaker_lets_one_probe_through(self):
+        for _ in range(4):
+            self.breaker.record(False)
+        self.breaker._opened_at -= 30
+
+        assert self.breaker.state == 'half_open'
+        assert self.breaker.allow()
+        assert not self.breaker.allow()
+
+        self.breaker.record(True)
+        assert self.breaker.state == 'closed'
+
+    def test_failed_probe_opens_the_breaker_again(self):
+        for _ in range(4):
+            self.breaker.record(False)
+        self.breaker._opened_at -= 30
+
+        assert self.breaker.allow()
+        self.breaker.record(False)
+
+        assert self.breaker.state == 'open'
+        assert not self.breaker.allow()
+
+
+class TestLoadShedding:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.mailer = DownMailer()
+        self.app.bind('Mail', self.mailer)
+
+    def bind_breakers(self, fallback):
+        breakers = CircuitBreakers(minimum=2, fallback=fallback)
+        self.app.bind('NotificationBreakers', breakers)
+        return breakers
+
+    def fail_mail(self, times):
+        for _ in range(times):
+            with pytest.raises(ConnectionError):
+                Notify(self.app).mail(OutageNotification, to='user@email.com')
+
+    def test_open_endpoint_is_not_called(self):
+        breakers = self.bind_breakers('drop')
+        self.fail_mail(2)
+
+        notify = Notify(self.app).via('mail')
+        notify.send(OutageNotification, to='user@email.com')
+
+        assert self.mailer.calls == 2
+        assert breakers.states() == {('mail', 'smtp'): 'open'}
+        assert [result.status for result in notify.report] == ['shed']
+        assert notify.report.results[0].shed == 'drop'
+
+    def test_dropped_sends_can_be_retried(self):
+        self.app.bind('NotificationDedupeStore', DedupeStore())
+        self.bind_breakers('drop')
+        self.fail_mail(2)
+
+        for _ in range(2):
+            notify = Notify(self.app).via('mail')
+            notify.send(OutageNotification, to='user@email.com', idempotency_key='outage-1')
+
+            # A duplicate would be skipped instead of shed again
+            assert notify.report.results[0].shed == 'drop'
+
+    def test_shed_emails_are_queued(self):
+        self.bind_breakers({'mail': 'queue'})
+        queue = RecordingQueue()
+        self.app.swap(Queue, queue)
+        self.fail_mail(2)
+
+        Notify(self.app).mail(OutageNotification, to='user@email.com')
+
+        assert isinstance(queue.pushed[0], MailJob)
+        assert queue.pushed[0].to == 'user@email.com'
+
+    def test_shed_slack_messages_are_spooled(self):
+        breakers = self.bind_breakers('queue')
+        outbox = Outbox(':memory:')
+        self.app.bind('NotificationOutbox', outbox)
+        self.app.bind('SlackScheduler', SlackScheduler(SlackTransport(base_url='http://127.0.0.1:1', retries=0)))
+        for _ in range(2):
+            with pytest.raises(Exception):
+                Notify(self.app).slack(OutageNotification)
+
+        notify = Notify(self.app).via('slack')
+        notify.send(OutageNotification)
+
+        assert breakers.states() == {('slack', 'http://127.0.0.1:1'): 'open'}
+        assert notify.report.results[0].shed == 'spool'
+        assert outbox.claim()[0]['payload']['method'] == 'chat.postMessage'
+
+    def test_other_endpoints_of_the_channel_stay_closed(self):
+        breakers = self.bind_breakers('drop')
+        self.fail_mail(2)
+
+        assert breakers.get('mail', 'mailgun').allow()
+
+    def test_without_breakers_every_failure_reaches_the_endpoint(self):
+        self.fail_mail(3)
+
+        assert self.mailer.calls == 3
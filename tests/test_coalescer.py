@@ -0,0 +1,187 @@
+import threading
+import time
+
+from masonite import Queue
+from masonite.app import App
+from masonite.queues import ShouldQueue
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.dispatch import Coalescer, DispatchMetrics
+
+
+class BuildFailedNotification(Notifiable):
+
+    sent = []
+
+    def mail(self):
+        return self.subject('Build failed').line('Build {} failed'.format(self._build)).digest()
+
+    def fire_mail(self):
+        BuildFailedNotification.sent.append((self._to, self._subject, self.template))
+
+    def slack(self):
+        return self.token('token').channel('C1').text('Build {} failed'.format(self._build)).digest()
+
+    def fire_slack(self):
+        BuildFailedNotification.sent.append(self._slack_request())
+
+
+class QueuedBuildFailedNotification(ShouldQueue, Notifiable):
+
+    def mail(self):
+        return self.subject('Build failed').driver('terminal').line('Build {} failed'.format(self._build)).digest()
+
+
+class FailingBuildNotification(BuildFailedNotification):
+
+    def fire_mail(self):
+        raise ConnectionError('relay down')
+
+
+class RecordingQueue:
+
+    def __init__(self):
+        self.pushed = []
+
+    def push(self, *objects, args=()):
+        self.pushed.extend(objects)
+
+
+class TestCoalescer:
+
+    def setup_method(self):
+        BuildFailedNotification.sent = []
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.coalescer = Coalescer(window=0, size=3)
+        self.app.bind('NotificationCoalescer', self.coalescer)
+        self.notify = Notify(self.app)
+
+    def test_full_buffer_is_sent_as_one_digest(self):
+        for build in range(3):
+            self.notify.mail(BuildFailedNotification, to='dev@email.com', build=build)
+
+        assert len(BuildFailedNotification.sent) == 1
+        to, subject, template = BuildFailedNotification.sent[0]
+        assert (to, subject) == ('dev@email.com', 'Build failed')
+        assert all('Build {} failed'.format(build) in template for build in range(3))
+
+    def test_buffers_are_kept_per_recipient(self):
+        self.notify.mail(BuildFailedNotification, to='a@email.com', build=1)
+        self.notify.mail(BuildFailedNotification, to='b@email.com', build=2)
+
+        assert BuildFailedNotification.sent == []
+        assert len(self.coalescer) == 2
+        assert self.coalescer.pending() == 2
+
+        self.notify.flush_digests()
+        assert sorted(to for to, _, _ in BuildFailedNotification.sent) == ['a@email.com', 'b@email.com']
+        assert self.coalescer.pending() == 0
+
+    def test_window_fires_the_digest(self):
+        self.coalescer.window = 0.05
+        self.notify.mail(BuildFailedNotification, to='dev@email.com', build=1)
+        self.notify.mail(BuildFailedNotification, to='dev@email.com', build=2)
+
+        for _ in range(100):
+            if BuildFailedNotification.sent:
+                break
+            time.sleep(0.01)
+
+        assert len(BuildFailedNotification.sent) == 1
+        assert len(self.coalescer) == 0
+
+    def test_slack_digest_joins_text(self):
+        for build in range(3):
+            self.notify.slack(BuildFailedNotification, build=build)
+
+        method, payload = BuildFailedNotification.sent[0]
+        assert payload['channel'] == 'C1'
+        assert payload['text'] == 'Build 0 failed\nBuild 1 failed\nBuild 2 failed'
+
+    def test_metrics_count_coalesced_and_sent(self):
+        metrics = DispatchMetrics()
+        self.app.bind('NotificationMetrics', metrics)
+
+        self.notify.via('mail').send(
+            BuildFailedNotification, BuildFailedNotification, BuildFailedNotification,
+            to='dev@email.com', build=1)
+
+        assert metrics.count('coalesced') == 3
+        assert metrics.count('sent') == 1
+        assert [result.status for result in self.notify.report] == ['coalesced'] * 3
+
+    def wait_for(self, condition):
+        for _ in range(100):
+            if condition():
+                return
+            time.sleep(0.01)
+
+    def test_digests_of_an_ended_batch_are_queued(self):
+        queue = RecordingQueue()
+        self.app.swap(Queue, queue)
+        self.coalescer.window = 0.05
+
+        with self.notify.batch():
+            for build in range(2):
+                self.notify.mail(QueuedBuildFailedNotification, to='dev@email.com', build=build)
+
+        self.wait_for(lambda: queue.pushed)
+
+        assert len(queue.pushed) == 1
+        assert queue.pushed[0].to == 'dev@email.com'
+
+    def test_full_digests_use_the_current_batch(self):
+        queue = RecordingQueue()
+        self.app.swap(Queue, queue)
+
+        with self.notify.batch():
+            self.notify.mail(QueuedBuildFailedNotification, to='dev@email.com', build=1)
+        with self.notify.batch():
+            for build in range(2, 4):
+                self.notify.mail(QueuedBuildFailedNotification, to='dev@email.com', build=build)
+
+        assert len(queue.pushed) == 1
+
+    def test_window_errors_are_recorded(self):
+        self.coalescer.window = 0.05
+        self.notify.mail(FailingBuildNotification, to='dev@email.com', build=1)
+
+        self.wait_for(lambda: self.coalescer.errors)
+
+        key, exception = self.coalescer.errors[0]
+        assert key[0] == 'mail'
+        assert isinstance(exception, ConnectionError)
+
+    def test_windows_share_one_timer_thread(self):
+        threads = threading.active_count()
+        self.coalescer.window = 0.05
+        for recipient in range(20):
+            self.notify.mail(BuildFailedNotification, to='{}@email.com'.format(recipient), build=1)
+
+        assert threading.active_count() <= threads + 1
+
+        self.wait_for(lambda: len(BuildFailedNotification.sent) == 20)
+        assert len(BuildFailedNotification.sent) == 20
+
+    def test_earlier_windows_wake_the_timer(self):
+        self.coalescer.window = 10
+        self.notify.mail(BuildFailedNotification, to='late@email.com', build=1)
+        self.coalescer.window = 0.05
+        self.notify.mail(BuildFailedNotification, to='early@email.com', build=2)
+
+        self.wait_for(lambda: BuildFailedNotification.sent)
+
+        assert [to for to, _, _ in BuildFailedNotification.sent] == ['early@email.com']
+        assert self.coalescer.pending() == 1
+
+    def test_open_buffers_are_fired_at_exit(self):
+        self.coalescer.window = 10
+        self.notify.mail(BuildFailedNotification, to='dev@email.com', build=1)
+        self.notify.mail(FailingBuildNotification, to='dev@email.com', build=2)
+
+        Coalescer._flush_at_exit()
+
+        assert ('dev@email.com', 'Build failed') in [(to, subject) for to, subject, _ in BuildFailedNotification.sent]
+        assert len(self.coalescer) == 0
+        assert isinstance(self.coalescer.errors[0][1], ConnectionError)
@@ -0,0 +1,141 @@
+import pytest
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.cache import DedupeStore
+from notifications.database import NotificationTable, OratorNotificationTable
+
+
+class CommentNotification(Notifiable):
+
+    def database(self):
+        return self.data({'message': 'New comment', 'post': getattr(self, '_post', 1)})
+
+
+class BrokenNotification(Notifiable):
+
+    def database(self):
+        raise ValueError('missing data')
+
+
+class TestDatabaseChannel:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.table = NotificationTable(':memory:')
+        self.app.bind('NotificationTable', self.table)
+        self.notify = Notify(self.app)
+
+    def test_fire_database_stores_the_notification(self):
+        self.notify.database(CommentNotification, to=1, post=5)
+
+        rows = self.table.feed(1)
+        assert len(rows) == 1
+        assert rows[0]['type'] == 'CommentNotification'
+        assert rows[0]['data'] == {'message': 'New comment', 'post': 5}
+        assert rows[0]['read_at'] is None
+
+    def test_send_many_inserts_in_one_transaction(self):
+        inserts = []
+        insert = self.table._insert
+        self.table._insert = lambda rows: inserts.append(len(rows)) or insert(rows)
+
+        self.notify.via('database').send_many(CommentNotification, range(100))
+
+        assert inserts == [100]
+        assert self.table.unread_count(42) == 1
+
+    def test_batch_inserts_in_one_transaction(self):
+        inserts = []
+        insert = self.table._insert
+        self.table._insert = lambda rows: inserts.append(len(rows)) or insert(rows)
+
+        with self.notify.batch():
+            for post in range(3):
+                self.notify.database(CommentNotification, to=1, post=post)
+
+        assert inserts == [3]
+        assert self.table.unread_count(1) == 3
+
+    def test_send_many_inserts_in_chunks(self):
+        inserts = []
+        insert = self.table._insert
+        self.table._insert = lambda rows: inserts.append(len(rows)) or insert(rows)
+
+        self.notify.via('database').send_many(CommentNotification, range(1200))
+
+        assert inserts == [500, 500, 200]
+
+    def test_rows_of_finished_sends_survive_a_failed_send(self):
+        self.app.bind('NotificationDedupeStore', DedupeStore())
+        notify = self.notify.via('database')
+
+        with pytest.raises(ValueError):
+            notify.send(CommentNotification, BrokenNotification, to=1, idempotency_key='k')
+
+        assert [result.status for result in notify.report] == ['sent', 'failed']
+        assert self.table.unread_count(1) == 1
+
+    def test_feed_is_paged_newest_first(self):
+        for post in range(5):
+            self.notify.database(CommentNotification, to=1, post=post)
+
+        first = self.table.feed(1, limit=2)
+        second = self.table.feed(1, limit=2, before=first[-1]['id'])
+        assert [row['data']['post'] for row in first + second] == [4, 3, 2, 1]
+
+    def test_mark_read(self):
+        for post in range(3):
+            self.notify.database(CommentNotification, to=1, post=post)
+        self.notify.database(CommentNotification, to=2)
+
+        newest = self.table.unread(1, limit=1)[0]['id']
+        assert self.table.mark_read(1, [newest]) == 1
+        assert [row['data']['post'] for row in self.table.unread(1)] == [1, 0]
+
+        assert self.table.mark_read(1) == 2
+        assert self.table.unread_count(1) == 0
+        assert self.table.unread_count(2) == 1
+        assert len(self.table.feed(1)) == 3
+
+    def test_unread_queries_use_the_partial_index(self):
+        plan = self.table._connection.execute(
+            'EXPLAIN QUERY PLAN SELECT id FROM notifications '
+            'WHERE notifiable = ? AND read_at IS NULL ORDER BY id DESC LIMIT 20', ('1',)).fetchall()
+        assert 'notifications_unread' in ' '.join(str(tuple(row)) for row in plan)
+
+
+class TestOratorNotificationTable:
+
+    def setup_method(self):
+        orator = pytest.importorskip('orator')
+        self.db = orator.DatabaseManager({'sqlite': {'driver': 'sqlite', 'database': ':memory:'}})
+        self.table = OratorNotificationTable(self.db)
+        self.table.create_table()
+
+    def test_feed_is_paged_newest_first(self):
+        for post in range(5):
+            self.table.add(1, 'CommentNotification', {'post': post})
+
+        first = self.table.feed(1, limit=2)
+        second = self.table.feed(1, limit=2, before=first[-1]['id'])
+        assert [row['data']['post'] for row in first + second] == [4, 3, 2, 1]
+
+    def test_mark_read(self):
+        for post in range(3):
+            self.table.add(1, 'CommentNotification', {'post': post})
+
+        newest = self.table.unread(1, limit=1)[0]['id']
+        assert self.table.mark_read(1, [newest]) == 1
+        assert self.table.mark_read(1) == 2
+        assert self.table.unread_count(1) == 0
+
+    def test_transactions_insert_in_chunks(self):
+        self.table.CHUNK_SIZE = 2
+        with self.table.transaction():
+            for post in range(5):
+                self.table.add(1, 'CommentNotification', {'post': post})
+            assert self.table.unread_count(1) == 0
+
+        assert self.table.unread_count(1) == 5
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.dispatch import DispatchMetrics, Histogram
+from notifications.providers import NotificationProvider
+
+
+class PingNotification(Notifiable):
+
+    def ping(self):
+        pass
+
+    def fire_ping(self):
+        return 'pong'
+
+    async def fire_ping_async(self):
+        return 'pong'
+
+
+class DryNotification(PingNotification):
+
+    def ping(self):
+        self.dry()
+
+
+class BrokenNotification(PingNotification):
+
+    def fire_ping(self):
+        raise ConnectionError('SMTP relay is down')
+
+
+class TestHistogram:
+
+    def test_observations_fall_in_buckets(self):
+        histogram = Histogram(buckets=(0.01, 0.1, 1))
+        for seconds in (0.005, 0.05, 0.05, 5):
+            histogram.observe(seconds)
+
+        assert histogram.counts == [1, 2, 0, 1]
+        assert histogram.percentile(50) == 0.1
+        assert histogram.percentile(100) is None
+
+
+class TestDispatchMetrics:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.metrics = DispatchMetrics()
+        self.app.bind('NotificationMetrics', self.metrics)
+        self.notify = Notify(self.app)
+
+    def test_counts_sent_dry_and_failed(self):
+        self.notify.via('ping').send(PingNotification, PingNotification, DryNotification)
+        with pytest.raises(ConnectionError):
+            self.notify.via('ping').send(BrokenNotification)
+
+        assert self.metrics.count('sent') == 2
+        assert self.metrics.count('dry', channel='ping') == 1
+        assert self.metrics.count('failed', notification_class=BrokenNotification) == 1
+        assert self.metrics.count('sent', notification_class=BrokenNotification) == 0
+
+    def test_times_build_and_transport(self):
+        self.notify.ping(PingNotification)
+
+        assert self.metrics.histogram('ping', PingNotification, 'build').count == 1
+        assert self.metrics.histogram('ping', PingNotification, 'transport').count == 1
+        assert 'ping.PingNotification.sent' in self.metrics.snapshot()['counters']
+
+    def test_hooks_are_called(self):
+        events = []
+        self.metrics.before(lambda channel, notification_class: events.append(('before', notification_class)))
+        self.metrics.after(lambda result: events.append(('after', result.status, result.result)))
+
+        self.notify.ping(PingNotification)
+
+        assert events == [('before', PingNotification), ('after', 'sent', 'pong')]
+
+    def test_async_and_bulk_sends_are_counted(self):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.notify.via('ping').send_async(PingNotification))
+        loop.close()
+        self.notify.via('ping').send_many(PingNotification, ['a@email.com', 'b@email.com'])
+
+        assert self.metrics.count('sent') == 3
+
+    def test_provider_registers_hooks(self):
+        events = []
+
+        class Provider(NotificationProvider):
+            after_hooks = [events.append]
+
+        provider = Provider().load_app(self.app)
+        provider.register()
+        provider.boot()
+        self.app.make('Notify').ping(PingNotification)
+
+        assert [result.status for result in events] == ['sent']
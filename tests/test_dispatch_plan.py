@@ -0,0 +1,89 @@
+import pytest
+from masonite.app import App
+from masonite.exceptions import ContainerError
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.dispatch import DispatchPlan
+
+
+class AuditNotification(Notifiable):
+
+    def ping(self, container: App):
+        self.container = container
+
+    def fire_ping(self):
+        return self._to
+
+
+class UnannotatedNotification(Notifiable):
+
+    def ping(self, request):
+        pass
+
+    def fire_ping(self):
+        pass
+
+
+class BrokenSignatureNotification(Notifiable):
+
+    def ping(self, container: App):
+        len(container, self)
+
+    def fire_ping(self):
+        pass
+
+
+class PublicContainer:
+
+    def __init__(self, app):
+        self.app = app
+        self.resolved = []
+
+    def resolve(self, obj):
+        self.resolved.append(obj.__name__)
+        return self.app.resolve(obj)
+
+
+class TestDispatchPlan:
+
+    def setup_method(self):
+        DispatchPlan.forget()
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.app.bind('Container', self.app)
+        self.notify = Notify(self.app)
+
+    def test_plans_are_cached_per_class_and_channel(self):
+        assert DispatchPlan.get(AuditNotification, 'ping') is DispatchPlan.get(AuditNotification, 'ping')
+        assert DispatchPlan.get(AuditNotification, 'ping') is not DispatchPlan.get(AuditNotification, 'mail')
+
+    def test_signatures_are_not_inspected_per_send(self, monkeypatch):
+        self.notify.via('ping').send(AuditNotification, to='audit@email.com')
+        monkeypatch.setattr(App, 'get_parameters', lambda *args: pytest.fail('signature was inspected'))
+
+        report = self.notify.via('ping').send(AuditNotification, AuditNotification, to='audit@email.com').report
+
+        assert [result.result for result in report] == ['audit@email.com'] * 2
+        assert self.notify.called_notifications[0].container is self.app
+
+    def test_unresolvable_parameters_raise_container_errors(self):
+        with pytest.raises(ContainerError):
+            self.notify.via('ping').send(UnannotatedNotification)
+
+    def test_missing_channels_raise(self):
+        with pytest.raises(AttributeError):
+            self.notify.via('pager').send(AuditNotification)
+
+    def test_containers_without_private_lookups_resolve_as_usual(self):
+        container = PublicContainer(self.app)
+        plan = DispatchPlan.get(AuditNotification, 'ping')
+        notification = plan.composed(self.app)
+
+        plan.call(container, notification, plan.build)
+
+        assert notification.container is self.app
+        assert container.resolved == ['ping']
+
+    def test_type_errors_raise_container_errors(self):
+        with pytest.raises(ContainerError):
+            self.notify.via('ping').send(BrokenSignatureNotification)
@@ -0,0 +1,138 @@
+import os
+
+import pytest
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.cache import DedupeStore, SqliteDedupeStore
+from notifications.dispatch import DispatchMetrics
+from notifications.exceptions import NotificationFailed
+from notifications.transports import SlackScheduler, SlackTransport
+
+
+class AlertNotification(Notifiable):
+
+    built = 0
+    sent = []
+    fail = False
+
+    def alert(self):
+        AlertNotification.built += 1
+
+    def fire_alert(self):
+        if AlertNotification.fail:
+            raise ConnectionError('SMTP is down')
+        AlertNotification.sent.append(self._to)
+
+
+class SlackAlertNotification(Notifiable):
+
+    def slack(self):
+        self.token('token').channel('C1').text('Server down')
+
+
+class TestIdempotency:
+
+    def setup_method(self):
+        AlertNotification.built = 0
+        AlertNotification.sent = []
+        AlertNotification.fail = False
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.store = DedupeStore()
+        self.app.bind('NotificationDedupeStore', self.store)
+        self.notify = Notify(self.app)
+
+    def test_duplicates_are_skipped_before_building(self):
+        for _ in range(3):
+            self.notify.via('alert').send(AlertNotification, to='a@email.com', idempotency_key='job-1')
+
+        assert AlertNotification.sent == ['a@email.com']
+        assert AlertNotification.built == 1
+        assert self.notify.report.results[0].status == 'duplicate'
+
+    def test_derived_keys_depend_on_the_options(self):
+        for to in ('a@email.com', 'a@email.com', 'b@email.com'):
+            self.notify.alert(AlertNotification, to=to, idempotency_key=True)
+
+        assert AlertNotification.sent == ['a@email.com', 'b@email.com']
+
+    def test_failed_sends_can_be_retried(self):
+        AlertNotification.fail = True
+        with pytest.raises(ConnectionError):
+            self.notify.alert(AlertNotification, to='a@email.com', idempotency_key='job-1')
+
+        AlertNotification.fail = False
+        self.notify.alert(AlertNotification, to='a@email.com', idempotency_key='job-1')
+        assert AlertNotification.sent == ['a@email.com']
+
+    def test_sends_with_a_failed_outcome_can_be_retried(self, slack_server):
+        slack_server.responses['chat.postMessage'] = (503, {}, {'ok': False, 'error': 'service_unavailable'})
+        self.app.bind('SlackScheduler', SlackScheduler(SlackTransport(base_url=slack_server.url)))
+
+        self.notify.via('slack').send(SlackAlertNotification, idempotency_key='job-1')
+        assert self.notify.report.results[0].status == 'failed'
+        with pytest.raises(NotificationFailed):
+            self.notify.report.raise_first()
+
+        slack_server.responses['chat.postMessage'] = {'ok': True}
+        self.notify.via('slack').send(SlackAlertNotification, idempotency_key='job-1')
+
+        assert self.notify.report.results[0].status == 'sent'
+        assert len(slack_server.calls) == 2
+
+    def test_send_many_keys_every_recipient(self):
+        recipients = ['a@email.com', 'b@email.com']
+        self.notify.via('alert').send_many(AlertNotification, recipients[:1], idempotency_key='newsletter')
+        self.notify.via('alert').send_many(AlertNotification, recipients, idempotency_key='newsletter')
+
+        assert AlertNotification.sent == ['a@email.com', 'b@email.com']
+
+    def test_duplicates_are_counted(self):
+        metrics = DispatchMetrics()
+        self.app.bind('NotificationMetrics', metrics)
+        self.notify.alert(AlertNotification, to='a@email.com', idempotency_key='job-1')
+        self.notify.alert(AlertNotification, to='a@email.com', idempotency_key='job-1')
+
+        assert metrics.count('sent') == 1
+        assert metrics.count('duplicate') == 1
+
+
+class TestDedupeStore:
+
+    def test_keys_expire(self):
+        store = DedupeStore(ttl=-1)
+        assert store.claim('key')
+        assert store.claim('key')
+
+    def test_least_recently_used_key_is_evicted(self):
+        store = DedupeStore(size=2)
+        store.claim('first')
+        store.claim('second')
+        store.claim('third')
+        assert 'first' not in store
+        assert len(store) == 2
+
+
+class TestSqliteDedupeStore:
+
+    def test_keys_are_shared_between_connections(self, tmpdir):
+        path = os.path.join(str(tmpdir), 'keys.sqlite3')
+        first = SqliteDedupeStore(path)
+        second = SqliteDedupeStore(path)
+
+        assert first.claim('key')
+        assert not second.claim('key')
+        assert 'key' in second
+
+        second.forget('key')
+        assert first.claim('key')
+
+    def test_expired_keys_can_be_claimed_and_purged(self):
+        store = SqliteDedupeStore(':memory:', ttl=-1)
+        assert store.claim('key')
+        assert store.claim('key')
+        assert len(store) == 0
+
+        store.purge()
+        assert store._connection.execute('SELECT COUNT(*) FROM notification_keys').fetchone()[0] == 0
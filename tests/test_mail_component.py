@@ -0,0 +1,89 @@
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.cache import SnippetCache
+
+
+class MockMailer:
+
+    def __init__(self):
+        self.sent = []
+
+    def driver(self, driver):
+        return self
+
+    def to(self, to):
+        self.to_address = to
+        return self
+
+    def subject(self, subject):
+        return self
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+class MockStreamingMailer(MockMailer):
+
+    def stream(self, fragments):
+        self.sent.append(list(fragments))
+
+
+class ReportNotification(Notifiable):
+
+    def mail(self):
+        self.subject('Daily report')
+        for number in range(200):
+            self.line('Row {}'.format(number))
+
+
+class StreamedReportNotification(ReportNotification):
+
+    def mail(self):
+        super().mail()
+        self.stream()
+
+
+class TestMailComponent:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.mailer = MockMailer()
+        self.app.bind('Mail', self.mailer)
+        self.notify = Notify(self.app)
+
+    def test_body_is_built_from_fragments(self):
+        self.notify.mail(ReportNotification, to='test@email.com')
+        notification = self.notify.called_notifications[0]
+
+        assert len(notification._fragments) == 200
+        assert self.mailer.sent == [notification.template]
+        assert 'Row 199' in self.mailer.sent[0]
+
+    def test_template_can_be_assigned(self):
+        notification = ReportNotification(self.app)
+        notification.template = '<p>Hello</p>'
+        notification.line('World')
+
+        assert notification.template.startswith('<p>Hello</p>')
+        assert 'World' in notification.template
+
+    def test_stream_hands_fragments_to_streaming_drivers(self):
+        self.mailer = MockStreamingMailer()
+        self.app.bind('Mail', self.mailer)
+        self.notify.mail(StreamedReportNotification, to='test@email.com')
+
+        assert len(self.mailer.sent[0]) == 200
+
+    def test_stream_falls_back_to_the_joined_body(self):
+        self.notify.mail(StreamedReportNotification, to='test@email.com')
+
+        assert isinstance(self.mailer.sent[0], str)
+
+    def test_dry_emails_are_never_rendered(self):
+        cache = SnippetCache()
+        self.app.bind('MailSnippetCache', cache)
+        Notify(self.app).mail(ReportNotification, to='user@email.com', run=False)
+
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0}
@@ -0,0 +1,196 @@
+import json
+import pickle
+
+import pytest
+
+from masonite import Queue
+from masonite.app import App
+from masonite.queues import ShouldQueue
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.cache import SnippetCache
+from notifications.exceptions import NotificationFailed
+from notifications.jobs import JobBuffer, MailBatchJob, MailJob
+
+
+class MockMailer:
+
+    def __init__(self):
+        self.sent = []
+
+    def driver(self, driver):
+        return self
+
+    def to(self, to):
+        self.to_address = to
+        return self
+
+    def subject(self, subject):
+        return self
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+class BouncingMailer(MockMailer):
+
+    def to(self, to):
+        if to.startswith('bounce'):
+            raise ConnectionError('mailbox unavailable')
+        return super().to(to)
+
+
+class RecordingQueue:
+
+    def __init__(self):
+        self.pushed = []
+        self.channels = []
+
+    def push(self, *objects, args=(), channel=None):
+        self.pushed.extend(objects)
+        self.channels.append(channel)
+
+
+class QueuedNotification(ShouldQueue, Notifiable):
+
+    def mail(self):
+        self.subject('Queued') \
+            .driver('terminal') \
+            .line('Sent from a worker')
+
+
+class UnserializableNotification(ShouldQueue, Notifiable):
+
+    def mail(self):
+        self.subject('Queued') \
+            .driver('terminal') \
+            .view('/notifications/snippets/mail/line', {'message': object})
+
+
+class ViewNotification(ShouldQueue, Notifiable):
+
+    def mail(self):
+        self.subject('Queued') \
+            .driver('terminal') \
+            .view('/notifications/snippets/mail/line', {'message': 'From the view'}) \
+            .line('From a snippet')
+
+
+class TestMailJob:
+
+    def test_pickles_only_the_payload(self):
+        job = MailJob('smtp', 'user@email.com', 'Hello', '<p>Hi</p>', container=App())
+        restored = pickle.loads(pickle.dumps(job))
+
+        assert restored.to_dict() == job.to_dict()
+        assert restored.container is None
+        assert b'masonite' not in pickle.dumps(job)
+
+    def test_compresses_large_bodies(self):
+        body = '<p>Row</p>' * 1000
+        job = MailJob('smtp', 'user@email.com', 'Report', body, compress_over=100)
+
+        assert job.compressed
+        assert len(job.body) < len(body) / 10
+        assert MailJob.from_dict(job.to_dict()).message() == body
+
+    def test_small_bodies_are_not_compressed(self):
+        assert not MailJob('smtp', 'user@email.com', 'Hi', 'Hi', compress_over=100).compressed
+
+    def test_handle_sends_through_the_driver(self):
+        app = App()
+        mailer = MockMailer()
+        app.bind('Mail', mailer)
+
+        MailJob('terminal', 'user@email.com', 'Hello', '<p>Hi</p>', container=app).handle()
+
+        assert mailer.sent == ['<p>Hi</p>']
+        assert mailer.to_address == 'user@email.com'
+
+
+class TestJobBuffer:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.queue = RecordingQueue()
+        self.app.swap(Queue, self.queue)
+
+    def test_pushes_in_chunks(self):
+        buffer = JobBuffer(self.app, chunk_size=2)
+        for number in range(5):
+            buffer.append(MailJob('terminal', 'user{}@email.com'.format(number), 'Hi', 'Hi'))
+        buffer.flush()
+
+        assert [len(job) for job in self.queue.pushed] == [2, 2, 1]
+        assert all(isinstance(job, MailBatchJob) for job in self.queue.pushed)
+
+    def test_queued_notifications_push_single_jobs(self):
+        Notify(self.app).mail(QueuedNotification, to='user@email.com')
+
+        assert isinstance(self.queue.pushed[0], MailJob)
+        assert 'Sent from a worker' in self.queue.pushed[0].message()
+
+    def test_queued_bodies_are_rendered_by_the_worker(self):
+        cache = SnippetCache()
+        self.app.bind('MailSnippetCache', cache)
+        Notify(self.app).mail(QueuedNotification, to='user@email.com')
+
+        job = pickle.loads(pickle.dumps(self.queue.pushed[0]))
+        assert job.deferred
+        assert cache.stats()['misses'] == 0
+
+        job.container = self.app
+        assert 'Sent from a worker' in job.message()
+        assert cache.stats()['misses'] == 1
+
+    def test_views_are_rendered_before_queueing(self):
+        Notify(self.app).mail(ViewNotification, to='user@email.com')
+
+        job = self.queue.pushed[0]
+        (view_kind, view, _), (snippet_kind, snippet, _) = json.loads(job.body)
+        assert job.deferred
+        assert view_kind == 'text' and 'From the view' in view
+        assert (snippet_kind, snippet) == ('snippet', 'line')
+
+    def test_bodies_that_can_not_be_serialized_are_rendered(self):
+        Notify(self.app).mail(UnserializableNotification, to='user@email.com')
+
+        assert not self.queue.pushed[0].deferred
+        assert '&lt;class' in self.queue.pushed[0].body
+
+    def test_send_many_pushes_one_job_per_chunk(self):
+        recipients = ('user{}@email.com'.format(number) for number in range(1200))
+        Notify(self.app).via('mail').send_many(QueuedNotification, recipients)
+
+        assert [len(job) for job in self.queue.pushed] == [500, 500, 200]
+
+    def test_batch_handle_sends_every_email(self):
+        mailer = MockMailer()
+        self.app.bind('Mail', mailer)
+        jobs = [MailJob('terminal', 'user{}@email.com'.format(number), 'Hi', 'Body') for number in range(3)]
+
+        pickle.loads(pickle.dumps(MailBatchJob(jobs)))
+        MailBatchJob(jobs, container=self.app).handle()
+
+        assert mailer.sent == ['Body'] * 3
+
+    def test_batch_handle_pushes_back_only_failed_emails(self):
+        mailer = BouncingMailer()
+        self.app.bind('Mail', mailer)
+        jobs = [MailJob('terminal', to, 'Hi', 'Body') for to in ('a@email.com', 'bounce@email.com', 'b@email.com')]
+
+        MailBatchJob(jobs, container=self.app, channel='bulk').handle()
+
+        assert mailer.sent == ['Body', 'Body']
+        retry = self.queue.pushed[0]
+        assert [job.to for job in retry.jobs] == ['bounce@email.com']
+        assert (retry.attempts, self.queue.channels) == (2, ['bulk'])
+
+    def test_batch_handle_raises_on_the_last_attempt(self):
+        self.app.bind('Mail', BouncingMailer())
+        jobs = [MailJob('terminal', 'bounce@email.com', 'Hi', 'Body')]
+
+        with pytest.raises(NotificationFailed):
+            MailBatchJob(jobs, container=self.app, attempts=3).handle()
+        assert self.queue.pushed == []
@@ -0,0 +1,78 @@
+import threading
+
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.transports import MailSession
+
+
+class SmtpNotification(Notifiable):
+
+    def mail(self):
+        self.subject('Batch') \
+            .driver('smtp') \
+            .line('Sent over a shared connection')
+
+
+class TestMailSession:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.notify = Notify(self.app)
+
+    def bind_config(self, port):
+        class MailConfig:
+            DRIVER = 'smtp'
+            FROM = {'address': 'hello@example.com', 'name': 'Masonite'}
+            DRIVERS = {'smtp': {'host': '127.0.0.1', 'port': port, 'username': '', 'password': ''}}
+
+        self.app.bind('MailConfig', MailConfig)
+
+    def test_batch_reuses_one_connection(self, smtp_server):
+        self.bind_config(smtp_server.port)
+
+        with self.notify.batch() as session:
+            for number in range(5):
+                self.notify.mail(SmtpNotification, to='user{}@email.com'.format(number))
+
+        assert session.sent == 5
+        assert smtp_server.connections == 1
+        assert len(smtp_server.messages) == 5
+        assert 'Sent over a shared connection' in smtp_server.messages[0]
+        assert session._smtp is None
+
+    def test_session_reconnects_when_connection_drops(self, smtp_server):
+        self.bind_config(smtp_server.port)
+        smtp_server.drop_after = 2
+
+        with MailSession(self.app) as session:
+            for number in range(5):
+                session.send('smtp', 'user{}@email.com'.format(number), 'Batch', '<p>Hi</p>')
+
+        assert len(smtp_server.messages) == 5
+        assert session.connections == 3
+
+    def test_notifications_outside_batch_do_not_use_session(self, smtp_server):
+        self.bind_config(smtp_server.port)
+
+        with self.notify.batch():
+            pass
+
+        assert self.notify._mail_session is None
+
+    def test_other_threads_are_not_part_of_the_batch(self, smtp_server):
+        self.bind_config(smtp_server.port)
+        batches = []
+
+        def look():
+            batches.append((self.notify._mail_session, self.notify._job_buffer))
+
+        with self.notify.batch() as session:
+            thread = threading.Thread(target=look)
+            thread.start()
+            thread.join()
+            self.notify.mail(SmtpNotification, to='user@email.com')
+
+        assert batches == [(None, None)]
+        assert session.sent == 1
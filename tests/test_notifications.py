@@ -1,3 +1,5 @@
+import asyncio
+
 from masonite import Mail, Queue
 from masonite.app import App
 from masonite.drivers import (MailMailgunDriver, MailTerminalDriver,
@@ -137,3 +139,10 @@ class TestNotifiable:
         notifications = self.notify.via('mail').send(
             ShouldQueueWelcomeNotification, to="test@email.com").called_notifications
         assert isinstance(notifications[0], ShouldQueueWelcomeNotification)
+
+    def test_can_send_async_with_via_method(self):
+        loop = asyncio.new_event_loop()
+        notifications = loop.run_until_complete(self.notify.via('mail', 'slack').send_async(
+            WelcomeNotification, to="test@email.com")).called_notifications
+        loop.close()
+        assert len(notifications) == 2
@@ -0,0 +1,139 @@
+import os
+import time
+
+import pytest
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.cache import DedupeStore
+from notifications.outbox import Outbox, OutboxWorker
+from notifications.transports import SlackScheduler, SlackTransport
+
+
+class OutboxNotification(Notifiable):
+
+    def mail(self):
+        self.subject('Outbox').driver('smtp').line('Delivered by the worker')
+
+    def slack(self):
+        self.token('token').channel('C1').text('Delivered by the worker')
+
+
+class BrokenNotification(Notifiable):
+
+    def mail(self):
+        raise ValueError('missing template')
+
+
+class TestOutbox:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.outbox = Outbox(':memory:')
+        self.notify = Notify(self.app).outbox(self.outbox)
+
+    def bind_config(self, port):
+        class MailConfig:
+            DRIVER = 'smtp'
+            FROM = {'address': 'hello@example.com', 'name': 'Masonite'}
+            DRIVERS = {'smtp': {'host': '127.0.0.1', 'port': port, 'username': '', 'password': ''}}
+
+        self.app.bind('MailConfig', MailConfig)
+
+    def test_send_stores_rendered_payloads(self):
+        self.notify.via('mail', 'slack').send(OutboxNotification, to='user@email.com')
+
+        rows = self.outbox.claim()
+        assert [row['channel'] for row in rows] == ['mail', 'slack']
+        assert rows[0]['payload']['to'] == 'user@email.com'
+        assert 'Delivered by the worker' in rows[0]['payload']['body']
+        assert rows[1]['payload']['method'] == 'chat.postMessage'
+
+    def test_transaction_writes_rows_together(self):
+        with self.outbox.transaction():
+            self.outbox.add('mail', {})
+            self.outbox.add('mail', {})
+            assert len(self.outbox) == 0
+
+        assert len(self.outbox) == 2
+
+    def test_rows_of_finished_sends_survive_a_failed_send(self):
+        self.app.bind('NotificationDedupeStore', DedupeStore())
+        notify = self.notify.via('mail')
+
+        with pytest.raises(ValueError):
+            notify.send(OutboxNotification, BrokenNotification, to='user@email.com', idempotency_key='k')
+
+        assert [result.status for result in notify.report] == ['sent', 'failed']
+        assert len(self.outbox) == 1
+
+        notify.send(OutboxNotification, to='user@email.com', idempotency_key='k')
+        assert [result.status for result in notify.report] == ['duplicate']
+
+    def test_sends_whose_rows_are_not_written_fail(self):
+        self.app.bind('NotificationDedupeStore', DedupeStore())
+        self.outbox.close()
+        notify = self.notify.via('mail')
+
+        with pytest.raises(Exception):
+            notify.send(OutboxNotification, to='user@email.com', idempotency_key='k')
+
+        assert [result.status for result in notify.report] == ['failed']
+        self.notify.outbox(Outbox(':memory:')).send(OutboxNotification, to='user@email.com', idempotency_key='k')
+        assert [result.status for result in self.notify.report] == ['sent']
+
+    def test_claimed_rows_are_leased(self):
+        self.outbox.add('mail', {})
+        assert len(self.outbox.claim()) == 1
+        assert self.outbox.claim() == []
+
+        self.outbox.lease = -1
+        self.outbox.retry(1, 'error', -1)
+        assert self.outbox.claim()[0]['attempts'] == 2
+
+    def test_worker_delivers_mail_and_slack(self, smtp_server, slack_server):
+        self.bind_config(smtp_server.port)
+        self.app.bind('SlackScheduler', SlackScheduler(SlackTransport(base_url=slack_server.url)))
+        for number in range(3):
+            self.notify.via('mail', 'slack').send(OutboxNotification, to='user{}@email.com'.format(number))
+
+        counts = OutboxWorker(self.app, self.outbox).drain()
+
+        assert counts == {'sent': 6, 'retried': 0, 'failed': 0}
+        assert len(smtp_server.messages) == 3
+        assert smtp_server.connections == 1
+        assert len(slack_server.calls) == 3
+        assert self.outbox.stats() == {}
+
+    def test_worker_retries_then_fails(self, slack_server):
+        slack_server.responses['chat.postMessage'] = {'ok': False, 'error': 'channel_not_found'}
+        self.app.bind('SlackScheduler', SlackScheduler(SlackTransport(base_url=slack_server.url)))
+        self.notify.slack(OutboxNotification)
+
+        worker = OutboxWorker(self.app, self.outbox, max_attempts=2, backoff=0)
+        worker.drain()
+
+        assert worker.counts == {'sent': 0, 'retried': 1, 'failed': 1}
+        assert self.outbox.stats() == {'failed': 1}
+
+    def test_rows_survive_a_restart(self, tmpdir):
+        path = os.path.join(str(tmpdir), 'outbox.sqlite3')
+        Notify(self.app).outbox(Outbox(path)).mail(OutboxNotification, to='user@email.com')
+
+        assert len(Outbox(path)) == 1
+
+    def test_worker_wakes_up_for_new_rows(self, slack_server):
+        self.app.bind('SlackScheduler', SlackScheduler(SlackTransport(base_url=slack_server.url)))
+        worker = OutboxWorker(self.app, self.outbox)
+        thread = worker.start(sleep=30)
+
+        self.notify.slack(OutboxNotification)
+        deadline = time.time() + 5
+        while not slack_server.calls and time.time() < deadline:
+            time.sleep(0.01)
+        worker.stop()
+        thread.join(5)
+
+        assert len(slack_server.calls) == 1
+        assert not thread.is_alive()
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+
+
+class Tracker:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+
+class PingNotification(Notifiable):
+
+    def ping(self):
+        pass
+
+    def fire_ping(self):
+        with Tracker.lock:
+            Tracker.in_flight += 1
+            Tracker.peak = max(Tracker.peak, Tracker.in_flight)
+        time.sleep(0.02)
+        with Tracker.lock:
+            Tracker.in_flight -= 1
+
+
+class BrokenNotification(Notifiable):
+
+    def ping(self):
+        pass
+
+    def fire_ping(self):
+        raise ConnectionError('Slack is down')
+
+
+class TestParallelDispatch:
+
+    def setup_method(self):
+        Tracker.in_flight = Tracker.peak = 0
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.notify = Notify(self.app)
+
+    def test_parallel_send_runs_on_thread_pool(self):
+        self.notify.via('ping').send(*[PingNotification] * 4, parallel=True, max_workers=4)
+
+        assert Tracker.peak > 1
+        assert len(self.notify.called_notifications) == 4
+        assert self.notify.report.ok
+
+    def test_parallel_send_is_bounded(self):
+        self.notify.via('ping').send(*[PingNotification] * 6, parallel=True, max_workers=2)
+
+        assert Tracker.peak <= 2
+
+    def test_parallel_send_collects_exceptions(self):
+        report = self.notify.via('ping').send(
+            PingNotification, BrokenNotification, parallel=True, to='test@email.com').report
+
+        assert len(report) == 2
+        assert [result.notification_class for result in report.succeeded] == [PingNotification]
+        assert isinstance(report.failed[0].exception, ConnectionError)
+        assert report.succeeded[0].notification._to == 'test@email.com'
+        with pytest.raises(ConnectionError):
+            report.raise_first()
+
+    def test_sequential_send_still_raises(self):
+        with pytest.raises(ConnectionError):
+            self.notify.via('ping').send(PingNotification, BrokenNotification)
+
+        assert len(self.notify.report.succeeded) == 1
+        assert len(self.notify.report.failed) == 1
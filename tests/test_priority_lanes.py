@@ -0,0 +1,124 @@
+import queue
+import threading
+
+import pytest
+from config import notifications as config
+from masonite import Queue
+from masonite.app import App
+from masonite.queues import ShouldQueue
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.dispatch import LaneDispatcher
+
+
+class ChannelQueue:
+
+    def __init__(self):
+        self.pushed = []
+
+    def push(self, *objects, args=(), channel=None):
+        self.pushed.extend((channel, obj) for obj in objects)
+
+
+class PasswordResetNotification(Notifiable):
+    _priority = 'urgent'
+
+    def ping(self):
+        pass
+
+    def fire_ping(self):
+        return threading.current_thread().name
+
+
+class NewsletterNotification(ShouldQueue, Notifiable):
+    _priority = 'bulk'
+
+    def mail(self):
+        self.subject('News').line('Read all about it')
+
+
+class TestLaneDispatcher:
+
+    def test_urgent_sends_run_while_bulk_is_saturated(self):
+        lanes = LaneDispatcher({
+            'urgent': {'concurrency': 1},
+            'bulk': {'concurrency': 1},
+        })
+        gate = threading.Event()
+        bulk = [lanes.submit('bulk', gate.wait) for _ in range(5)]
+
+        assert lanes.submit('urgent', lambda: 'sent').result(timeout=5) == 'sent'
+        assert not any(future.done() for future in bulk)
+
+        gate.set()
+        assert all(future.result(timeout=5) for future in bulk)
+        lanes.shutdown()
+
+    def test_free_workers_are_shared_by_weight(self):
+        lanes = LaneDispatcher({
+            'urgent': {'weight': 3, 'concurrency': 1},
+            'bulk': {'weight': 1, 'concurrency': 1},
+        }, workers=1)
+        gate = threading.Event()
+        order = []
+        lanes.submit('urgent', gate.wait)
+        futures = [lanes.submit(lane, order.append, lane) for lane in ['bulk'] * 4 + ['urgent'] * 4]
+
+        gate.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order[:4].count('urgent') == 3
+        lanes.shutdown()
+
+    def test_full_lanes_apply_backpressure(self):
+        lanes = LaneDispatcher({'bulk': {'concurrency': 1, 'size': 1}})
+        gate = threading.Event()
+        lanes.submit('bulk', gate.wait)
+        lanes.submit('bulk', gate.wait)
+
+        with pytest.raises(queue.Full):
+            lanes.submit('bulk', gate.wait, timeout=0.01)
+
+        gate.set()
+        lanes.shutdown()
+
+    def test_unknown_lanes_use_the_default_lane(self):
+        lanes = LaneDispatcher()
+
+        assert lanes.lane('paging') is lanes.lanes['default']
+
+
+class TestPriorityDispatch:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.lanes = LaneDispatcher()
+        self.app.bind('NotificationLanes', self.lanes)
+
+    def teardown_method(self):
+        self.lanes.shutdown()
+
+    def test_parallel_sends_run_in_the_lane_of_their_priority(self):
+        notify = Notify(self.app).via('ping').send(PasswordResetNotification, parallel=True)
+
+        assert notify.report.ok
+        assert self.lanes.stats()['urgent']['done'] == 1
+
+    def test_priority_of_the_send_overrides_the_class(self):
+        notify = Notify(self.app).via('ping').send(PasswordResetNotification, parallel=True, priority='bulk')
+
+        assert notify.called_notifications[0]._priority == 'bulk'
+        assert self.lanes.stats()['bulk']['done'] == 1
+
+    def test_queued_emails_are_pushed_to_the_channel_of_their_lane(self, monkeypatch):
+        monkeypatch.setitem(config.PRIORITY, 'queues', {'bulk': 'notifications-bulk'})
+        channel_queue = ChannelQueue()
+        self.app.swap(Queue, channel_queue)
+
+        Notify(self.app).mail(NewsletterNotification, to='user@email.com')
+        Notify(self.app).via('mail').send_many(NewsletterNotification, ['a@email.com', 'b@email.com'])
+
+        assert [channel for channel, _ in channel_queue.pushed] == ['notifications-bulk'] * 2
+        assert len(channel_queue.pushed[1][1].jobs) == 2
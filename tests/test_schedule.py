@@ -0,0 +1,122 @@
+import asyncio
+import datetime
+import os
+import time
+
+import pytest
+from masonite.app import App
+from notifications import Notifiable, Notify
+from notifications.schedule import Schedule, ScheduleWorker
+
+
+class ReminderNotification(Notifiable):
+
+    def ping(self):
+        pass
+
+    def fire_ping(self):
+        self.app.make('Sent').append(self._to)
+
+
+class TestSchedule:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('Sent', [])
+        self.schedule = Schedule(':memory:')
+        self.app.bind('NotificationSchedule', self.schedule)
+        self.notify = Notify(self.app)
+
+    def test_delayed_sends_wait_until_they_are_due(self):
+        notify = self.notify.via('ping').send(ReminderNotification, to='user@email.com', delay=900)
+
+        assert notify.report.results[0].status == 'scheduled'
+        assert self.app.make('Sent') == []
+        assert ScheduleWorker(self.app, self.schedule).drain() == {'sent': 0, 'retried': 0, 'failed': 0}
+        assert 899 < self.schedule.next_due() - time.time() <= 900
+
+    def test_due_sends_are_dispatched(self):
+        self.notify.ping(ReminderNotification, to='user@email.com', at=time.time() - 1)
+
+        ScheduleWorker(self.app, self.schedule).drain()
+
+        assert self.app.make('Sent') == ['user@email.com']
+        assert len(self.schedule) == 0
+
+    def test_sends_are_cancelled_by_key(self):
+        self.notify.ping(ReminderNotification, to='a@email.com', delay=60, schedule_key='reminder:1')
+        self.notify.ping(ReminderNotification, to='b@email.com', delay=60, schedule_key='reminder:2')
+
+        assert self.notify.cancel('reminder:1') == 1
+        assert len(self.schedule) == 1
+
+    def test_scheduling_a_key_again_moves_it(self):
+        self.notify.ping(ReminderNotification, to='user@email.com', delay=60, schedule_key='reminder:1')
+        self.notify.ping(ReminderNotification, to='user@email.com', at=time.time() - 1, schedule_key='reminder:1')
+
+        ScheduleWorker(self.app, self.schedule).drain()
+
+        assert self.app.make('Sent') == ['user@email.com']
+        assert len(self.schedule) == 0
+
+    def test_time_of_day_is_in_the_recipient_timezone(self):
+        tz = datetime.timezone(datetime.timedelta(hours=-5))
+
+        due_at = self.notify._due_at(at=datetime.time(9), tz=tz)
+        moment = datetime.datetime.fromtimestamp(due_at, tz)
+
+        assert (moment.hour, moment.minute) == (9, 0)
+        assert 0 < due_at - time.time() <= 86400
+
+    def test_failed_sends_are_retried(self):
+        self.notify.ping(ReminderNotification, at=time.time() - 1)
+        self.app.bind('Sent', None)
+
+        worker = ScheduleWorker(self.app, self.schedule, max_attempts=2, backoff=0)
+        worker.drain()
+
+        assert worker.counts == {'sent': 0, 'retried': 1, 'failed': 1}
+        assert self.schedule.stats() == {'failed': 1}
+
+    def test_worker_wakes_up_for_new_sends(self):
+        worker = ScheduleWorker(self.app, self.schedule)
+        thread = worker.start(sleep=30)
+
+        self.notify.ping(ReminderNotification, to='user@email.com', delay=0.05)
+        deadline = time.time() + 5
+        while not self.app.make('Sent') and time.time() < deadline:
+            time.sleep(0.01)
+        worker.stop()
+        thread.join(5)
+
+        assert self.app.make('Sent') == ['user@email.com']
+
+    def test_sends_survive_a_restart(self, tmpdir):
+        path = os.path.join(str(tmpdir), 'schedule.sqlite3')
+        self.app.bind('NotificationSchedule', Schedule(path))
+        self.notify.ping(ReminderNotification, to='user@email.com', delay=60)
+
+        assert len(Schedule(path)) == 1
+
+    def test_send_many_schedules_every_recipient(self):
+        self.notify.via('ping').send_many(
+            ReminderNotification, ['a@email.com', 'b@email.com'], idempotency_key='digest:1', delay=60)
+
+        assert self.app.make('Sent') == []
+        assert len(self.schedule) == 2
+
+        self.schedule._connection.execute('UPDATE notification_schedule SET due_at = 0')
+        ScheduleWorker(self.app, self.schedule).drain()
+
+        assert sorted(self.app.make('Sent')) == ['a@email.com', 'b@email.com']
+
+    def test_send_many_does_not_take_a_schedule_key(self):
+        with pytest.raises(TypeError):
+            self.notify.via('ping').send_many(ReminderNotification, ['a@email.com'], delay=60, schedule_key='r')
+
+    def test_send_async_schedules(self):
+        asyncio.run(self.notify.via('ping').send_async(
+            ReminderNotification, to='user@email.com', delay=60, schedule_key='reminder:1'))
+
+        assert self.app.make('Sent') == []
+        assert self.notify.cancel('reminder:1') == 1
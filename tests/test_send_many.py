@@ -0,0 +1,64 @@
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+
+
+class CountingView:
+
+    def __init__(self, app):
+        self.view = View(app)
+        self.renders = 0
+
+    def render(self, template, dictionary={}):
+        self.renders += 1
+        return self.view.render(template, dictionary)
+
+
+class NewsletterNotification(Notifiable):
+
+    sent = []
+
+    def ping(self):
+        self.view('/notifications/snippets/mail/heading', {'message': 'This month in Masonite'}) \
+            .view('/notifications/snippets/mail/line', {'message': 'Notifications are faster'})
+
+    def fire_ping(self):
+        NewsletterNotification.sent.append((self._to, getattr(self, '_name', None), self.template))
+
+
+class TestSendMany:
+
+    def setup_method(self):
+        NewsletterNotification.sent = []
+        self.app = App()
+        self.view = CountingView(self.app)
+        self.app.bind('View', self.view.render)
+        self.notify = Notify(self.app)
+
+    def test_renders_once_for_every_recipient(self):
+        self.notify.via('ping').send_many(
+            NewsletterNotification, ['a@email.com', 'b@email.com', 'c@email.com'])
+
+        assert self.view.renders == 2
+        assert [to for to, _, _ in NewsletterNotification.sent] == ['a@email.com', 'b@email.com', 'c@email.com']
+        assert all('Notifications are faster' in template for _, _, template in NewsletterNotification.sent)
+
+    def test_recipients_can_set_fields(self):
+        self.notify.via('ping').send_many(
+            NewsletterNotification, [{'to': 'a@email.com', 'name': 'Joe'}])
+
+        assert NewsletterNotification.sent[0][:2] == ('a@email.com', 'Joe')
+
+    def test_recipients_are_streamed_once_across_channels(self):
+        consumed = []
+
+        def recipients():
+            for address in ('a@email.com', 'b@email.com'):
+                consumed.append(address)
+                yield address
+
+        self.notify.via('ping', 'ping').send_many(NewsletterNotification, recipients())
+
+        assert consumed == ['a@email.com', 'b@email.com']
+        assert len(NewsletterNotification.sent) == 4
+        assert len(self.notify.called_notifications) == 2
@@ -0,0 +1,38 @@
+import sys
+import types
+
+from notifications import settings
+from notifications.settings import setting
+
+
+class TestSettings:
+
+    def setup_method(self):
+        settings.forget()
+
+    def teardown_method(self):
+        settings.forget()
+
+    def test_missing_config_file_is_only_looked_up_once(self, monkeypatch):
+        imports = []
+
+        def import_module(name):
+            imports.append(name)
+            raise ModuleNotFoundError(name=name)
+
+        monkeypatch.setattr(settings.importlib, 'import_module', import_module)
+
+        assert setting('slack', 'webhooks', {}) == {}
+        assert setting('slack', 'webhooks', {}) == {}
+        assert imports == ['config.notifications']
+
+    def test_config_file_is_loaded_once(self, monkeypatch):
+        config = types.ModuleType('config.notifications')
+        config.SLACK = {'webhooks': {'#deploys': 'https://hooks.slack.com/services/T/B/X'}}
+        monkeypatch.setitem(sys.modules, 'config.notifications', config)
+
+        assert setting('slack', 'webhooks') == config.SLACK['webhooks']
+
+        monkeypatch.delitem(sys.modules, 'config.notifications')
+        assert setting('slack', 'webhooks') == config.SLACK['webhooks']
+        assert setting('slack', 'missing', 1) == 1
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from masonite.app import App
+from notifications import Notifiable, Notify
+from notifications.components import SlackMessage
+
+
+class ButtonNotification(Notifiable):
+
+    def __init__(self, app):
+        self.app = app
+
+    def slack(self):
+        return self.token('token').channel('C1').text('Deploy').button(
+            'Review', 'http://example.com', confirm={'confirm': {'title': 'Sure?'}})
+
+
+class OptionNotification(Notifiable):
+
+    def slack(self):
+        self.text('Deploy finished')
+
+    def fire_slack(self):
+        OptionNotification.requests.append(self._slack_request()[1])
+
+
+class TestSlackMessage:
+
+    def setup_method(self):
+        self.app = App()
+
+    def test_message_has_no_instance_dict(self):
+        message = SlackMessage()
+        with pytest.raises(AttributeError):
+            message.unknown = True
+
+    def test_only_set_fields_are_stored(self):
+        message = SlackMessage()
+        message.text = 'hello'
+        assert message.fields() == {'text': 'hello'}
+
+    def test_payload_uses_defaults(self):
+        method, payload = ButtonNotification(self.app).channel('C1').text('hi')._slack_request()
+        assert method == 'chat.postMessage'
+        assert payload['username'] == 'My Bot'
+        assert payload['mrkdwn'] is True
+        assert payload['as_user'] is False
+        assert 'attachments' not in payload
+
+    def test_buttons_do_not_leak_between_notifications(self):
+        first = ButtonNotification(self.app).slack()
+        second = ButtonNotification(self.app).slack()
+        attachments = json.loads(second._slack_request()[1]['attachments'])
+        assert len(attachments[0]['actions']) == 1
+        assert first._message is not second._message
+
+    def test_button_keeps_confirm_options(self):
+        payload = ButtonNotification(self.app).slack()._slack_request()[1]
+        action = json.loads(payload['attachments'])[0]['actions'][0]
+        assert action['url'] == 'http://example.com'
+        assert action['confirm'] == {'title': 'Sure?'}
+
+    def test_snippet_only_sends_given_fields(self):
+        method, payload = ButtonNotification(self.app).token('token').channel('C1') \
+            .text('print(1)').as_snippet(file_type='python', name='code.py')._slack_request()
+        assert method == 'files.upload'
+        assert payload['filetype'] == 'python'
+        assert payload['filename'] == 'code.py'
+        assert 'initial_comment' not in payload
+
+    def test_options_set_the_message(self):
+        OptionNotification.requests = []
+        Notify(self.app).slack(OptionNotification, channel='C1', token='xoxb')
+
+        payload = OptionNotification.requests[0]
+        assert (payload['channel'], payload['token'], payload['text']) == ('C1', 'xoxb', 'Deploy finished')
+
+    def test_builders_override_options(self):
+        OptionNotification.requests = []
+        Notify(self.app).slack(OptionNotification, channel='C1', text='Ignored')
+
+        assert OptionNotification.requests[0]['text'] == 'Deploy finished'
+
+    def test_send_many_recipients_change_the_channel(self):
+        OptionNotification.requests = []
+        Notify(self.app).via('slack').send_many(
+            OptionNotification, [{'channel': 'C1'}, {'channel': 'C2'}], token='xoxb')
+
+        assert [payload['channel'] for payload in OptionNotification.requests] == ['C1', 'C2']
+        assert {payload['token'] for payload in OptionNotification.requests} == {'xoxb'}
@@ -0,0 +1,118 @@
+import time
+
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.transports import SlackScheduler, SlackTransport, TokenBucket
+
+
+class SlackNotification(Notifiable):
+
+    def slack(self):
+        return self.token('test_token') \
+            .text('Build failed') \
+            .channel('C1')
+
+
+class TestTokenBucket:
+
+    def test_reservations_queue_once_empty(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert 0.09 < bucket.reserve() <= 0.1
+        assert 0.19 < bucket.reserve() <= 0.2
+
+    def test_pause_holds_back_callers(self):
+        bucket = TokenBucket(rate=10, capacity=5)
+        bucket.pause(1)
+
+        assert bucket.reserve() > 1
+
+    def test_full_once_refilled(self):
+        bucket = TokenBucket(rate=1000, capacity=1)
+        bucket.reserve()
+
+        assert not bucket.full()
+        time.sleep(0.01)
+        assert bucket.full()
+
+
+class TestSlackScheduler:
+
+    def setup_method(self):
+        self.sleeps = []
+
+    def scheduler(self, slack_server, monkeypatch, **options):
+        monkeypatch.setattr(time, 'sleep', self.sleeps.append)
+        return SlackScheduler(SlackTransport(base_url=slack_server.url), **options)
+
+    def test_idle_buckets_are_evicted(self):
+        scheduler = SlackScheduler(SlackTransport(), bucket_cache_size=2)
+        for channel in ('C1', 'C2', 'C3'):
+            scheduler.channel_bucket(channel)
+
+        assert list(scheduler._channels) == ['C2', 'C3']
+
+    def test_buckets_waiting_to_refill_are_kept(self):
+        scheduler = SlackScheduler(SlackTransport(), bucket_cache_size=2, channel_burst=1)
+        scheduler.channel_bucket('C1').reserve()
+        for channel in ('C2', 'C3'):
+            scheduler.channel_bucket(channel)
+
+        assert list(scheduler._channels) == ['C1', 'C2', 'C3']
+
+    def test_returns_outcome(self, slack_server, monkeypatch):
+        slack_server.responses['chat.postMessage'] = {'ok': False, 'error': 'channel_not_found'}
+        outcome = self.scheduler(slack_server, monkeypatch).post('chat.postMessage', {'channel': 'C1'})
+
+        assert not outcome.ok
+        assert outcome.error == 'channel_not_found'
+        assert outcome.channel == 'C1'
+
+    def test_channel_bursts_are_queued(self, slack_server, monkeypatch):
+        scheduler = self.scheduler(slack_server, monkeypatch, channel_rate=1, channel_burst=2)
+
+        outcomes = [scheduler.post('chat.postMessage', {'channel': 'C1'}) for _ in range(4)]
+
+        assert all(outcome.ok for outcome in outcomes)
+        assert len(self.sleeps) == 2
+        assert self.sleeps[1] > self.sleeps[0]
+
+    def test_channels_are_limited_separately(self, slack_server, monkeypatch):
+        scheduler = self.scheduler(slack_server, monkeypatch, channel_burst=1)
+
+        scheduler.post('chat.postMessage', {'channel': 'C1'})
+        scheduler.post('chat.postMessage', {'channel': 'C2'})
+
+        assert self.sleeps == []
+
+    def test_retries_after_rate_limit(self, slack_server, monkeypatch):
+        responses = [(429, {'Retry-After': '2'}, {'ok': False, 'error': 'ratelimited'}), {'ok': True}]
+        slack_server.responses['chat.postMessage'] = lambda data: responses.pop(0)
+
+        outcome = self.scheduler(slack_server, monkeypatch).post('chat.postMessage', {'channel': 'C1'})
+
+        assert outcome.ok
+        assert outcome.attempts == 2
+        assert self.sleeps[0] >= 2
+
+    def test_gives_up_after_max_retries(self, slack_server, monkeypatch):
+        slack_server.responses['chat.postMessage'] = (429, {'Retry-After': '1'}, {'ok': False})
+
+        outcome = self.scheduler(slack_server, monkeypatch, max_retries=2).post('chat.postMessage', {'channel': 'C1'})
+
+        assert not outcome.ok
+        assert outcome.error == 'ratelimited'
+        assert len(slack_server.calls) == 3
+
+    def test_outcomes_are_in_the_dispatch_report(self, slack_server):
+        app = App()
+        app.bind('View', View(app).render)
+        app.bind('SlackTransport', SlackTransport(base_url=slack_server.url))
+
+        report = Notify(app).via('slack').send(SlackNotification).report
+
+        assert report.results[0].result.ok
+        assert report.results[0].result.method == 'chat.postMessage'
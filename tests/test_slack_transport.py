@@ -0,0 +1,41 @@
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable, Notify
+from notifications.transports import SlackTransport
+
+
+class SlackNotification(Notifiable):
+
+    def slack(self):
+        return self.token('test_token') \
+            .text('Deployed!') \
+            .channel('C1')
+
+
+class TestSlackTransport:
+
+    def test_posts_to_base_url(self, slack_server):
+        transport = SlackTransport(base_url=slack_server.url)
+
+        assert transport.post('api.test', {'foo': 'bar'}).json() == {'ok': True}
+        assert slack_server.calls == [('api.test', {'foo': 'bar'})]
+
+    def test_connections_are_kept_alive(self, slack_server):
+        transport = SlackTransport(base_url=slack_server.url)
+
+        for _ in range(5):
+            transport.post('api.test')
+
+        assert len(slack_server.calls) == 5
+        assert slack_server.connections == 1
+
+    def test_slack_notifications_use_container_transport(self, slack_server):
+        app = App()
+        app.bind('View', View(app).render)
+        app.bind('SlackTransport', SlackTransport(base_url=slack_server.url))
+
+        Notify(app).slack(SlackNotification, SlackNotification)
+
+        assert [method for method, _ in slack_server.calls] == ['chat.postMessage'] * 2
+        assert slack_server.calls[0][1]['channel'] == 'C1'
+        assert slack_server.connections == 1
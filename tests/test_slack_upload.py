@@ -0,0 +1,76 @@
+import json
+import mmap
+import os
+
+from masonite.app import App
+from notifications import Notifiable, Notify
+from notifications.transports import MultipartStream, SlackFile, SlackScheduler, SlackTransport
+
+
+class BuildLogNotification(Notifiable):
+
+    def slack(self):
+        self.token('token').channel(self._to).text('Build failed').attach(self._log)
+
+
+class TestSlackFile:
+
+    def write(self, tmpdir, size):
+        path = os.path.join(str(tmpdir), 'build.log')
+        with open(path, 'wb') as file:
+            file.write(b'x' * size)
+        return path
+
+    def test_large_files_are_memory_mapped(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(SlackFile, 'MMAP_OVER', 10)
+        file = SlackFile(self.write(tmpdir, 100))
+
+        assert isinstance(file.buffer(), mmap.mmap)
+        assert b''.join(file.chunks(size=30)) == b'x' * 100
+
+    def test_uploads_of_the_same_file_share_one_read(self, tmpdir):
+        path = self.write(tmpdir, 100)
+        first = SlackFile.open(path)
+
+        assert SlackFile.open(path) is first
+
+        with open(path, 'ab') as file:
+            file.write(b'y')
+        assert SlackFile.open(path) is not first
+
+    def test_stream_length_matches_its_body(self, tmpdir):
+        stream = MultipartStream({'channels': 'C1', 'title': None}, {'file': SlackFile(self.write(tmpdir, 1000))})
+        body = b''.join(stream)
+
+        assert len(stream) == len(body)
+        assert b'name="channels"\r\n\r\nC1\r\n' in body
+        assert b'name="title"' not in body
+        assert b'filename="build.log"' in body
+        assert b''.join(stream) == body
+
+
+class TestSlackUpload:
+
+    def setup_method(self):
+        self.app = App()
+
+    def test_attached_files_are_streamed(self, tmpdir, slack_server):
+        path = os.path.join(str(tmpdir), 'build.log')
+        with open(path, 'wb') as file:
+            file.write(os.urandom(3 * SlackFile.CHUNK_SIZE))
+        self.app.bind('SlackScheduler', SlackScheduler(SlackTransport(base_url=slack_server.url)))
+
+        Notify(self.app).slack(BuildLogNotification, to='C1', log=path)
+        Notify(self.app).slack(BuildLogNotification, to='C2', log=path)
+
+        assert [method for method, _ in slack_server.calls] == ['files.upload'] * 2
+        with open(path, 'rb') as file:
+            assert file.read() in slack_server.calls[0][1]
+        assert b'Build failed' in slack_server.calls[0][1]
+        assert b'C2' in slack_server.calls[1][1]
+
+    def test_thumbnail_is_added_to_the_message(self):
+        notification = BuildLogNotification(self.app).channel('C1').text('Deployed').thumbnail('http://example.com/a.png')
+        method, payload = notification._slack_request()
+
+        assert json.loads(payload['attachments']) == [{'fallback': 'Deployed', 'thumb_url': 'http://example.com/a.png'}]
@@ -0,0 +1,118 @@
+import json
+import time
+
+from config import notifications as config
+from masonite.app import App
+from notifications import Notifiable, Notify
+from notifications.dispatch import CircuitBreakers
+from notifications.outbox import Outbox, OutboxWorker
+from notifications.transports import SlackScheduler, SlackTransport, SlackWebhookBatcher
+
+
+class AlertNotification(Notifiable):
+
+    def slack(self):
+        self.webhook(self._hook).text(self._text)
+
+
+class ChannelAlertNotification(Notifiable):
+
+    def slack(self):
+        self.token('token').channel('#alerts').text('Disk full')
+
+
+class ButtonAlertNotification(Notifiable):
+
+    def slack(self):
+        self.webhook(self._hook).text('Deploy?').button('Deploy', 'http://example.com')
+
+
+class TestSlackWebhook:
+
+    def setup_method(self):
+        self.app = App()
+
+    def bind(self, slack_server, window):
+        self.hook = slack_server.url.replace('/api', '/services/T1/B1/hook')
+        scheduler = SlackScheduler(SlackTransport(base_url=slack_server.url), channel_burst=100)
+        self.app.bind('SlackScheduler', scheduler)
+        self.batcher = SlackWebhookBatcher(scheduler, window=window)
+        self.app.bind('SlackWebhookBatcher', self.batcher)
+
+    def test_messages_in_a_window_are_combined(self, slack_server):
+        self.bind(slack_server, window=10)
+        notify = Notify(self.app).via('slack')
+        for number in range(3):
+            notify.send(AlertNotification, hook=self.hook, text='Alert {}'.format(number))
+
+        assert self.batcher.pending() == 3
+        assert self.batcher.flush() == 1
+
+        method, body = slack_server.calls[0]
+        body = json.loads(body.decode())
+        assert method == 'hook'
+        assert len(slack_server.calls) == 1
+        assert [block['text']['text'] for block in body['blocks']] == ['Alert 0', 'Alert 1', 'Alert 2']
+        assert 'token' not in body and 'channel' not in body
+        assert notify.report.results[0].result.ok
+        assert notify.report.results[0].status == 'sent'
+
+    def test_window_closes_on_its_own(self, slack_server):
+        self.bind(slack_server, window=0.2)
+        Notify(self.app).slack(AlertNotification, hook=self.hook, text='First')
+        notify = Notify(self.app).via('slack').send(AlertNotification, hook=self.hook, text='Second')
+
+        result = notify.report.results[0]
+        deadline = time.time() + 5
+        while result.pending and time.time() < deadline:
+            time.sleep(0.01)
+        assert result.result.ok
+        assert len(slack_server.calls) == 1
+
+    def test_failed_posts_are_reported_and_open_the_breaker(self, slack_server):
+        self.bind(slack_server, window=10)
+        slack_server.responses['hook'] = (500, {}, 'internal_error')
+        breakers = CircuitBreakers(minimum=2)
+        self.app.bind('NotificationBreakers', breakers)
+
+        notify = Notify(self.app).via('slack')
+        notify.send(AlertNotification, hook=self.hook, text='First')
+        notify.send(AlertNotification, hook=self.hook, text='Second')
+        self.batcher.flush()
+
+        assert notify.report.results[0].status == 'failed'
+        assert list(breakers.states().values()) == ['open']
+
+    def test_full_windows_are_posted_at_once(self, slack_server):
+        self.bind(slack_server, window=10)
+        self.batcher.MAX_BLOCKS = 2
+        for number in range(3):
+            Notify(self.app).slack(AlertNotification, hook=self.hook, text='Alert {}'.format(number))
+
+        assert len(slack_server.calls) == 1
+        self.batcher.flush()
+        assert len(slack_server.calls) == 2
+
+    def test_messages_with_attachments_are_posted_alone(self, slack_server):
+        self.bind(slack_server, window=10)
+        Notify(self.app).slack(ButtonAlertNotification, hook=self.hook)
+
+        body = json.loads(slack_server.calls[0][1].decode())
+        assert body['attachments'][0]['actions'][0]['text'] == 'Deploy'
+        assert self.batcher.pending() == 0
+
+    def test_channels_with_a_webhook_skip_the_lookup(self, slack_server, monkeypatch):
+        self.bind(slack_server, window=0)
+        monkeypatch.setitem(config.SLACK, 'webhooks', {'#alerts': self.hook})
+
+        Notify(self.app).slack(ChannelAlertNotification)
+
+        assert [method for method, _ in slack_server.calls] == ['hook']
+
+    def test_outbox_stores_webhook_messages(self, slack_server):
+        self.bind(slack_server, window=10)
+        outbox = Outbox(':memory:')
+        Notify(self.app).outbox(outbox).slack(AlertNotification, hook=self.hook, text='Stored')
+
+        assert OutboxWorker(self.app, outbox).drain()['sent'] == 1
+        assert json.loads(slack_server.calls[0][1].decode())['text'] == 'Stored'
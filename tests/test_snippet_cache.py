@@ -0,0 +1,47 @@
+from masonite.app import App
+from masonite.view import View
+from notifications import Notifiable
+from notifications.cache import SnippetCache
+
+
+class MailNotification(Notifiable):
+    pass
+
+
+class TestSnippetCache:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('View', View(self.app).render)
+        self.cache = SnippetCache()
+        self.app.bind('MailSnippetCache', self.cache)
+
+    def test_snippets_render_like_the_view(self):
+        for name in ('line', 'panel', 'heading'):
+            rendered = self.app.make('View')('/notifications/snippets/mail/' + name, {'message': '<b>Hi</b>'})
+            assert self.cache.render(name, {'message': '<b>Hi</b>'}) == rendered.rendered_template
+
+    def test_snippets_are_compiled_once(self):
+        notification = MailNotification(self.app)
+        for _ in range(10):
+            notification.line('Hello').panel('Panel')
+        notification.template
+
+        assert self.cache.stats() == {'hits': 18, 'misses': 2, 'size': 2}
+
+    def test_cache_is_bounded(self):
+        self.cache.size = 1
+        self.cache.get('line')
+        self.cache.get('panel')
+        self.cache.get('line')
+
+        assert self.cache.misses == 3
+        assert self.cache.stats()['size'] == 1
+
+    def test_debug_mode_recompiles_changed_templates(self):
+        self.cache.debug = True
+        template = self.cache.get('line')
+        template._uptodate = lambda: False
+
+        assert self.cache.get('line') is not template
+        assert self.cache.misses == 2